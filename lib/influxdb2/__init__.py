@@ -37,28 +37,81 @@ Package Contents
 
 """
 
+import importlib
 import logging
+import sys
+import typing
 
-# Local imports
-from . import core
-from . import exceptions
-from . import obj
-from . import orgs
-from . import types
+if typing.TYPE_CHECKING:  # pragma: no cover
+    from . import core
+
+# Submodules are imported on first attribute access so ``import influxdb2``
+# does not pull in requests, ciso8601 and every API module up front.
+_SUBMODULES = frozenset(
+    (
+        "aio",
+        "buckets",
+        "bulk",
+        "cache",
+        "codec",
+        "core",
+        "delete",
+        "endpoints",
+        "exceptions",
+        "lineproto",
+        "loadtest",
+        "metrics",
+        "obj",
+        "orgs",
+        "pager",
+        "query",
+        "retry",
+        "spool",
+        "stub",
+        "types",
+        "write",
+    )
+)
 
 logging.getLogger(__name__).addHandler(logging.NullHandler())
 
 
-def connect(url: str, token: str):
+def __getattr__(name: str):
+    if name in _SUBMODULES:
+        # import_module binds the submodule as a package attribute, so
+        # this is only called once per submodule.
+        return importlib.import_module("." + name, __name__)
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | _SUBMODULES)
+
+
+if sys.version_info < (3, 7):  # pragma: no cover
+    # Module level __getattr__ needs Python 3.7 (PEP 562)
+    for _name in _SUBMODULES - {"aio", "loadtest", "stub"}:
+        importlib.import_module("." + _name, __name__)
+    del _name
+
+
+def connect(
+    url: typing.Union[str, typing.Sequence[str]], token: str, **kwargs
+) -> "core.Influx":
     """Get an InfluxDB "connection" object.
 
     Parameters:
-        url: Base URL to your InfluxDB instance.
+        url: Base URL to your InfluxDB instance, or a list of base URLs of
+            replicated servers to spread reads over.
             Example: https://localhost:8086/
         token: Valid token for your user to log in with.
             Example: abcdef1234567890
+        kwargs: Additional arguments that :class:`core.Influx` takes, such
+            as ``gzip_threshold``.
 
     Returns:
         :class:`core.Influx` instance.
     """
-    return core.Influx(url, token)
+    from . import core
+
+    return core.Influx(url, token, **kwargs)
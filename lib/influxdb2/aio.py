@@ -0,0 +1,314 @@
+# Copyright 2021 Hoplite Industries, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Asyncio API components.
+
+:class:`AsyncInflux` mirrors :class:`influxdb2.core.Influx` for use inside an
+asyncio event loop.  It requires the optional ``aiohttp`` package.
+
+.. code-block:: python
+
+    async with influxdb2.aio.connect(url, token) as db:
+        async for org in db.orgs.iterate():
+            print(org.name)
+"""
+
+import asyncio
+import logging
+import typing
+
+# 3rd party
+import aiohttp
+
+# Local imports
+from . import codec
+from . import core
+from . import exceptions
+from . import orgs
+from . import types
+
+logging.getLogger(__name__).addHandler(logging.NullHandler())
+
+
+class Response:
+    """Fully read HTTP response.
+
+    Offers the subset of the ``requests.Response`` interface used by the
+    API modules so response handling can be shared with
+    :class:`influxdb2.core.Influx`.
+
+    Parameters:
+        status_code: HTTP status code.
+        headers: Response headers.
+        content: Response body.
+        encoding: Character set of the body.
+
+    """
+
+    def __init__(
+        self,
+        status_code: int,
+        headers: typing.Mapping[str, str],
+        content: bytes,
+        encoding: typing.Optional[str] = None,
+    ):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.encoding = encoding or "utf-8"
+
+    @property
+    def text(self) -> str:
+        """Body decoded to a string."""
+        return self.content.decode(self.encoding, errors="replace")
+
+    def json(self) -> typing.Any:
+        """Body decoded from JSON."""
+        return codec.loads(self.content)
+
+
+def _query_params(params: typing.Any) -> typing.Any:
+    # aiohttp refuses None and bool values where requests drops or
+    # stringifies them.
+    if not isinstance(params, dict):
+        return params
+    retval = {}
+    for key, value in params.items():
+        if value is None:
+            continue
+        if isinstance(value, bool):
+            value = "true" if value else "false"
+        retval[key] = value
+    return retval
+
+
+class AsyncInflux:
+    """Core class for asyncio InfluxDB connections.
+
+    The underlying ``aiohttp.ClientSession`` is created on first use so the
+    object may be constructed outside of a running event loop.  Call
+    :meth:`close` or use ``async with`` to release its connections.
+
+    Parameters:
+        url: Base URL to your InfluxDB instance.
+        token: Valid token for your user to log in with.
+        org: *Optional* Default org name for writes and queries.
+        limit: Default 100. Maximum number of simultaneous connections.
+        validation: Default ``"strict"``. See
+            :class:`influxdb2.types.Validation`.
+
+    """
+
+    def __init__(
+        self,
+        url: str,
+        token: str,
+        org: typing.Optional[str] = None,
+        limit: int = 100,
+        validation: typing.Union[str, types.Validation] = "strict",
+    ):
+        self._url = url
+        self._token = token
+        self._org = org
+        self._limit = limit
+        self._validation = types.Validation(validation)
+
+        self._http = None
+        self._headers = {"authorization": "Token %s" % token}
+
+        self._modules = {
+            "orgs": None,
+        }
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    async def close(self):
+        """Close the HTTP session."""
+        if self._http is not None:
+            await self._http.close()
+            self._http = None
+
+    def api_error(self, req: Response):
+        """Throw an API exception on errors.
+
+        See :func:`influxdb2.core.api_error`.
+        """
+        core.api_error(req)
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        ignore_401: bool = False,
+        **kwargs,
+    ) -> Response:
+
+        url = "%s/%s" % (self._url.rstrip("/"), path.lstrip("/"))
+        if "params" in kwargs:
+            kwargs["params"] = _query_params(kwargs["params"])
+
+        if self._http is None:
+            self._http = aiohttp.ClientSession(
+                headers=self._headers,
+                connector=aiohttp.TCPConnector(limit=self._limit),
+            )
+
+        try:
+            async with self._http.request(method, url, **kwargs) as rsp:
+                req = Response(
+                    rsp.status, rsp.headers, await rsp.read(), rsp.charset
+                )
+
+            if req.status_code == 401 and not ignore_401:
+                raise exceptions.AuthenticationDenied()
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+            raise exceptions.NetworkError(str(err)) from None
+
+        return req
+
+    async def get(self, path, ignore_401: bool = False, params=None, **kwargs):
+        """Sends a GET request.
+
+        See :meth:`influxdb2.core.Influx.get`.  Additional arguments are
+        those the ``aiohttp`` library takes.
+
+        Returns: :class:`Response` object.
+        """
+
+        kwargs.setdefault("allow_redirects", True)
+        return await self._request(
+            "get", path, ignore_401=ignore_401, params=params, **kwargs
+        )
+
+    async def options(self, path, ignore_401: bool = False, **kwargs):
+        """Sends an OPTIONS request.
+
+        See :meth:`influxdb2.core.Influx.options`.
+
+        Returns: :class:`Response` object.
+        """
+
+        kwargs.setdefault("allow_redirects", True)
+        return await self._request(
+            "options", path, ignore_401=ignore_401, **kwargs
+        )
+
+    async def head(self, path, ignore_401: bool = False, **kwargs):
+        """Sends a HEAD request.
+
+        See :meth:`influxdb2.core.Influx.head`.
+
+        Returns: :class:`Response` object.
+        """
+
+        kwargs.setdefault("allow_redirects", False)
+        return await self._request(
+            "head", path, ignore_401=ignore_401, **kwargs
+        )
+
+    async def post(
+        self, path, ignore_401: bool = False, data=None, json=None, **kwargs
+    ):
+        """Sends a POST request.
+
+        See :meth:`influxdb2.core.Influx.post`.
+
+        Returns: :class:`Response` object.
+        """
+
+        return await self._request(
+            "post",
+            path,
+            ignore_401=ignore_401,
+            data=data,
+            json=json,
+            **kwargs,
+        )
+
+    async def put(self, path, ignore_401: bool = False, data=None, **kwargs):
+        """Sends a PUT request.
+
+        See :meth:`influxdb2.core.Influx.put`.
+
+        Returns: :class:`Response` object.
+        """
+
+        return await self._request(
+            "put", path, ignore_401=ignore_401, data=data, **kwargs
+        )
+
+    async def patch(
+        self, path, ignore_401: bool = False, data=None, json=None, **kwargs
+    ):
+        """Sends a PATCH request.
+
+        See :meth:`influxdb2.core.Influx.patch`.
+
+        Returns: :class:`Response` object.
+        """
+
+        return await self._request(
+            "patch",
+            path,
+            ignore_401=ignore_401,
+            data=data,
+            json=json,
+            **kwargs,
+        )
+
+    async def delete(self, path, ignore_401: bool = False, **kwargs):
+        """Sends a DELETE request.
+
+        See :meth:`influxdb2.core.Influx.delete`.
+
+        Returns: :class:`Response` object.
+        """
+
+        return await self._request(
+            "delete", path, ignore_401=ignore_401, **kwargs
+        )
+
+    @property
+    def validation(self) -> types.Validation:
+        """Validation level of this connection."""
+        return self._validation
+
+    @property
+    def orgs(self):
+        """Orgs query module"""
+        if not self._modules["orgs"]:
+            self._modules["orgs"] = orgs.AsyncOrganizations(self)
+
+        return self._modules["orgs"]
+
+
+def connect(url: str, token: str, **kwargs) -> AsyncInflux:
+    """Get an asyncio InfluxDB "connection" object.
+
+    Parameters:
+        url: Base URL to your InfluxDB instance.
+            Example: https://localhost:8086/
+        token: Valid token for your user to log in with.
+            Example: abcdef1234567890
+        kwargs: Additional arguments that :class:`AsyncInflux` takes.
+
+    Returns:
+        :class:`AsyncInflux` instance.
+    """
+    return AsyncInflux(url, token, **kwargs)
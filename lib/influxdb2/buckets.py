@@ -0,0 +1,471 @@
+# Copyright 2021 Hoplite Industries, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Buckets API.
+
+Query and manage the buckets data is written to in InfluxDB.
+
+Every write and query names a bucket, so :meth:`Buckets.resolve` keeps the
+IDs of the buckets it looked up in a cache for ``RESOLVE_TTL`` seconds, or
+for the ``cache_ttl`` of the connection when one was given.
+"""
+
+import copy
+import typing
+
+# Local imports
+from . import cache
+from . import codec
+from . import exceptions
+from . import obj
+from . import pager
+from . import types
+
+RESOLVE_TTL = 60.0
+"""Seconds a bucket name resolved to an ID is cached by default."""
+
+Rules = typing.Optional[typing.List[obj.bucket.RetentionRule]]
+
+
+def _rules_payload(
+    class_name: types.Source, rules: Rules, check: bool = True
+) -> list:
+    if check:
+        types.ensure_type(
+            class_name, "retention_rules", rules, (list, type(None))
+        )
+        for rule in rules or []:
+            types.ensure_type(
+                class_name, "retention_rules", rule, obj.bucket.RetentionRule
+            )
+    return [rule.to_dict() for rule in rules or []]
+
+
+def _decode_bucket(data: dict, validate: bool = True) -> obj.bucket.Bucket:
+    if not validate:
+        return obj.bucket.Bucket.from_dicts([data], validate=False)[0]
+    bucket = obj.bucket.Bucket()
+    bucket.from_dict(data)
+    return bucket
+
+
+def _decode_buckets(
+    data: typing.Any, validate: bool = True
+) -> typing.List[obj.bucket.Bucket]:
+    # The API wraps the list as {"links": {...}, "buckets": [...]}
+    if not isinstance(data, dict) or "buckets" not in data:
+        raise exceptions.InfluxError("Invalid server response")
+    return obj.bucket.Bucket.from_dicts(data["buckets"], validate)
+
+
+class Buckets:
+    """Interface to InfluxDB Buckets API.
+
+    Bucket names are only unique within an org.  Methods taking a bucket
+    name also take ``org`` or ``org_id`` and fall back to the default org of
+    the connection.
+
+    When the connection was created with a ``cache_ttl`` :meth:`get` is
+    answered from an index of the buckets returned by the server while the
+    entries are fresh.  The index keeps its own copy of each bucket, so
+    changing a returned :class:`influxdb2.obj.bucket.Bucket` never changes
+    what later calls return.  Name to ID lookups through :meth:`resolve` are
+    always cached, see the module documentation.
+
+    Parameters:
+        db (influxdb2.core.Influx): Base connection instance.
+
+    """
+
+    def __init__(self, db):
+        self._db = db
+        self._check = db.validation.params
+        self._strict = db.validation.responses
+        self._ids = cache.TTLCache(
+            db._cache_ttl or RESOLVE_TTL, db._cache_size
+        )
+        self._by_id = None
+        if db._cache_ttl:
+            self._by_id = cache.TTLCache(db._cache_ttl, db._cache_size)
+
+    def _org_key(
+        self, org: typing.Optional[str], org_id: typing.Optional[str]
+    ) -> dict:
+        if org_id:
+            return {"orgID": org_id}
+        if org or self._db._org:
+            return {"org": org or self._db._org}
+        return {}
+
+    def _remember(self, buckets: typing.Iterable[obj.bucket.Bucket]):
+        for bucket in buckets:
+            self._ids.set(("orgID", bucket.org_id, bucket.name), bucket.id)
+            if self._by_id is not None:
+                self._by_id.set(bucket.id, copy.copy(bucket))
+
+    def _forget(self, bucket_id: str):
+        # Names may be cached under the org name and the org ID
+        self._ids.discard_value(bucket_id)
+        if self._by_id is not None:
+            self._by_id.pop(bucket_id)
+
+    def clear_cache(self):
+        """Drop every cached bucket and resolved name."""
+        self._ids.clear()
+        if self._by_id is not None:
+            self._by_id.clear()
+
+    def resolve(
+        self,
+        name: str,
+        org: typing.Optional[str] = None,
+        org_id: typing.Optional[str] = None,
+    ) -> str:
+        """Get the ID of a bucket from its name.
+
+        Answered from the cache when possible.
+
+        Parameters:
+            name: Name of the bucket.
+            org (str): Optional. Name of the org owning the bucket.
+            org_id (str): Optional. ID of the org owning the bucket.
+
+        Returns:
+            Bucket ID from InfluxDB.
+
+        Raises:
+            ValueError when an incoming parameter is of the incorrect type.
+            :class:`exceptions.InfluxError` when the bucket does not exist.
+            :class:`exceptions.InfluxHTTPError` when a generic HTTP error
+                comes back.
+            :class:`exceptions.InfluxAPIError` when a known error payload
+                returns from the server.
+        """
+
+        class_name = (__name__, __class__.__name__, "resolve")
+        if self._check:
+            types.ensure_type(class_name, "name", name, str)
+            types.ensure_type(class_name, "org", org, (str, type(None)))
+            types.ensure_type(class_name, "org_id", org_id, (str, type(None)))
+
+        params = self._org_key(org, org_id)
+        key = sum(params.items(), ()) + (name,)
+        bucket_id = self._ids.get(key)
+        if bucket_id is not None:
+            return bucket_id
+
+        params.update({"name": name, "limit": 1})
+        buckets = self._list(params)
+        if not buckets:
+            raise exceptions.InfluxError("Bucket %r not found" % name)
+        self._ids.set(key, buckets[0].id)
+        return buckets[0].id
+
+    def iterate(
+        self,
+        org: typing.Optional[str] = None,
+        org_id: typing.Optional[str] = None,
+        name: typing.Optional[str] = None,
+        prefetch: int = 2,
+    ) -> typing.Iterable[obj.bucket.Bucket]:
+        """Iterate over all buckets in the database.
+
+        Pages of 100 buckets are fetched ahead of the one being consumed,
+        see :class:`influxdb2.pager.Paginator`.
+
+        Parameters:
+            org (str): Optional. Restrict output to buckets of this org
+                based on name.
+            org_id (str): Optional. Restrict output to buckets of this org
+                based on id.
+            name (str): Optional. Restrict output to the bucket with this
+                name.
+            prefetch (int): Default 2. Number of pages fetched ahead in
+                background threads.  0 fetches one page at a time.
+
+        Returns:
+            Iterable of :class:`influxdb2.obj.bucket.Bucket` objects.
+        """
+
+        class_name = (__name__, __class__.__name__, "iterate")
+        params = self._params(class_name, 100, 0, org, org_id, name, None)
+
+        def fetch(offset: int, limit: int) -> typing.List[obj.bucket.Bucket]:
+            return self._list(dict(params, offset=offset, limit=limit))
+
+        return iter(pager.Paginator(fetch, 100, prefetch))
+
+    def _params(
+        self,
+        class_name: types.Source,
+        limit: int,
+        offset: int,
+        org: typing.Optional[str],
+        org_id: typing.Optional[str],
+        name: typing.Optional[str],
+        bucket_id: typing.Optional[str],
+    ) -> dict:
+        if self._check:
+            types.ensure_type(class_name, "limit", limit, int)
+            types.ensure_type(class_name, "offset", offset, int)
+            types.ensure_type(class_name, "org", org, (str, type(None)))
+            types.ensure_type(class_name, "org_id", org_id, (str, type(None)))
+            types.ensure_type(class_name, "name", name, (str, type(None)))
+            if bucket_id is not None:
+                types.ensure_id(class_name, "bucket_id", bucket_id)
+            if limit < 1 or limit > 100:
+                raise ValueError(
+                    "Limit must be within the bounds of 1 to 100 not %d"
+                    % limit
+                )
+
+        params = {"limit": limit, "offset": offset, "name": name}
+        if bucket_id:
+            params["id"] = bucket_id
+        if org_id:
+            params["orgID"] = org_id
+        elif org:
+            params["org"] = org
+        return params
+
+    def list(
+        self,
+        limit: int = 20,
+        offset: int = 0,
+        org: typing.Optional[str] = None,
+        org_id: typing.Optional[str] = None,
+        name: typing.Optional[str] = None,
+        bucket_id: typing.Optional[str] = None,
+    ) -> typing.List[obj.bucket.Bucket]:
+        """List buckets.
+
+        Optionally you can pass in filters to restrict based on org, name or
+        id.
+
+        Parameters:
+            limit (int): Default 20.  Limit the number of responses that come
+                back from the api.  Used in conjunction with ``offset`` to
+                impliment paging.
+            offset (int): Default 0. Offset into the query set to return
+                results.  Used in conjunction with ``limit`` to impliment
+                paging.
+            org (str): Optional. Restrict output to buckets of this org
+                based on name.
+            org_id (str): Optional. Restrict output to buckets of this org
+                based on id.
+            name (str): Optional. Restrict output to the bucket with this
+                name.
+            bucket_id (str): Optional. Restrict output to the bucket with
+                this id.
+
+        Returns:
+            list of :class:`influxdb2.obj.bucket.Bucket`
+
+        Raises:
+            ValueError when an incoming parameter is of the incorrect type.
+            :class:`exceptions.InfluxHTTPError` when a generic HTTP error
+                comes back.
+            :class:`exceptions.InfluxAPIError` when a known error payload
+                returns from the server.
+        """
+
+        class_name = (__name__, __class__.__name__, "list")
+        params = self._params(
+            class_name, limit, offset, org, org_id, name, bucket_id
+        )
+        return self._list(params)
+
+    def _list(self, params: dict) -> typing.List[obj.bucket.Bucket]:
+        # Parameters were checked by the caller
+        rsp = self._db.get("/api/v2/buckets", params=params)
+        if rsp.status_code != 200:
+            self._db.api_error(rsp)
+        retval = _decode_buckets(codec.loads(rsp.content), self._strict)
+        self._remember(retval)
+        return retval
+
+    def create(
+        self,
+        name: str,
+        org_id: typing.Optional[str] = None,
+        description: typing.Optional[str] = None,
+        retention_rules: Rules = None,
+        org: typing.Optional[str] = None,
+    ) -> obj.bucket.Bucket:
+        """Create a new bucket in InfluxDB.
+
+        Parameters:
+            name: Name of the bucket.
+            org_id (str): *Optional* ID of the org owning the bucket.  When
+                not given ``org``, or the default org of the connection, is
+                resolved to an ID through
+                :meth:`influxdb2.orgs.Organizations.resolve`.
+            description (str): *Optional* A longer description of the
+                bucket.
+            retention_rules: *Optional* List of
+                :class:`influxdb2.obj.bucket.RetentionRule`.  Data is kept
+                forever when not given.
+            org (str): *Optional* Name of the org owning the bucket.
+
+        Returns:
+            :class:`obj.bucket.Bucket` object for the new bucket
+
+        Raises:
+            ValueError when an incoming parameter is of the incorrect type.
+            :class:`exceptions.InfluxHTTPError` when a generic HTTP error
+                comes back.
+            :class:`exceptions.InfluxAPIError` when a known error payload
+                returns from the server.
+        """
+
+        class_name = (__name__, __class__.__name__, "create")
+        if self._check:
+            types.ensure_type(class_name, "name", name, str)
+            types.ensure_type(
+                class_name, "description", description, (str, type(None))
+            )
+            types.ensure_type(class_name, "org", org, (str, type(None)))
+            if org_id is not None:
+                types.ensure_id(class_name, "org_id", org_id)
+        rules = _rules_payload(class_name, retention_rules, self._check)
+
+        if not org_id:
+            if not (org or self._db._org):
+                raise ValueError(
+                    "%s either 'org' or 'org_id' must be given"
+                    % types.source_name(class_name)
+                )
+            org_id = self._db.orgs.resolve(org or self._db._org)
+
+        payload = {"orgID": org_id, "name": name, "retentionRules": rules}
+        if description:
+            payload["description"] = description
+
+        rsp = self._db.post("/api/v2/buckets", json=payload)
+        if rsp.status_code != 201:
+            self._db.api_error(rsp)
+        bucket = _decode_bucket(codec.loads(rsp.content), self._strict)
+        self._remember([bucket])
+        return bucket
+
+    def get(self, bucket_id: str) -> obj.bucket.Bucket:
+        """Get a specific bucket based on it's ID.
+
+        Parameters:
+            bucket_id: Bucket ID from InfluxDB
+
+        Returns:
+            :class:`obj.bucket.Bucket` object for the desired bucket
+
+        Raises:
+            ValueError when an incoming parameter is of the incorrect type.
+            :class:`exceptions.InfluxHTTPError` when a generic HTTP error
+                comes back.
+            :class:`exceptions.InfluxAPIError` when a known error payload
+                returns from the server.
+        """
+
+        class_name = (__name__, __class__.__name__, "get")
+        if self._check:
+            types.ensure_id(class_name, "bucket_id", bucket_id)
+
+        if self._by_id is not None:
+            cached = self._by_id.get(bucket_id)
+            if cached is not None:
+                return copy.copy(cached)
+
+        rsp = self._db.get("/api/v2/buckets/%s" % bucket_id)
+        if rsp.status_code != 200:
+            self._db.api_error(rsp)
+        bucket = _decode_bucket(codec.loads(rsp.content), self._strict)
+        self._remember([bucket])
+        return bucket
+
+    def update(
+        self,
+        bucket_id: str,
+        name: typing.Optional[str] = None,
+        description: typing.Optional[str] = None,
+        retention_rules: Rules = None,
+    ) -> obj.bucket.Bucket:
+        """Update a specific bucket based on it's ID.
+
+        Only the values given are changed.
+
+        Parameters:
+            bucket_id: Bucket ID from InfluxDB
+            name (str): *Optional* New name of the bucket.
+            description (str): *Optional* New description of the bucket.
+            retention_rules: *Optional* New list of
+                :class:`influxdb2.obj.bucket.RetentionRule`.
+
+        Returns:
+            :class:`obj.bucket.Bucket` object for the updated bucket
+
+        Raises:
+            ValueError when an incoming parameter is of the incorrect type.
+            :class:`exceptions.InfluxHTTPError` when a generic HTTP error
+                comes back.
+            :class:`exceptions.InfluxAPIError` when a known error payload
+                returns from the server.
+        """
+
+        class_name = (__name__, __class__.__name__, "update")
+        if self._check:
+            types.ensure_id(class_name, "bucket_id", bucket_id)
+            types.ensure_type(class_name, "name", name, (str, type(None)))
+            types.ensure_type(
+                class_name, "description", description, (str, type(None))
+            )
+
+        payload = {}
+        if name is not None:
+            payload["name"] = name
+        if description is not None:
+            payload["description"] = description
+        if retention_rules is not None:
+            payload["retentionRules"] = _rules_payload(
+                class_name, retention_rules, self._check
+            )
+
+        self._forget(bucket_id)
+        rsp = self._db.patch("/api/v2/buckets/%s" % bucket_id, json=payload)
+        if rsp.status_code != 200:
+            self._db.api_error(rsp)
+        bucket = _decode_bucket(codec.loads(rsp.content), self._strict)
+        self._remember([bucket])
+        return bucket
+
+    def delete(self, bucket_id: str) -> None:
+        """Delete a specific bucket based on it's ID.
+
+        Parameters:
+            bucket_id: Bucket ID from InfluxDB
+
+        Raises:
+            ValueError when an incoming parameter is of the incorrect type.
+            :class:`exceptions.InfluxHTTPError` when a generic HTTP error
+                comes back.
+            :class:`exceptions.InfluxAPIError` when a known error payload
+                returns from the server.
+        """
+
+        class_name = (__name__, __class__.__name__, "delete")
+        if self._check:
+            types.ensure_id(class_name, "bucket_id", bucket_id)
+
+        self._forget(bucket_id)
+        rsp = self._db.delete("/api/v2/buckets/%s" % bucket_id)
+        if rsp.status_code != 204:
+            self._db.api_error(rsp)
@@ -0,0 +1,84 @@
+# Copyright 2021 Hoplite Industries, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Concurrent execution of many API calls.
+
+The ``*_many`` methods of the API modules run the single item method for
+every item on a thread pool.  A failing item does not stop the others: its
+exception takes the place of its result.
+
+.. code-block:: python
+
+    results = db.orgs.delete_many(org_ids)
+    failed = [
+        (org_id, result)
+        for org_id, result in zip(org_ids, results)
+        if isinstance(result, Exception)
+    ]
+"""
+
+import concurrent.futures
+import typing
+
+# Local imports
+from . import types
+
+DEFAULT_CONCURRENCY = 8
+"""Default number of calls run at the same time."""
+
+Result = typing.Union[typing.Any, Exception]
+
+
+def run(
+    func: typing.Callable,
+    items: typing.Iterable[tuple],
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> typing.List[Result]:
+    """Call ``func(*item)`` for every item on a thread pool.
+
+    Parameters:
+        func: Function to call.
+        items: Argument tuples, one per call.
+        concurrency (int): Default :data:`DEFAULT_CONCURRENCY`. Maximum
+            number of calls running at the same time.  Keep it at or below
+            the ``pool_maxsize`` of the connection so calls do not wait for
+            connections.
+
+    Returns:
+        List in the order of ``items`` holding the return value of each
+        call, or the exception it raised.
+    """
+
+    class_name = (__name__, "run")
+    types.ensure_type(class_name, "concurrency", concurrency, int)
+    if concurrency < 1:
+        raise ValueError(
+            "%s 'concurrency' must be positive" % types.source_name(class_name)
+        )
+
+    items = list(items)
+    if not items:
+        return []
+
+    def call(args: tuple) -> Result:
+        try:
+            return func(*args)
+        except Exception as err:  # pylint: disable=W0703
+            return err
+
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=min(concurrency, len(items)),
+        thread_name_prefix="influxdb2-bulk",
+    ) as pool:
+        return list(pool.map(call, items))
@@ -0,0 +1,131 @@
+# Copyright 2021 Hoplite Industries, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""In-memory caches for API lookups."""
+
+import collections
+import threading
+import time
+import typing
+
+# Local imports
+from . import types
+
+
+class TTLCache:
+    """Thread safe mapping whose entries expire.
+
+    Entries are dropped ``ttl`` seconds after they were stored.  Once
+    ``maxsize`` entries are stored the least recently used one is evicted to
+    make room for a new one.
+
+    Parameters:
+        ttl (float): Seconds an entry stays valid.
+        maxsize (int): Default 1024. Maximum number of entries.
+
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 1024):
+        class_name = "%s.%s" % (__name__, __class__.__name__)
+        types.ensure_type(class_name, "ttl", ttl, (int, float))
+        types.ensure_type(class_name, "maxsize", maxsize, int)
+        if ttl <= 0 or maxsize < 1:
+            raise ValueError(
+                "%s 'ttl' and 'maxsize' must be positive" % class_name
+            )
+
+        self._ttl = float(ttl)
+        self._maxsize = maxsize
+        self._data = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key: typing.Hashable, default: typing.Any = None):
+        """Get an unexpired entry.
+
+        Parameters:
+            key: Key of the entry.
+            default: Returned when there is no valid entry.
+
+        Returns:
+            The stored value or ``default``.
+        """
+
+        with self._lock:
+            try:
+                expires, value = self._data[key]
+            except KeyError:
+                return default
+            if expires <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: typing.Hashable, value: typing.Any):
+        """Store an entry, replacing any previous one for ``key``.
+
+        Parameters:
+            key: Key of the entry.
+            value: Value to store.
+        """
+
+        with self._lock:
+            self._data[key] = (time.monotonic() + self._ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: typing.Hashable, default: typing.Any = None):
+        """Remove an entry.
+
+        Parameters:
+            key: Key of the entry.
+            default: Returned when there is no valid entry.
+
+        Returns:
+            The removed value or ``default``.
+        """
+
+        with self._lock:
+            try:
+                expires, value = self._data.pop(key)
+            except KeyError:
+                return default
+            return value if expires > time.monotonic() else default
+
+    def discard_value(self, value: typing.Any) -> int:
+        """Remove every entry storing ``value``.
+
+        Parameters:
+            value: Value to look for.
+
+        Returns:
+            Number of entries removed.
+        """
+
+        with self._lock:
+            keys = [
+                key for key, item in self._data.items() if item[1] == value
+            ]
+            for key in keys:
+                del self._data[key]
+            return len(keys)
+
+    def clear(self):
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
@@ -0,0 +1,62 @@
+# Copyright 2021 Hoplite Industries, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""JSON decoding.
+
+Responses are decoded with ``orjson`` or ``ujson`` when one of them is
+installed, falling back to the standard library ``json`` module otherwise.
+"""
+
+import json as jsonlib
+import typing
+
+# 3rd party (optional)
+orjson = None  # pylint: disable=C0103
+ujson = None  # pylint: disable=C0103
+try:
+    import orjson
+except ImportError:
+    try:
+        import ujson
+    except ImportError:
+        pass
+
+if orjson is not None:
+    DECODER = "orjson"
+elif ujson is not None:
+    DECODER = "ujson"
+else:
+    DECODER = "json"
+"""Name of the module used by :func:`loads`."""
+
+
+def loads(data: typing.Union[str, bytes, bytearray]) -> typing.Any:
+    """Decode a JSON document.
+
+    Parameters:
+        data: JSON text.  Passing the raw ``bytes`` of a response skips a
+            decode to ``str`` with the faster decoders.
+
+    Returns:
+        The decoded object.
+
+    Raises:
+        ValueError: when the document is not valid JSON.
+    """
+
+    if orjson is not None:
+        return orjson.loads(data)
+    if ujson is not None:
+        return ujson.loads(data)
+    return jsonlib.loads(data)
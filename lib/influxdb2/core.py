@@ -20,90 +20,558 @@ import collections
 import http
 import json as jsonlib
 import logging
+import socket
+import time
 import typing
+import weakref
+import zlib
 
 # 3rd party
 import requests
+import requests.adapters
+from urllib3.connection import HTTPConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
 
 # Local imports
+from . import buckets
+from . import delete as delete_api
+from . import endpoints as endpointslib
 from . import exceptions
+from . import metrics as metricslib
 from . import orgs
+from . import query as query_api
+from . import retry as retrylib
+from . import spool as spoollib
+from . import types
+from . import write
 
 logging.getLogger(__name__).addHandler(logging.NullHandler())
 
+GZIP_CHUNK_SIZE = 64 * 1024
+"""Number of bytes of a request body compressed at a time."""
 
-class Influx:
-    """Core class for InfluxDB connections."""
+GZIP_LEVEL = 6
+"""Compression level used for gzip encoded request bodies."""
 
-    def __init__(self, url: str, token: str, org: typing.Optional[str] = None):
+GZIP_STREAM_SIZE = 16 * 1024 * 1024
+"""Bodies of at least this many bytes are compressed while being sent.
 
-        self._url = url
+Smaller bodies are compressed up front so the request carries a
+``Content-Length`` rather than using chunked transfer encoding.
+"""
+
+
+def gzip_stream(
+    body: typing.Union[bytes, bytearray, memoryview],
+    level: int = GZIP_LEVEL,
+) -> typing.Iterator[bytes]:
+    """Gzip compress a request body a chunk at a time.
+
+    Only one chunk of compressed output exists at any time, so a large body
+    is never held in memory twice.
+
+    Parameters:
+        body: Uncompressed body.
+        level: zlib compression level.
+
+    Returns:
+        Iterator of gzip compressed chunks.
+    """
+
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    view = memoryview(body)
+    for offset in range(0, len(view), GZIP_CHUNK_SIZE):
+        chunk = compressor.compress(view[offset : offset + GZIP_CHUNK_SIZE])
+        if chunk:
+            yield chunk
+    yield compressor.flush()
+
+
+def keepalive_options(idle: int) -> typing.List[tuple]:
+    """Socket options enabling TCP keep-alive probes.
+
+    Parameters:
+        idle: Seconds a connection sits idle before probes are sent.  Also
+            used as the interval between probes where the platform allows
+            setting it.
+
+    Returns:
+        List of ``(level, option, value)`` tuples for ``setsockopt``.
+    """
+
+    options = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+    if hasattr(socket, "TCP_KEEPIDLE"):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, idle))
+    elif hasattr(socket, "TCP_KEEPALIVE"):
+        # macOS names the idle time option differently
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPALIVE, idle))
+    if hasattr(socket, "TCP_KEEPINTVL"):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, idle))
+    if hasattr(socket, "TCP_KEEPCNT"):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 3))
+    return options
+
+
+POOL_TIMING = callable(getattr(HTTPConnectionPool, "_get_conn", None))
+"""Whether pool wait time can be measured with the installed urllib3.
+
+Timing hooks ``HTTPConnectionPool._get_conn``, which urllib3 1.x and 2.x
+both have but do not document.  When it is missing pool wait time is
+reported as 0.
+"""
+
+
+class _TimedPoolMixin:
+    """Connection pool recording the time spent waiting for a connection.
+
+    See :func:`influxdb2.metrics.pool_wait`.
+    """
+
+    def _get_conn(self, timeout=None):
+        started = time.perf_counter()
+        try:
+            return super()._get_conn(timeout)
+        finally:
+            metricslib.add_pool_wait(time.perf_counter() - started)
+
+
+class TimedHTTPConnectionPool(_TimedPoolMixin, HTTPConnectionPool):
+    """HTTP connection pool recording pool wait time."""
+
+
+class TimedHTTPSConnectionPool(_TimedPoolMixin, HTTPSConnectionPool):
+    """HTTPS connection pool recording pool wait time."""
+
+
+class HTTPAdapter(requests.adapters.HTTPAdapter):
+    """Transport adapter that applies extra socket options.
+
+    Parameters:
+        socket_options: Extra ``(level, option, value)`` tuples set on every
+            new connection, in addition to urllib3's defaults.
+        pool_timing: Default False. Record the time requests wait for a free
+            pooled connection, see :mod:`influxdb2.metrics`.  Ignored when
+            :data:`POOL_TIMING` is false.
+        kwargs: Additional arguments that ``requests.adapters.HTTPAdapter``
+            takes.
+
+    """
+
+    def __init__(
+        self,
+        socket_options: typing.Optional[typing.List[tuple]] = None,
+        pool_timing: bool = False,
+        **kwargs,
+    ):
+        self._socket_options = socket_options or []
+        self._pool_timing = pool_timing and POOL_TIMING
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["socket_options"] = (
+            HTTPConnection.default_socket_options + self._socket_options
+        )
+        super().init_poolmanager(*args, **kwargs)
+        if self._pool_timing:
+            self.poolmanager.pool_classes_by_scheme = {
+                "http": TimedHTTPConnectionPool,
+                "https": TimedHTTPSConnectionPool,
+            }
+
+
+def _body_size(
+    req: requests.Response, streamed: bool
+) -> typing.Tuple[int, int]:
+    """Request and response body sizes of a response, where known."""
+    sent = req.request.body if req.request is not None else None
+    if isinstance(sent, (bytes, str)):
+        sent = len(sent)
+    else:
+        sent = int(req.request.headers.get("Content-Length", 0) or 0)
+    received = req.headers.get("Content-Length")
+    if received is not None:
+        received = int(received)
+    elif not streamed:
+        # requests has already read the whole body
+        received = len(req.content or b"")
+    else:
+        # Streamed without a length, the size is not known up front
+        received = 0
+    return sent, received
+
+
+def api_error(req: requests.Response):
+    """Throw an API exception on errors.
+
+    Shared by :class:`Influx` and :class:`influxdb2.aio.AsyncInflux`.
+
+    Parameters:
+        req(requests.Response): A ``Response`` object from the ``requests``
+            library, or any object with ``status_code``, ``text`` and
+            ``json()``, showing an error.
+
+    Raises:
+        :class:`exceptions.InfluxAPIError` on an API error.
+        :class:`exceptions.InfluxHTTPError` on a regular HTTP error.
+    """
+    log = logging.getLogger("%s.api_error" % __name__)
+
+    try:
+        json = req.json()
+        code = json["code"]
+        message = json["message"]
+        op = json.get("op", "")
+        influx_err = json.get("err", "")
+    except (KeyError, TypeError, ValueError):
+        log.error("Non api error response [%d]", req.status_code)
+        try:
+            tmp = http.HTTPStatus(req.status_code)
+            msg = "%d %s" % (tmp.value, tmp.phrase)
+        except ValueError:
+            msg = "Unknown error code [%d]" % (req.status_code)
+
+        raise exceptions.InfluxHTTPError(
+            req.status_code,
+            req.text,
+            msg,
+        ) from None
+    raise exceptions.InfluxAPIError(
+        req.status_code, code, message, op, influx_err
+    )
+
+
+def _replayable(data: typing.Any) -> bool:
+    """Whether a request body can be sent more than once."""
+    return data is None or isinstance(
+        data, (bytes, bytearray, str, dict, list, tuple)
+    )
+
+
+class Influx:  # pylint: disable=R0902
+    """Core class for InfluxDB connections.
+
+    Parameters:
+        url: Base URL to your InfluxDB instance, or a list of base URLs of
+            replicated servers, see :mod:`influxdb2.endpoints`.
+        token: Valid token for your user to log in with.
+        org: *Optional* Default org name for writes and queries.
+        gzip_threshold: *Optional* Request bodies of at least this many
+            bytes are sent gzip compressed.  ``None`` disables compressing
+            request bodies.  Compressed responses are always accepted.
+            Bodies over :data:`GZIP_STREAM_SIZE` are streamed with chunked
+            transfer encoding.
+        pool_connections: Default 10. Number of per-host connection pools
+            to keep.
+        pool_maxsize: Default 10. Maximum number of connections kept open to
+            a single host.  Size this to the number of threads sharing the
+            connection.
+        pool_block: Default False. If true, threads wait for a free
+            connection once ``pool_maxsize`` are in use instead of opening
+            extra connections that are thrown away after use.
+        connect_timeout: *Optional* Seconds to wait for a connection to be
+            established.  ``None`` waits forever.
+        read_timeout: *Optional* Seconds to wait between bytes from the
+            server.  ``None`` waits forever.
+        keepalive: Default True. Reuse connections between requests.  If
+            false every request asks the server to close its connection.
+        tcp_keepalive: *Optional* Send TCP keep-alive probes after a
+            connection has been idle this many seconds, so dead peers are
+            noticed on long running queries and idle pooled connections.
+        retry: *Optional* :class:`influxdb2.retry.RetryPolicy` applied to
+            idempotent requests.  ``None`` disables retries.
+        cache_ttl: *Optional* Seconds that metadata lookups, such as orgs
+            by ID or name, are cached.  ``None`` disables caching.
+        cache_size: Default 1024. Maximum number of cached entries per
+            index.
+        validation: Default ``"strict"``. How much the API modules check
+            parameters and server responses, see
+            :class:`influxdb2.types.Validation`.
+        metrics: Default False. Record per endpoint request metrics, see
+            :meth:`stats`.  Recording takes a lock per request attempt,
+            which threads sharing the connection contend on.
+        spool: *Optional* :class:`influxdb2.spool.Spool` that write batches
+            are kept in while the server is unreachable or failing.  It is
+            replayed in the background and closed with the connection.
+        balance: Default ``"round-robin"``. How reads are spread over
+            several URLs, ``"round-robin"`` or ``"least-outstanding"``.
+        max_failures: Default 3. Failed requests in a row that mark one of
+            several URLs down.
+        probe_interval: Default 5.0. Seconds between ``/health`` probes of
+            URLs marked down.
+
+    """
+
+    def __init__(  # pylint: disable=R0913
+        self,
+        url: typing.Union[str, typing.Sequence[str]],
+        token: str,
+        org: typing.Optional[str] = None,
+        gzip_threshold: typing.Optional[int] = None,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        connect_timeout: typing.Optional[float] = None,
+        read_timeout: typing.Optional[float] = None,
+        keepalive: bool = True,
+        tcp_keepalive: typing.Optional[int] = None,
+        retry: typing.Optional[retrylib.RetryPolicy] = None,
+        cache_ttl: typing.Optional[float] = None,
+        cache_size: int = 1024,
+        validation: typing.Union[str, types.Validation] = "strict",
+        metrics: bool = False,
+        spool: typing.Optional[spoollib.Spool] = None,
+        balance: str = endpointslib.BALANCE_ROUND_ROBIN,
+        max_failures: int = 3,
+        probe_interval: float = 5.0,
+    ):
+
+        urls = [url] if isinstance(url, str) else list(url)
+        self._endpoints = endpointslib.EndpointSet(
+            urls,
+            self._probe,
+            balance=balance,
+            max_failures=max_failures,
+            probe_interval=probe_interval,
+        )
+        self._url = urls[0]
         self._token = token
         self._org = org
+        self._gzip_threshold = gzip_threshold
+        self._retry = retry
+        self._cache_ttl = cache_ttl
+        self._cache_size = cache_size
+        self._validation = types.Validation(validation)
+        self._metrics = metricslib.Metrics() if metrics else None
+        self._timeout = None
+        if connect_timeout is not None or read_timeout is not None:
+            self._timeout = (connect_timeout, read_timeout)
 
         self._http = requests.Session()
-        self._http.headers.update({"authorization": "Token %s" % token})
+        self._http.headers.update(
+            {
+                "authorization": "Token %s" % token,
+                "Accept-Encoding": "gzip",
+            }
+        )
+        if not keepalive:
+            self._http.headers["Connection"] = "close"
+
+        adapter = HTTPAdapter(
+            socket_options=(
+                keepalive_options(tcp_keepalive) if tcp_keepalive else None
+            ),
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            pool_timing=metrics,
+        )
+        self._http.mount("http://", adapter)
+        self._http.mount("https://", adapter)
 
         self._modules = {
+            "buckets": None,
+            "delete": None,
             "orgs": None,
+            "query": None,
+            "write": None,
         }
+        self._batchers = weakref.WeakSet()
+        self._spool = spool
+        self._replayer = None
+        if spool is not None:
+            self._replayer = spoollib.Replayer(self, spool).start()
+
+    def close(self):
+        """Flush and stop any write batchers and close the HTTP session."""
+        for batcher in list(self._batchers):
+            batcher.close()
+        if self._replayer is not None:
+            self._replayer.stop()
+            self._spool.close()
+        self._endpoints.close()
+        self._http.close()
+
+    def batcher(self, bucket: str, **kwargs) -> write.WriteBatcher:
+        """Create a background write batcher for a bucket.
+
+        The batcher is closed, sending anything still queued, when
+        :meth:`close` is called.
+
+        Parameters:
+            bucket: Name of the bucket to write to.
+            kwargs: Additional arguments that
+                :class:`influxdb2.write.WriteBatcher` takes.
+
+        Returns:
+            :class:`influxdb2.write.WriteBatcher` instance.
+        """
+        batcher = write.WriteBatcher(self, bucket, **kwargs)
+        self._batchers.add(batcher)
+        return batcher
 
     def api_error(self, req: requests.Response):
         """Throw an API exception on errors.
 
-        Parameters:
-            req(requests.Response): A ``Response`` object from the ``requests``
-                library showing an error.
+        See :func:`api_error`.
+        """
+        api_error(req)
+
+    def _compress(self, kwargs: dict):
+        """Gzip the body in ``kwargs`` if it is over the threshold."""
+
+        headers = kwargs.get("headers") or {}
+        if "Content-Encoding" in headers:
+            return
+
+        body = kwargs.get("data")
+        if kwargs.get("json") is not None and body is None:
+            body = jsonlib.dumps(kwargs["json"]).encode("utf-8")
+            headers = dict(headers, **{"Content-Type": "application/json"})
+        elif isinstance(body, str):
+            body = body.encode("utf-8")
+        if not isinstance(body, (bytes, bytearray, memoryview)):
+            return
+        if len(body) < self._gzip_threshold:
+            return
+
+        kwargs["json"] = None
+        if len(body) < GZIP_STREAM_SIZE:
+            kwargs["data"] = b"".join(gzip_stream(body))
+        else:
+            kwargs["data"] = gzip_stream(body)
+        kwargs["headers"] = dict(headers, **{"Content-Encoding": "gzip"})
+
+    def _release_on_close(
+        self,
+        req: requests.Response,
+        server: endpointslib.Endpoint,
+        ok: bool,
+    ):
+        """Release ``server`` once the streamed ``req`` is closed.
 
-        Raises:
-            :class:`exceptions.InfluxAPIError` on an API error.
-            :class:`exceptions.InfluxHTTPError` on a regular HTTP error.
+        Also released if the response is garbage collected unclosed.
         """
-        log.getLogger("%s.%s.api_error" % (__name__, __class__.__name__))
 
-        try:
-            json = req.json()
-            code = json["code"]
-            message = json["message"]
-            op = json.get("op", "")
-            influx_err = json.get("err", "")
-        except KeyError as err:
-            logging.error("Non api error response [%d]", req.status_code)
+        done = weakref.finalize(req, self._endpoints.release, server, ok)
+        done.atexit = False
+        close = req.close
+
+        def closing():
             try:
-                tmp = http.HTTPStatus(req.status_code)
-                msg = "%d %s" % (tmp.value, tmp.phrase)
-            except ValueError:
-                msg = "Unknown error code [%d]" % (req.status_code)
-
-            raise exceptions.InfluxHTTPError(
-                req.code,
-                req.raw,
-                msg,
-            ) from None
-        raise exceptions.InfluxAPIError(
-            req.status_code, code, message, op, influx_err
-        )
+                close()
+            finally:
+                done()
+
+        req.close = closing
 
-    def _request(
+    def _request(  # pylint: disable=R0912,R0914,R0915
         self,
         method: str,
         path: str,
         ignore_401: bool = False,
+        idempotent: typing.Optional[bool] = None,
+        read: typing.Optional[bool] = None,
         **kwargs,
     ) -> requests.Response:
 
-        url = "%s/%s" % (self._url.rstrip("/"), path.lstrip("/"))
-
-        try:
-            req = self._http.request(method, url, **kwargs)
-
-            if req.status_code == 401 and not ignore_401:
-                raise exceptions.AuthenticationDenied()
-
-        except IOError as err:
-            raise exceptions.NetworkError(str(err)) from None
-
-        return retval
+        path = path.lstrip("/")
+        kwargs.setdefault("timeout", self._timeout)
+        if read is None:
+            read = method.lower() in endpointslib.READ_METHODS
+
+        policy = self._retry
+        if idempotent is None:
+            idempotent = method.lower() in retrylib.IDEMPOTENT_METHODS
+        if not idempotent or not _replayable(kwargs.get("data")):
+            policy = None
+
+        metrics = self._metrics
+        endpoint = metricslib.endpoint_name(method, path) if metrics else ""
+
+        started = time.monotonic()
+        attempt = 0
+        delay = None
+        call_kwargs = kwargs
+        if self._gzip_threshold is not None:
+            call_kwargs = dict(kwargs)
+            self._compress(call_kwargs)
+        while True:
+            if delay is not None:
+                time.sleep(delay)
+            if attempt and not _replayable(call_kwargs.get("data")):
+                # A streamed compressed body is a generator, build a new one
+                call_kwargs = dict(kwargs)
+                self._compress(call_kwargs)
+
+            # Pick a server per attempt so retries can fail over
+            server = self._endpoints.acquire(read)
+            # None ends the request without counting it for or against the
+            # server, for errors raised on this side
+            ok = None
+            release = True
+            try:
+                url = "%s/%s" % (server.url, path)
+                metricslib.reset_pool_wait()
+                sent = time.perf_counter()
+                try:
+                    req = self._http.request(method, url, **call_kwargs)
+                except (requests.ConnectionError, requests.Timeout) as err:
+                    ok = False
+                    if metrics is not None:
+                        metrics.record(
+                            endpoint,
+                            time.perf_counter() - sent,
+                            None,
+                            waited=metricslib.pool_wait(),
+                        )
+                    if policy is not None:
+                        delay = policy.delay(attempt)
+                        if policy.allows(attempt, started, delay):
+                            if metrics is not None:
+                                metrics.retried(endpoint)
+                            attempt += 1
+                            continue
+                    raise exceptions.NetworkError(str(err)) from None
+                except IOError as err:
+                    ok = False
+                    raise exceptions.NetworkError(str(err)) from None
+
+                ok = req.status_code < 500
+                if metrics is not None:
+                    metrics.record(
+                        endpoint,
+                        time.perf_counter() - sent,
+                        req.status_code,
+                        *_body_size(req, call_kwargs.get("stream", False)),
+                        waited=metricslib.pool_wait(),
+                    )
+
+                if policy is not None and req.status_code in policy.statuses:
+                    retry_after = req.headers.get("Retry-After")
+                    delay = policy.delay(
+                        attempt, retrylib.parse_retry_after(retry_after)
+                    )
+                    if policy.allows(attempt, started, delay):
+                        if metrics is not None:
+                            metrics.retried(endpoint)
+                        req.close()
+                        attempt += 1
+                        continue
+
+                if call_kwargs.get("stream"):
+                    # The request is in flight until the body is read
+                    self._release_on_close(req, server, ok)
+                    release = False
+            finally:
+                if release:
+                    self._endpoints.release(server, ok)
+
+            break
+
+        if req.status_code == 401 and not ignore_401:
+            raise exceptions.AuthenticationDenied()
+
+        return req
 
     def get(self, path, ignore_401: bool = False, params=None, **kwargs):
         """Sends a GET request.
@@ -170,6 +638,10 @@ class Influx:
             data: (optional) Dictionary, list of tuples, bytes, or
                 file-like object to send in the body of the request.
             json: (optional) json data to send in the body of the request.
+            idempotent: (optional) If ``True`` the request may be retried
+                by the connection's retry policy.
+            read: (optional) If ``True`` the request only reads, such as a
+                query, and may go to any of the connection's servers.
             kwargs: Additional arguments that the requests library takes
 
         Returns: ``requests.Response`` object.
@@ -246,6 +718,60 @@ class Influx:
 
         return self._request("delete", path, ignore_401=ignore_401, **kwargs)
 
+    def _probe(self, url: str) -> bool:
+        """Health check of one server, used by the endpoint prober."""
+        try:
+            rsp = self._http.get(
+                "%s/health" % url,
+                timeout=self._timeout or endpointslib.PROBE_TIMEOUT,
+            )
+            return rsp.status_code == 200 and (
+                rsp.json().get("status") == "pass"
+            )
+        except (requests.RequestException, ValueError, AttributeError):
+            return False
+
+    def health(self) -> bool:
+        """Check that the server is up.
+
+        Returns:
+            ``True`` when ``/health`` answers that the server passes its
+            checks, ``False`` on any failure.  Never retried.
+        """
+        try:
+            rsp = self._request("get", "/health", idempotent=False)
+            if rsp.status_code != 200:
+                return False
+            return rsp.json().get("status") == "pass"
+        except (exceptions.InfluxError, ValueError, AttributeError):
+            return False
+
+    def stats(self) -> typing.Dict[str, dict]:
+        """Snapshot of the request metrics of this connection.
+
+        Returns:
+            Dictionary keyed by endpoint name, see :mod:`influxdb2.metrics`
+            for the contents and :func:`influxdb2.metrics.to_prometheus` to
+            export it.  Empty unless the connection was created with
+            ``metrics=True``.
+        """
+        if self._metrics is None:
+            return {}
+        return self._metrics.snapshot()
+
+    @property
+    def validation(self) -> types.Validation:
+        """Validation level of this connection."""
+        return self._validation
+
+    @property
+    def buckets(self):
+        """Buckets query module"""
+        if not self._modules["buckets"]:
+            self._modules["buckets"] = buckets.Buckets(self)
+
+        return self._modules["buckets"]
+
     @property
     def orgs(self):
         """Orgs query module"""
@@ -253,3 +779,61 @@ class Influx:
             self._modules["orgs"] = orgs.Organizations(self)
 
         return self._modules["orgs"]
+
+    @property
+    def write(self):
+        """Write API module"""
+        if not self._modules["write"]:
+            self._modules["write"] = write.Writer(self)
+
+        return self._modules["write"]
+
+    def query(
+        self,
+        flux: str,
+        org: typing.Optional[str] = None,
+        org_id: typing.Optional[str] = None,
+        columnar: bool = False,
+    ) -> typing.Iterator[typing.Any]:
+        """Run a Flux query and stream the resulting records.
+
+        Parameters:
+            flux: Flux query text.
+            org (str): Optional. Name of the org to run the query as.
+            org_id (str): Optional. ID of the org to run the query as.
+            columnar (bool): Default: False. If true yield one
+                :class:`influxdb2.query.Table` of NumPy arrays per Flux
+                table instead of one dictionary per row.
+
+        Returns:
+            Iterator of record dictionaries or tables.  See
+            :meth:`influxdb2.query.Query.stream` for details.
+        """
+        if not self._modules["query"]:
+            self._modules["query"] = query_api.Query(self)
+
+        return self._modules["query"].stream(
+            flux, org=org, org_id=org_id, columnar=columnar
+        )
+
+    def delete_data(
+        self, start, stop, predicate: str = "", **kwargs
+    ) -> delete_api.DeleteResult:
+        """Delete points in a time range matching a predicate.
+
+        Parameters:
+            start: Start of the range.
+            stop: End of the range.
+            predicate (str): Default "". Delete predicate.
+            kwargs: Additional arguments that
+                :meth:`influxdb2.delete.Deleter.delete` takes, such as
+                ``bucket``, ``window`` and ``concurrency``.
+
+        Returns:
+            :class:`influxdb2.delete.DeleteResult` listing the windows that
+            failed.
+        """
+        if not self._modules["delete"]:
+            self._modules["delete"] = delete_api.Deleter(self)
+
+        return self._modules["delete"].delete(start, stop, predicate, **kwargs)
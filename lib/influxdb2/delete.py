@@ -0,0 +1,324 @@
+# Copyright 2021 Hoplite Industries, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Delete API.
+
+Delete the points of a bucket that fall in a time range and match a
+predicate such as ``_measurement="cpu" AND host="a"``.
+
+A single delete over a long range of high cardinality data can run longer
+than the server allows.  :meth:`Deleter.delete` splits the range into
+windows which are sent in parallel, so the whole range finishes sooner and a
+failure only affects one window.  Windows that failed are returned so they
+can be retried on their own.
+
+.. code-block:: python
+
+    result = db.delete_data(
+        "2021-01-01T00:00:00Z",
+        "2021-07-01T00:00:00Z",
+        '_measurement="cpu"',
+        bucket="metrics",
+        window=datetime.timedelta(days=1),
+    )
+    for window in result.failed:
+        print(window.start, window.stop, window.error)
+"""
+
+import concurrent.futures
+import datetime
+import typing
+
+# Local imports
+from . import lineproto
+from . import types
+
+TimeArg = typing.Union[int, float, str, datetime.datetime]
+Window = typing.Union[int, float, datetime.timedelta, None]
+
+NANOSECONDS = 1000000000
+
+
+def to_nanoseconds(value: TimeArg) -> int:
+    """Convert a time to nanoseconds since Jan 1, 1970 00:00:00 GMT.
+
+    Parameters:
+        value: An ``int`` is taken to already be in nanoseconds.  A ``float``
+            is seconds.  A ``str`` is an RFC3339 timestamp.  A naive
+            ``datetime`` is taken to be UTC.
+
+    Raises:
+        ValueError: when an invalid value is encountered.
+    """
+    return int(lineproto.format_time(value, "ns"))
+
+
+def format_rfc3339(nanoseconds: int) -> str:
+    """Format nanoseconds since the epoch as an RFC3339 timestamp."""
+    seconds, fraction = divmod(nanoseconds, NANOSECONDS)
+    when = lineproto.EPOCH + datetime.timedelta(seconds=seconds)
+    return "%s.%09dZ" % (when.strftime("%Y-%m-%dT%H:%M:%S"), fraction)
+
+
+def windows(
+    start: int, stop: int, window: typing.Optional[int]
+) -> typing.Iterator[typing.Tuple[int, int]]:
+    """Split a time range into windows.
+
+    Parameters:
+        start: Start of the range in nanoseconds.
+        stop: End of the range in nanoseconds.
+        window: Length of each window in nanoseconds.  ``None`` yields the
+            whole range.
+
+    Yields:
+        ``(start, stop)`` of each window.  Adjacent windows share their
+        boundary, deleting a point on it twice is harmless.
+    """
+
+    if not window or start == stop:
+        yield start, stop
+        return
+    while start < stop:
+        end = min(start + window, stop)
+        yield start, end
+        start = end
+
+
+class FailedWindow:
+    """A window of a delete that did not complete.
+
+    Parameters:
+        start (str): RFC3339 start of the window.
+        stop (str): RFC3339 end of the window.
+        error (Exception): Exception the request raised.
+
+    """
+
+    __slots__ = ("start", "stop", "error")
+
+    def __init__(self, start: str, stop: str, error: Exception):
+        self.start = start
+        self.stop = stop
+        self.error = error
+
+    def __repr__(self):
+        return "%s(%r, %r, %r)" % (
+            __class__.__name__,
+            self.start,
+            self.stop,
+            self.error,
+        )
+
+
+class DeleteResult:
+    """Outcome of a windowed delete.
+
+    Parameters:
+        windows (int): Number of windows the range was split into.
+        failed: List of :class:`FailedWindow` ordered by start time.
+
+    """
+
+    __slots__ = ("windows", "failed")
+
+    def __init__(self, windows: int, failed: typing.List[FailedWindow]):
+        self.windows = windows
+        self.failed = failed
+
+    @property
+    def ok(self) -> bool:
+        """Whether every window was deleted."""
+        return not self.failed
+
+    def __repr__(self):
+        return "%s(windows=%d, failed=%d)" % (
+            __class__.__name__,
+            self.windows,
+            len(self.failed),
+        )
+
+
+class Deleter:
+    """Interface to the InfluxDB delete API.
+
+    Parameters:
+        db (influxdb2.core.Influx): Base connection instance.
+
+    """
+
+    def __init__(self, db):
+        self._db = db
+
+    def _params(
+        self,
+        class_name: types.Source,
+        bucket: typing.Optional[str],
+        bucket_id: typing.Optional[str],
+        org: typing.Optional[str],
+        org_id: typing.Optional[str],
+    ) -> dict:
+        if self._db.validation.params:
+            types.ensure_type(class_name, "bucket", bucket, (str, type(None)))
+            types.ensure_type(class_name, "org", org, (str, type(None)))
+            if bucket_id is not None:
+                types.ensure_id(class_name, "bucket_id", bucket_id)
+            if org_id is not None:
+                types.ensure_id(class_name, "org_id", org_id)
+
+        params = {}
+        if bucket_id:
+            params["bucketID"] = bucket_id
+        elif bucket:
+            params["bucket"] = bucket
+        else:
+            raise ValueError(
+                "%s either 'bucket' or 'bucket_id' must be given"
+                % types.source_name(class_name)
+            )
+        if org_id:
+            params["orgID"] = org_id
+        elif org or self._db._org:
+            params["org"] = org or self._db._org
+        elif not bucket_id:
+            raise ValueError(
+                "%s either 'org' or 'org_id' must be given"
+                % types.source_name(class_name)
+            )
+        return params
+
+    def send(self, params: dict, start: str, stop: str, predicate: str):
+        """Send a single delete request.
+
+        Parameters:
+            params: Query string parameters for ``/api/v2/delete``.
+            start: RFC3339 start of the range.
+            stop: RFC3339 end of the range.
+            predicate: Delete predicate, may be empty.
+
+        Raises:
+            :class:`exceptions.InfluxHTTPError` when a generic HTTP error
+                comes back.
+            :class:`exceptions.InfluxAPIError` when a known error payload
+                returns from the server.
+        """
+
+        payload = {"start": start, "stop": stop}
+        if predicate:
+            payload["predicate"] = predicate
+
+        # Deleting the same range twice leaves the same data behind
+        rsp = self._db.post(
+            "/api/v2/delete", params=params, json=payload, idempotent=True
+        )
+        if rsp.status_code != 204:
+            self._db.api_error(rsp)
+
+    def delete(  # pylint: disable=R0913,R0914
+        self,
+        start: TimeArg,
+        stop: TimeArg,
+        predicate: str = "",
+        bucket: typing.Optional[str] = None,
+        bucket_id: typing.Optional[str] = None,
+        org: typing.Optional[str] = None,
+        org_id: typing.Optional[str] = None,
+        window: Window = None,
+        concurrency: int = 4,
+        progress: typing.Optional[typing.Callable[[int, int], None]] = None,
+    ) -> DeleteResult:
+        """Delete points in a time range matching a predicate.
+
+        Parameters:
+            start: Start of the range, see :func:`to_nanoseconds`.
+            stop: End of the range, see :func:`to_nanoseconds`.
+            predicate (str): Default "". Delete predicate.  An empty
+                predicate deletes every point in the range.
+            bucket (str): Optional. Name of the bucket to delete from.
+            bucket_id (str): Optional. ID of the bucket to delete from.
+            org (str): Optional. Name of the org owning the bucket.
+                Defaults to the org of the connection.
+            org_id (str): Optional. ID of the org owning the bucket.
+            window: Optional. Length of each window as a
+                ``datetime.timedelta`` or seconds.  ``None`` sends the whole
+                range in one request.
+            concurrency (int): Default 4. Maximum number of windows deleted
+                at the same time.
+            progress: Optional. Called as ``progress(done, total)`` from the
+                calling thread each time a window finishes, successfully or
+                not.
+
+        Returns:
+            :class:`DeleteResult` listing the windows that failed.  Failures
+            of any kind do not stop the remaining windows.
+
+        Raises:
+            ValueError when an incoming parameter is of the incorrect type.
+        """
+
+        class_name = (__name__, __class__.__name__, "delete")
+        params = self._params(class_name, bucket, bucket_id, org, org_id)
+        if self._db.validation.params:
+            types.ensure_type(class_name, "predicate", predicate, str)
+            types.ensure_type(class_name, "concurrency", concurrency, int)
+            types.ensure_type(
+                class_name,
+                "window",
+                window,
+                (int, float, datetime.timedelta, type(None)),
+            )
+
+        start_ns = to_nanoseconds(start)
+        stop_ns = to_nanoseconds(stop)
+        if isinstance(window, datetime.timedelta):
+            window = window.total_seconds()
+        if stop_ns < start_ns or concurrency < 1 or (window or 0) < 0:
+            raise ValueError(
+                "%s 'stop' must not be before 'start' and 'concurrency' and "
+                "'window' must be positive" % types.source_name(class_name)
+            )
+
+        spans = [
+            (format_rfc3339(lower), format_rfc3339(upper))
+            for lower, upper in windows(
+                start_ns,
+                stop_ns,
+                int(window * NANOSECONDS) if window else None,
+            )
+        ]
+
+        failed = []
+        done = 0
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(concurrency, len(spans)),
+            thread_name_prefix="influxdb2-delete",
+        ) as pool:
+            futures = {
+                pool.submit(self.send, params, lower, upper, predicate): (
+                    lower,
+                    upper,
+                )
+                for lower, upper in spans
+            }
+            for future in concurrent.futures.as_completed(futures):
+                try:
+                    future.result()
+                except Exception as err:  # pylint: disable=W0703
+                    failed.append(FailedWindow(*futures[future], err))
+                done += 1
+                if progress is not None:
+                    progress(done, len(spans))
+
+        failed.sort(key=lambda item: item.start)
+        return DeleteResult(len(spans), failed)
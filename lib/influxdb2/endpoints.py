@@ -0,0 +1,237 @@
+# Copyright 2021 Hoplite Industries, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Client side balancing over several InfluxDB servers.
+
+A connection made with a list of URLs sends each read, such as ``GET``
+requests and Flux queries, to one of the healthy servers chosen either
+round-robin or by fewest requests in flight.  Other requests go to the
+first healthy server in the order given, so writes land on one node and
+only fail over when it is down.
+
+A server is marked down after ``max_failures`` requests in a row fail with
+a network error or a 5xx status.  A background thread probes ``/health``
+on down servers every ``probe_interval`` seconds and puts them back once
+the probe passes.  When every server is down requests are still sent to
+all of them, so callers see the real error rather than an empty pool.
+
+.. code-block:: python
+
+    db = influxdb2.connect(
+        ["http://influx-1:8086", "http://influx-2:8086"],
+        token,
+        balance="least-outstanding",
+    )
+"""
+
+import itertools
+import logging
+import threading
+import typing
+
+# Local imports
+from . import types
+
+logging.getLogger(__name__).addHandler(logging.NullHandler())
+
+BALANCE_ROUND_ROBIN = "round-robin"
+"""Balance policy: take turns between healthy servers."""
+
+BALANCE_LEAST_OUTSTANDING = "least-outstanding"
+"""Balance policy: pick the healthy server with fewest requests in flight."""
+
+BALANCE_POLICIES = (BALANCE_ROUND_ROBIN, BALANCE_LEAST_OUTSTANDING)
+
+READ_METHODS = frozenset(["get", "head", "options"])
+"""HTTP methods treated as reads unless a request says otherwise."""
+
+PROBE_TIMEOUT = 5.0
+"""Seconds a health probe waits when the connection has no timeout."""
+
+
+class Endpoint:
+    """State of one server.
+
+    Parameters:
+        url (str): Base URL of the server.
+
+    """
+
+    __slots__ = ("url", "outstanding", "failures", "down")
+
+    def __init__(self, url: str):
+        self.url = url.rstrip("/")
+        self.outstanding = 0
+        self.failures = 0
+        self.down = False
+
+    def __repr__(self):
+        return "%s(%r)" % (__class__.__name__, self.url)
+
+
+class EndpointSet:
+    """Pick servers for requests and track their health.
+
+    Parameters:
+        urls: Base URLs of the servers.
+        probe (callable): Called as ``probe(url)`` from the background
+            thread and returns ``True`` when the server is healthy.
+        balance (str): Default "round-robin". How reads are spread, one of
+            "round-robin" or "least-outstanding".
+        max_failures (int): Default 3. Failures in a row that mark a server
+            down.
+        probe_interval (float): Default 5.0. Seconds between health probes
+            of down servers.
+
+    """
+
+    def __init__(  # pylint: disable=R0913
+        self,
+        urls: typing.Sequence[str],
+        probe: typing.Callable[[str], bool],
+        balance: str = BALANCE_ROUND_ROBIN,
+        max_failures: int = 3,
+        probe_interval: float = 5.0,
+    ):
+        class_name = (__name__, __class__.__name__)
+        types.ensure_type(class_name, "max_failures", max_failures, int)
+        types.ensure_type(
+            class_name, "probe_interval", probe_interval, (int, float)
+        )
+        if balance not in BALANCE_POLICIES:
+            raise ValueError(
+                "%s 'balance' must be one of %s not: %r"
+                % (types.source_name(class_name), BALANCE_POLICIES, balance)
+            )
+        if not urls:
+            raise ValueError(
+                "%s at least one URL is required"
+                % types.source_name(class_name)
+            )
+        for url in urls:
+            types.ensure_type(class_name, "url", url, str)
+        if max_failures < 1 or probe_interval <= 0:
+            raise ValueError(
+                "%s 'max_failures' and 'probe_interval' must be positive"
+                % types.source_name(class_name)
+            )
+
+        self._endpoints = [Endpoint(url) for url in urls]
+        self._probe = probe
+        self._least = balance == BALANCE_LEAST_OUTSTANDING
+        self._max_failures = max_failures
+        self._probe_interval = float(probe_interval)
+        self._turn = itertools.count()
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._prober = None
+
+    @property
+    def endpoints(self) -> typing.List[Endpoint]:
+        """Every server, in the order given."""
+        return list(self._endpoints)
+
+    @property
+    def healthy(self) -> typing.List[Endpoint]:
+        """Servers not marked down."""
+        return [ep for ep in self._endpoints if not ep.down]
+
+    def acquire(self, read: bool) -> Endpoint:
+        """Pick a server for a request.
+
+        Every call must be paired with :meth:`release`.
+
+        Parameters:
+            read: ``True`` to spread the request over the healthy servers,
+                ``False`` to use the first healthy one.
+
+        Returns:
+            The chosen :class:`Endpoint`.
+        """
+
+        with self._lock:
+            candidates = [ep for ep in self._endpoints if not ep.down]
+            if not candidates:
+                candidates = self._endpoints
+            if not read or len(candidates) == 1:
+                endpoint = candidates[0]
+            elif self._least:
+                endpoint = min(candidates, key=lambda ep: ep.outstanding)
+            else:
+                endpoint = candidates[next(self._turn) % len(candidates)]
+            endpoint.outstanding += 1
+            return endpoint
+
+    def release(self, endpoint: Endpoint, ok: typing.Optional[bool]):
+        """Finish a request picked with :meth:`acquire`.
+
+        Parameters:
+            endpoint: Server the request went to.
+            ok: ``False`` if the request failed with a network error or a
+                5xx status.  ``None`` if it failed for a reason that says
+                nothing about the server.
+        """
+
+        with self._lock:
+            endpoint.outstanding -= 1
+            if ok is None:
+                return
+            if ok:
+                endpoint.failures = 0
+                return
+            endpoint.failures += 1
+            if (
+                endpoint.down
+                or endpoint.failures < self._max_failures
+                or len(self._endpoints) == 1
+            ):
+                return
+            endpoint.down = True
+            logging.getLogger(
+                "%s.%s.release" % (__name__, __class__.__name__)
+            ).warning(
+                "Marking %s down after %d failures",
+                endpoint.url,
+                endpoint.failures,
+            )
+            if self._prober is None or not self._prober.is_alive():
+                self._prober = threading.Thread(
+                    target=self._run,
+                    name="influxdb2-endpoint-probe",
+                    daemon=True,
+                )
+                self._prober.start()
+
+    def close(self):
+        """Stop the background health probes."""
+        self._stopped.set()
+        if self._prober is not None and self._prober.is_alive():
+            self._prober.join()
+
+    def _run(self):
+        log = logging.getLogger("%s.%s._run" % (__name__, __class__.__name__))
+        while not self._stopped.wait(self._probe_interval):
+            with self._lock:
+                down = [ep for ep in self._endpoints if ep.down]
+            for endpoint in down:
+                if not self._probe(endpoint.url):
+                    continue
+                log.info("Re-admitting %s", endpoint.url)
+                with self._lock:
+                    endpoint.down = False
+                    endpoint.failures = 0
+            with self._lock:
+                if not any(ep.down for ep in self._endpoints):
+                    self._prober = None
+                    return
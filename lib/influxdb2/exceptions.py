@@ -45,7 +45,7 @@ class InfluxHTTPError(InfluxError):
 
     def __init__(self, status: int, data: any, message: str):
         super().__init__(message)
-        self._code = code
+        self._status = status
         self._data = data
 
     @property
@@ -98,17 +98,17 @@ class InfluxAPIError(InfluxError):
     @property
     def code(self) -> str:
         """InfluxDB description of the error code"""
-        return int(self._code)
+        return str(self._code)
 
     @property
     def op(self) -> str:
         """Describes the logical code operation during error."""
-        return int(self._op)
+        return str(self._op)
 
     @property
     def err(self) -> str:
         """Stack of errors that occurred during processing of the request."""
-        return self._data
+        return self._err
 
     def __repr__(self):
         return "%s(%s,%s,%s,%s,%s)" % (
@@ -128,3 +128,33 @@ class AuthenticationDenied(InfluxHTTPError):
         super().__init__(
             401, {"error": "Authentication Denied"}, "Authentication Denied"
         )
+
+
+class QueueFull(InfluxError):
+    """Raised when a bounded write queue has no room for more points."""
+
+
+class QueryError(InfluxError):
+    """Raised when a Flux query reports an error in its result stream.
+
+    Parameters:
+        message: Error message from InfluxDB.
+        reference: Reference code InfluxDB attached to the error.
+
+    """
+
+    def __init__(self, message: str, reference: str = ""):
+        super().__init__(message)
+        self._reference = reference
+
+    @property
+    def reference(self) -> str:
+        """Reference code InfluxDB attached to the error."""
+        return self._reference
+
+    def __repr__(self):
+        return "%s(%s,%s)" % (
+            self.__class__.__name__,
+            repr(self.message),
+            repr(self.reference),
+        )
@@ -0,0 +1,432 @@
+# Copyright 2021 Hoplite Industries, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Line protocol encoding.
+
+Helpers to turn measurements, tags, fields and timestamps into the InfluxDB
+line protocol format accepted by ``/api/v2/write``.
+
+A point handed to :func:`encode` may be one of:
+
+* A dictionary with ``measurement``, ``tags`` (optional), ``fields`` and
+  ``time`` (optional) keys.
+* A ``str`` or ``bytes`` object that is already a line of line protocol.
+* An object with a ``to_line(precision)`` method returning the encoded
+  line, such as :class:`influxdb2.obj.point.Point`.
+
+Large frames of columnar data are encoded with :func:`encode_frame`, which
+formats whole NumPy columns at once instead of one point at a time.  This
+requires the optional ``numpy`` package.
+"""
+
+import datetime
+import math
+import typing
+
+# Local imports
+from . import types
+
+PRECISIONS = {
+    "s": 1000000000,
+    "ms": 1000000,
+    "us": 1000,
+    "ns": 1,
+}
+"""Valid write precisions mapped to the number of nanoseconds per unit."""
+
+EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+
+_MEASUREMENT_ESCAPE = str.maketrans(
+    {",": "\\,", " ": "\\ ", "\n": "\\n", "\\": "\\\\"}
+)
+_KEY_ESCAPE = str.maketrans(
+    {",": "\\,", "=": "\\=", " ": "\\ ", "\n": "\\n", "\\": "\\\\"}
+)
+_STRING_ESCAPE = str.maketrans({'"': '\\"', "\\": "\\\\"})
+
+
+def escape_measurement(value: str) -> str:
+    """Escape a measurement name for line protocol."""
+    return value.translate(_MEASUREMENT_ESCAPE)
+
+
+def escape_key(value: str) -> str:
+    """Escape a tag key, tag value or field key for line protocol."""
+    return value.translate(_KEY_ESCAPE)
+
+
+def format_field(value: typing.Any) -> str:
+    """Format a single field value for line protocol.
+
+    Parameters:
+        value: ``bool``, ``int``, ``float`` or ``str`` field value.
+
+    Returns:
+        The encoded field value including any type suffix or quoting.
+
+    Raises:
+        ValueError: when the value can not be represented.
+    """
+
+    # bool must come before int as bool is a subclass of int
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, int):
+        return "%di" % value
+    if isinstance(value, float):
+        if math.isnan(value) or math.isinf(value):
+            raise ValueError(
+                "Field value %r is not supported by line protocol" % value
+            )
+        return repr(value)
+    if isinstance(value, str):
+        return '"%s"' % value.translate(_STRING_ESCAPE)
+
+    raise ValueError("Invalid type for a field value: %s" % type(value))
+
+
+def format_time(
+    value: typing.Union[types.TimeVal, datetime.datetime, None],
+    precision: str = "ns",
+) -> str:
+    """Format a timestamp for line protocol.
+
+    Parameters:
+        value: The timestamp.  An ``int`` is taken to already be in units of
+            ``precision``.  A ``float`` is seconds since Jan 1, 1970 00:00:00
+            GMT.  A ``str`` is an iso8601 timestamp.  ``None`` leaves the
+            timestamp off so the server assigns one.
+        precision: One of the keys in :data:`PRECISIONS`.
+
+    Returns:
+        Timestamp as a string in units of ``precision``.
+
+    Raises:
+        ValueError: when an invalid value is encountered.
+    """
+
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        raise ValueError("Invalid type for a timestamp: %s" % type(value))
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, float):
+        return str(int(round(value * 1000000000 / PRECISIONS[precision])))
+    if isinstance(value, str):
+        import ciso8601  # pylint: disable=C0415
+
+        value = ciso8601.parse_datetime(value)
+    if isinstance(value, datetime.datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=datetime.timezone.utc)
+        micros = (value - EPOCH) // datetime.timedelta(microseconds=1)
+        return str(micros * 1000 // PRECISIONS[precision])
+
+    raise ValueError("Invalid type for a timestamp: %s" % type(value))
+
+
+def encode_point(
+    measurement: str,
+    fields: typing.Mapping[str, typing.Any],
+    tags: typing.Optional[typing.Mapping[str, str]] = None,
+    time: typing.Union[types.TimeVal, datetime.datetime, None] = None,
+    precision: str = "ns",
+) -> str:
+    """Encode a single point as a line of line protocol.
+
+    Tags are sorted by key as recommended by InfluxDB.  Tags with an empty
+    value and fields with a value of ``None`` are left out.
+
+    Parameters:
+        measurement: Measurement name.
+        fields: Field names mapped to their values.
+        tags: *Optional* Tag names mapped to their values.
+        time: *Optional* Timestamp, see :func:`format_time`.
+        precision: One of the keys in :data:`PRECISIONS`.
+
+    Returns:
+        The encoded line without a trailing newline.
+
+    Raises:
+        ValueError: when the point can not be encoded.
+    """
+
+    if not isinstance(measurement, str) or not measurement:
+        raise ValueError("Measurement must be a non-empty string.")
+
+    parts = [escape_measurement(measurement)]
+    if tags:
+        for key in sorted(tags):
+            value = tags[key]
+            if value is None or value == "":
+                continue
+            parts.append(
+                "%s=%s" % (escape_key(str(key)), escape_key(str(value)))
+            )
+
+    field_set = []
+    for key, value in fields.items():
+        if value is None:
+            continue
+        field_set.append("%s=%s" % (escape_key(str(key)), format_field(value)))
+    if not field_set:
+        raise ValueError(
+            "Point for measurement %r has no fields." % measurement
+        )
+
+    line = "%s %s" % (",".join(parts), ",".join(field_set))
+    timestamp = format_time(time, precision)
+    if timestamp:
+        line = "%s %s" % (line, timestamp)
+    return line
+
+
+def encode(point: typing.Any, precision: str = "ns") -> bytes:
+    """Encode a point in any of the supported forms to line protocol.
+
+    Parameters:
+        point: A point dictionary, ``str`` or ``bytes`` line, or a
+            :class:`influxdb2.obj.point.Point`.  See the module
+            documentation for details.
+        precision: One of the keys in :data:`PRECISIONS`.
+
+    Returns:
+        UTF-8 encoded line without a trailing newline.
+
+    Raises:
+        ValueError: when the point can not be encoded.
+    """
+
+    if isinstance(point, bytes):
+        return point.rstrip(b"\n")
+    if isinstance(point, str):
+        return point.rstrip("\n").encode("utf-8")
+    if isinstance(point, dict):
+        try:
+            return encode_point(
+                point["measurement"],
+                point["fields"],
+                point.get("tags"),
+                point.get("time"),
+                precision,
+            ).encode("utf-8")
+        except KeyError as err:
+            raise ValueError(
+                "Point dictionary is missing key [%s]" % err
+            ) from None
+    to_line = getattr(point, "to_line", None)
+    if to_line is not None:
+        return to_line(precision)
+
+    raise ValueError("Invalid type for a point: %s" % type(point))
+
+
+def _numpy():
+    try:
+        import numpy  # pylint: disable=C0415
+    except ImportError:
+        raise ImportError(
+            "Encoding frames requires the 'numpy' package"
+        ) from None
+    return numpy
+
+
+def _missing(numpy, values):
+    # None entries of an object column
+    if values.dtype.kind != "O":
+        return numpy.zeros(len(values), dtype=bool)
+    return numpy.equal(values, None)
+
+
+def _tag_column(numpy, key: str, values):
+    """Encode a tag column as ``,key=value`` pieces.
+
+    Each distinct value is escaped once and the pieces are picked out by
+    index, so low cardinality columns cost one lookup per row.
+    """
+
+    missing = _missing(numpy, values)
+    values = values.astype(str)
+    values[missing] = ""
+    uniques, inverse = numpy.unique(values, return_inverse=True)
+    prefix = ",%s=" % escape_key(key)
+    pieces = numpy.array(
+        [prefix + escape_key(value) if value else "" for value in uniques],
+        dtype=str,
+    )
+    return pieces[inverse.reshape(-1)]
+
+
+def _field_column(numpy, key: str, values):
+    """Encode a field column as ``,key=value`` pieces."""
+
+    prefix = ",%s=" % escape_key(key)
+    kind = values.dtype.kind
+    if kind == "b":
+        encoded = numpy.where(values, prefix + "true", prefix + "false")
+    elif kind in "iu":
+        encoded = numpy.char.add(
+            numpy.char.add(prefix, values.astype(str)), "i"
+        )
+    elif kind == "f":
+        if not numpy.isfinite(values).all():
+            raise ValueError(
+                "Field %r has values not supported by line protocol" % key
+            )
+        # repr() of Python floats is faster than NumPy's own formatting
+        encoded = numpy.char.add(
+            prefix,
+            numpy.array(list(map(repr, values.tolist())), dtype=str),
+        )
+    elif kind in "US":
+        if kind == "S":
+            values = numpy.char.decode(values, "utf-8")
+        escaped = numpy.char.replace(
+            numpy.char.replace(values, "\\", "\\\\"), '"', '\\"'
+        )
+        encoded = numpy.char.add(numpy.char.add(prefix + '"', escaped), '"')
+    elif kind == "O":
+        encoded = numpy.array(
+            [
+                "" if value is None else prefix + format_field(value)
+                for value in values.tolist()
+            ],
+            dtype=str,
+        )
+    else:
+        raise ValueError("Invalid type for field %r: %s" % (key, values.dtype))
+    return encoded
+
+
+def frame_rows(
+    measurement: str,
+    fields: typing.Mapping[str, typing.Any],
+    tags: typing.Optional[typing.Mapping[str, typing.Any]] = None,
+    time: typing.Any = None,
+) -> int:
+    """Check the shape of a frame for :func:`encode_frame`.
+
+    Parameters:
+        measurement: Measurement name shared by every row.
+        fields: Field names mapped to columns.
+        tags: *Optional* Tag names mapped to columns.
+        time: *Optional* Timestamp column.
+
+    Returns:
+        Number of rows in the frame.
+
+    Raises:
+        ValueError: when the measurement is empty, there are no fields or
+            the columns differ in length.
+    """
+
+    if not isinstance(measurement, str) or not measurement:
+        raise ValueError("Measurement must be a non-empty string.")
+    if not fields:
+        raise ValueError(
+            "Frame for measurement %r has no fields." % measurement
+        )
+    lengths = {len(column) for column in fields.values()}
+    lengths.update(len(column) for column in (tags or {}).values())
+    if time is not None:
+        lengths.add(len(time))
+    if len(lengths) != 1:
+        raise ValueError("Columns must all have the same length.")
+    return lengths.pop()
+
+
+def encode_frame(  # pylint: disable=R0913,R0914
+    measurement: str,
+    fields: typing.Mapping[str, typing.Any],
+    tags: typing.Optional[typing.Mapping[str, typing.Any]] = None,
+    time: typing.Any = None,
+    precision: str = "ns",
+) -> typing.List[bytes]:
+    """Encode columns of points as line protocol.
+
+    Every column is formatted with NumPy array operations, so the cost per
+    row is far lower than encoding points one by one with :func:`encode`.
+    Tags are sorted by key, tags with an empty value and ``None`` values of
+    object columns are left out, the same as :func:`encode_point`.
+
+    Parameters:
+        measurement: Measurement name shared by every row.
+        fields: Field names mapped to columns.  A column is a NumPy array or
+            any sequence ``numpy.asarray`` accepts.  Boolean, integer,
+            float and string columns are formatted as whole arrays, object
+            columns one value at a time.
+        tags: *Optional* Tag names mapped to columns.
+        time: *Optional* ``int64`` column of nanoseconds since Jan 1, 1970
+            00:00:00 GMT, or a ``datetime64`` column.  Timestamps are
+            converted to ``precision``.  ``None`` lets the server assign
+            timestamps.
+        precision: One of the keys in :data:`PRECISIONS`.
+
+    Returns:
+        UTF-8 encoded lines without trailing newlines, ready for
+        :func:`influxdb2.write.batches`.
+
+    Raises:
+        ValueError: when the columns can not be encoded.
+        ImportError: when ``numpy`` is not installed.
+    """
+
+    numpy = _numpy()
+    if not frame_rows(measurement, fields, tags, time):
+        return []
+
+    columns = {}
+    for group in (fields, tags or {}):
+        for key, column in group.items():
+            columns[key] = numpy.asarray(column)
+    if time is not None:
+        time = numpy.asarray(time)
+        if time.dtype.kind == "M":
+            time = time.astype("datetime64[ns]").view("int64")
+        elif time.dtype.kind not in "iu":
+            raise ValueError(
+                "Invalid type for a timestamp column: %s" % time.dtype
+            )
+        columns[None] = time
+
+    series = numpy.array([escape_measurement(measurement)], dtype=str)
+    for key in sorted(tags or {}):
+        series = numpy.char.add(
+            series, _tag_column(numpy, str(key), columns[key].reshape(-1))
+        )
+
+    field_set = None
+    for key in fields:
+        encoded = _field_column(numpy, str(key), columns[key].reshape(-1))
+        field_set = (
+            encoded
+            if field_set is None
+            else numpy.char.add(field_set, encoded)
+        )
+    # Drop the separator in front of the first field of each row
+    field_set = numpy.char.lstrip(field_set, ",")
+    if not numpy.char.str_len(field_set).all():
+        raise ValueError(
+            "Point for measurement %r has no fields." % measurement
+        )
+
+    lines = numpy.char.add(numpy.char.add(series, " "), field_set)
+    if time is not None:
+        stamps = time.reshape(-1).astype("int64")
+        if precision != "ns":
+            stamps = stamps // PRECISIONS[precision]
+        lines = numpy.char.add(numpy.char.add(lines, " "), stamps.astype(str))
+
+    return [line.encode("utf-8") for line in lines.tolist()]
@@ -0,0 +1,269 @@
+# Copyright 2021 Hoplite Industries, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Load generator for the orgs API.
+
+:func:`run` drives one shared :class:`influxdb2.core.Influx` connection from
+a number of worker threads and reports throughput and latency percentiles.
+By default it targets a :class:`influxdb2.stub.StubServer` so the client's
+connection pooling, pagination and retries can be measured on one machine::
+
+    python -m influxdb2.loadtest --workers 16 --duration 10 --op iterate \\
+        --orgs 500 --latency 0.002 --error-rate 0.01 --retries 3
+
+An in-process stub shares the interpreter lock with the workers, which
+caps throughput at a few thousand requests per second.  For higher rates
+run the stub on its own with ``python -m influxdb2.stub`` and point
+``--url`` at it.
+"""
+
+import argparse
+import sys
+import threading
+import time
+import typing
+
+# Local imports
+from . import core
+from . import exceptions
+from . import retry
+from . import stub
+
+OPERATIONS = ("list", "get", "iterate", "resolve")
+"""Operations a worker can repeat."""
+
+
+def percentile(values: typing.Sequence[float], fraction: float) -> float:
+    """Nearest rank percentile of already sorted values."""
+    if not values:
+        return 0.0
+    rank = min(len(values) - 1, max(0, int(round(fraction * len(values))) - 1))
+    return values[rank]
+
+
+class Report:
+    """Outcome of a load test.
+
+    Parameters:
+        latencies: Seconds taken by each successful operation.
+        errors (int): Number of operations that raised.
+        elapsed (float): Wall clock seconds of the whole run.
+        stats (dict): :meth:`influxdb2.core.Influx.stats` at the end, empty
+            unless the connection was created with ``metrics=True``.
+
+    """
+
+    def __init__(
+        self,
+        latencies: typing.List[float],
+        errors: int,
+        elapsed: float,
+        stats: dict,
+    ):
+        self.latencies = sorted(latencies)
+        self.errors = errors
+        self.elapsed = elapsed
+        self.stats = stats
+
+    @property
+    def operations(self) -> int:
+        """Number of successful operations."""
+        return len(self.latencies)
+
+    @property
+    def throughput(self) -> float:
+        """Successful operations per second."""
+        return self.operations / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def p50(self) -> float:
+        """Median latency in seconds."""
+        return percentile(self.latencies, 0.50)
+
+    @property
+    def p99(self) -> float:
+        """99th percentile latency in seconds."""
+        return percentile(self.latencies, 0.99)
+
+    def __str__(self):
+        requests = sum(item["requests"] for item in self.stats.values())
+        retries = sum(item["retries"] for item in self.stats.values())
+        return (
+            "%d ops in %.2fs: %.1f ops/sec, p50 %.2fms, p99 %.2fms, "
+            "%d errors, %d HTTP requests, %d retries"
+            % (
+                self.operations,
+                self.elapsed,
+                self.throughput,
+                self.p50 * 1000,
+                self.p99 * 1000,
+                self.errors,
+                requests,
+                retries,
+            )
+        )
+
+
+def _operation(
+    db: core.Influx, name: str, prefetch: int
+) -> typing.Callable[[], None]:
+    if name not in OPERATIONS:
+        raise ValueError(
+            "%s.run 'op' must be one of %s not: %r"
+            % (__name__, OPERATIONS, name)
+        )
+    if name == "list":
+        return lambda: db.orgs.list(limit=100)
+    if name == "iterate":
+        return lambda: sum(1 for _ in db.orgs.iterate(prefetch=prefetch))
+    first = db.orgs.list(limit=1)
+    if not first:
+        raise exceptions.InfluxError("The server has no orgs to look up")
+    if name == "get":
+        return lambda: db.orgs.get(first[0].id)
+    return lambda: db.orgs.resolve(first[0].name)
+
+
+def run(
+    db: core.Influx,
+    op: str = "list",
+    workers: int = 8,
+    duration: typing.Optional[float] = 10.0,
+    operations: typing.Optional[int] = None,
+    prefetch: int = 2,
+) -> Report:
+    """Repeat an operation from many threads.
+
+    Parameters:
+        db: Connection shared by every worker.
+        op (str): Default ``"list"``. One of :data:`OPERATIONS`.
+        workers (int): Default 8. Number of worker threads.
+        duration (float): Default 10. Seconds to run for.
+        operations (int): *Optional* Stop after this many operations in
+            total instead of after ``duration``.
+        prefetch (int): Default 2. Pages fetched ahead by ``iterate``.
+
+    Returns:
+        :class:`Report` of the run.
+    """
+
+    func = _operation(db, op, prefetch)
+    latencies = []
+    errors = [0]
+    lock = threading.Lock()
+    remaining = [operations]
+    deadline = time.monotonic() + (duration or 0)
+
+    def more() -> bool:
+        with lock:
+            if remaining[0] is not None:
+                remaining[0] -= 1
+                return remaining[0] >= 0
+        return time.monotonic() < deadline
+
+    def worker():
+        while more():
+            started = time.perf_counter()
+            try:
+                func()
+            except Exception:  # pylint: disable=W0703
+                with lock:
+                    errors[0] += 1
+                continue
+            elapsed = time.perf_counter() - started
+            with lock:
+                latencies.append(elapsed)
+
+    started = time.monotonic()
+    threads = [
+        threading.Thread(target=worker, name="influxdb2-load-%d" % idx)
+        for idx in range(workers)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    return Report(latencies, errors[0], time.monotonic() - started, db.stats())
+
+
+def main(argv: typing.Optional[typing.List[str]] = None) -> int:
+    """Command line entry point."""
+
+    parser = argparse.ArgumentParser(
+        description="Load test the InfluxDB orgs API"
+    )
+    parser.add_argument(
+        "--url", help="Server to test, default is an in-process stub"
+    )
+    parser.add_argument("--token", default="stub-token")
+    parser.add_argument("--op", choices=OPERATIONS, default="list")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--operations", type=int)
+    parser.add_argument("--pool-maxsize", type=int, default=10)
+    parser.add_argument("--retries", type=int, default=0)
+    parser.add_argument("--prefetch", type=int, default=2)
+    stub_args = parser.add_argument_group("stub server")
+    stub_args.add_argument("--orgs", type=int, default=250)
+    stub_args.add_argument("--latency", type=float, default=0.0)
+    stub_args.add_argument("--jitter", type=float, default=0.0)
+    stub_args.add_argument("--error-rate", type=float, default=0.0)
+    stub_args.add_argument("--max-page-size", type=int)
+    args = parser.parse_args(argv)
+
+    server = None
+    url = args.url
+    if url is None:
+        server = stub.StubServer(
+            orgs=args.orgs,
+            latency=args.latency,
+            jitter=args.jitter,
+            error_rate=args.error_rate,
+            max_page_size=args.max_page_size,
+            token=args.token,
+        ).start()
+        url = server.url
+
+    db = core.Influx(
+        url,
+        args.token,
+        pool_maxsize=args.pool_maxsize,
+        metrics=True,
+        retry=(
+            retry.RetryPolicy(args.retries, backoff=0.01)
+            if args.retries
+            else None
+        ),
+    )
+    try:
+        report = run(
+            db,
+            args.op,
+            workers=args.workers,
+            duration=args.duration,
+            operations=args.operations,
+            prefetch=args.prefetch,
+        )
+    finally:
+        db.close()
+        if server is not None:
+            server.stop()
+
+    print(report)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
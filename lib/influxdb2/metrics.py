@@ -0,0 +1,302 @@
+# Copyright 2021 Hoplite Industries, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Client side request metrics.
+
+Connections created with ``metrics=True`` record every request made
+through :class:`influxdb2.core.Influx` per endpoint: a histogram of the
+time each attempt took, request and response body sizes, counts per status
+code, retries, network errors and the time spent waiting for a free pooled
+connection.  Endpoints are named by method and path with IDs replaced by
+``{id}``, such as ``GET /api/v2/orgs/{id}``.
+
+Comparing the latency histogram with ``pool_wait`` tells a slow server from
+a connection pool that is too small, and time spent outside both is spent in
+the client itself.
+
+.. code-block:: python
+
+    db = influxdb2.connect(url, token, metrics=True)
+    ...
+    snapshot = db.stats()
+    print(snapshot["GET /api/v2/orgs"]["latency"]["sum"])
+    print(influxdb2.metrics.to_prometheus(snapshot))
+"""
+
+import bisect
+import functools
+import re
+import threading
+import typing
+
+LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    float("inf"),
+)
+"""Upper bounds in seconds of the latency histogram buckets."""
+
+ID_PATH_REGEX = re.compile("/[a-f0-9]{16}(?=/|$)")
+"""Matches IDs in API paths."""
+
+_local = threading.local()
+
+
+@functools.lru_cache(maxsize=1024)
+def endpoint_name(method: str, path: str) -> str:
+    """Name of the endpoint a request goes to.
+
+    Parameters:
+        method: HTTP method.
+        path: API path, without a query string.
+
+    Returns:
+        ``METHOD /path`` with IDs in the path replaced by ``{id}``.
+    """
+    path = "/" + path.lstrip("/")
+    return "%s %s" % (method.upper(), ID_PATH_REGEX.sub("/{id}", path))
+
+
+def reset_pool_wait():
+    """Start measuring pool wait time for the calling thread."""
+    _local.pool_wait = 0.0
+
+
+def add_pool_wait(seconds: float):
+    """Add time the calling thread waited for a pooled connection."""
+    _local.pool_wait = getattr(_local, "pool_wait", 0.0) + seconds
+
+
+def pool_wait() -> float:
+    """Pool wait time of the calling thread since :func:`reset_pool_wait`."""
+    return getattr(_local, "pool_wait", 0.0)
+
+
+class _Endpoint:
+    """Counters for one endpoint."""
+
+    __slots__ = (
+        "buckets",
+        "latency",
+        "sent",
+        "received",
+        "statuses",
+        "retries",
+        "errors",
+        "pool_wait",
+    )
+
+    def __init__(self):
+        self.buckets = [0] * len(LATENCY_BUCKETS)
+        self.latency = 0.0
+        self.sent = 0
+        self.received = 0
+        self.statuses = {}
+        self.retries = 0
+        self.errors = 0
+        self.pool_wait = 0.0
+
+    def snapshot(self) -> dict:
+        return {
+            "requests": sum(self.buckets),
+            "latency": {
+                "count": sum(self.buckets),
+                "sum": self.latency,
+                "buckets": dict(zip(LATENCY_BUCKETS, self.buckets)),
+            },
+            "bytes_sent": self.sent,
+            "bytes_received": self.received,
+            "statuses": dict(self.statuses),
+            "retries": self.retries,
+            "errors": self.errors,
+            "pool_wait": self.pool_wait,
+        }
+
+
+class Metrics:
+    """Thread safe request metrics of one connection."""
+
+    def __init__(self):
+        self._endpoints = {}
+        self._lock = threading.Lock()
+
+    def _endpoint(self, name: str) -> _Endpoint:
+        # Called with the lock held
+        endpoint = self._endpoints.get(name)
+        if endpoint is None:
+            endpoint = self._endpoints[name] = _Endpoint()
+        return endpoint
+
+    def record(
+        self,
+        name: str,
+        seconds: float,
+        status: typing.Optional[int],
+        sent: int = 0,
+        received: int = 0,
+        waited: float = 0.0,
+    ):
+        """Record one attempt of a request.
+
+        Parameters:
+            name: Endpoint name, see :func:`endpoint_name`.
+            seconds: Time the attempt took.
+            status: HTTP status code, ``None`` for a network error.
+            sent: Request body bytes.
+            received: Response body bytes.
+            waited: Seconds spent waiting for a pooled connection.
+        """
+
+        idx = bisect.bisect_left(LATENCY_BUCKETS, seconds)
+        with self._lock:
+            endpoint = self._endpoint(name)
+            endpoint.buckets[idx] += 1
+            endpoint.latency += seconds
+            endpoint.sent += sent
+            endpoint.received += received
+            endpoint.pool_wait += waited
+            if status is None:
+                endpoint.errors += 1
+            else:
+                endpoint.statuses[status] = (
+                    endpoint.statuses.get(status, 0) + 1
+                )
+
+    def retried(self, name: str):
+        """Count a retry of a request to an endpoint."""
+        with self._lock:
+            self._endpoint(name).retries += 1
+
+    def snapshot(self) -> typing.Dict[str, dict]:
+        """Copy of the metrics keyed by endpoint name."""
+        with self._lock:
+            return {
+                name: endpoint.snapshot()
+                for name, endpoint in self._endpoints.items()
+            }
+
+    def reset(self):
+        """Drop all recorded metrics."""
+        with self._lock:
+            self._endpoints.clear()
+
+
+def _labels(name: str, **extra) -> str:
+    method, _, path = name.partition(" ")
+    pairs = [("method", method), ("endpoint", path)] + sorted(extra.items())
+    return ",".join(
+        '%s="%s"'
+        % (
+            key,
+            str(value)
+            .replace("\\", "\\\\")
+            .replace('"', '\\"')
+            .replace("\n", "\\n"),
+        )
+        for key, value in pairs
+    )
+
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def to_prometheus(
+    snapshot: typing.Dict[str, dict], prefix: str = "influxdb2_client"
+) -> str:
+    """Format a metrics snapshot in the Prometheus text exposition format.
+
+    Parameters:
+        snapshot: Result of :meth:`influxdb2.core.Influx.stats`.
+        prefix: Default ``influxdb2_client``. Prefix of every metric name.
+
+    Returns:
+        The metrics as text, ready to be served on a ``/metrics`` page.
+    """
+
+    out = []
+
+    def family(name: str, kind: str, doc: str):
+        out.append("# HELP %s_%s %s" % (prefix, name, doc))
+        out.append("# TYPE %s_%s %s" % (prefix, name, kind))
+
+    def sample(name: str, labels: str, value: float):
+        out.append("%s_%s{%s} %s" % (prefix, name, labels, _number(value)))
+
+    family(
+        "request_duration_seconds",
+        "histogram",
+        "Time taken by each request attempt.",
+    )
+    for name, data in sorted(snapshot.items()):
+        cumulative = 0
+        for bound, count in data["latency"]["buckets"].items():
+            cumulative += count
+            sample(
+                "request_duration_seconds_bucket",
+                _labels(name, le=_number(bound)),
+                cumulative,
+            )
+        sample(
+            "request_duration_seconds_sum",
+            _labels(name),
+            data["latency"]["sum"],
+        )
+        sample(
+            "request_duration_seconds_count",
+            _labels(name),
+            data["latency"]["count"],
+        )
+
+    family("responses_total", "counter", "Responses by status code.")
+    for name, data in sorted(snapshot.items()):
+        for status, count in sorted(data["statuses"].items()):
+            sample("responses_total", _labels(name, status=status), count)
+
+    counters = (
+        ("request_bytes_total", "bytes_sent", "Request body bytes sent."),
+        (
+            "response_bytes_total",
+            "bytes_received",
+            "Response body bytes received.",
+        ),
+        ("retries_total", "retries", "Requests retried."),
+        (
+            "network_errors_total",
+            "errors",
+            "Attempts failing without a response.",
+        ),
+        (
+            "pool_wait_seconds_total",
+            "pool_wait",
+            "Time spent waiting for a pooled connection.",
+        ),
+    )
+    for metric, key, doc in counters:
+        family(metric, "counter", doc)
+        for name, data in sorted(snapshot.items()):
+            sample(metric, _labels(name), data[key])
+
+    return "\n".join(out) + "\n"
@@ -14,5 +14,7 @@
 
 """Core module for objects."""
 
+from . import bucket
 from . import common
 from . import org
+from . import point
@@ -0,0 +1,463 @@
+# Copyright 2021 Hoplite Industries, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Bucket Object
+=============
+
+
+This object is based on the following JSON structure that comes back
+from InfluxDB.
+
+.. _json-bucket-structure:
+
+JSON Response for a Bucket.
+
+.. code-block:: json
+
+    {
+        "links": {
+            "self": "/api/v2/buckets/1",
+            "org": "/api/v2/orgs/2",
+            "members": "/api/v2/buckets/1/members",
+            "owners": "/api/v2/buckets/1/owners",
+            "labels": "/api/v2/buckets/1/labels",
+            "write": "/api/v2/write?org=myorg&bucket=1"
+        },
+        "id": "string",
+        "type": "user",
+        "name": "string",
+        "description": "string",
+        "orgID": "string",
+        "rp": "string",
+        "createdAt": "2019-08-24T14:15:22Z",
+        "updatedAt": "2019-08-24T14:15:22Z",
+        "retentionRules": [
+            {
+                "type": "expire",
+                "everySeconds": 86400,
+                "shardGroupDurationSeconds": 0
+            }
+        ]
+    }
+"""
+
+import copy
+import typing
+
+# Local imports
+from .. import codec
+from .. import types
+from . import common
+
+INVALID = "-invalid-"
+
+
+class RetentionRule:
+    """Retention rule of a bucket.
+
+    Parameters:
+        every_seconds (int): Seconds data is kept.  0 keeps data forever.
+        shard_group_duration_seconds (int): *Optional* Time span covered by
+            each shard group.  ``None`` lets the server choose.
+
+    """
+
+    __slots__ = ("every_seconds", "shard_group_duration_seconds")
+
+    def __init__(
+        self,
+        every_seconds: int = 0,
+        shard_group_duration_seconds: typing.Optional[int] = None,
+    ):
+        func_name = "%s.%s" % (__name__, __class__.__name__)
+        types.ensure_type(func_name, "every_seconds", every_seconds, int)
+        types.ensure_type(
+            func_name,
+            "shard_group_duration_seconds",
+            shard_group_duration_seconds,
+            (int, type(None)),
+        )
+        if every_seconds < 0:
+            raise ValueError(
+                "%s 'every_seconds' must not be negative" % func_name
+            )
+
+        self.every_seconds = every_seconds
+        self.shard_group_duration_seconds = shard_group_duration_seconds
+
+    def __eq__(self, other):
+        if not isinstance(other, RetentionRule):
+            return NotImplemented
+        return (
+            self.every_seconds == other.every_seconds
+            and self.shard_group_duration_seconds
+            == other.shard_group_duration_seconds
+        )
+
+    def __repr__(self):
+        return "%s(%d, %r)" % (
+            __class__.__name__,
+            self.every_seconds,
+            self.shard_group_duration_seconds,
+        )
+
+    def to_dict(self) -> dict:
+        """Dictionary for the ``retentionRules`` of an API request."""
+        retval = {"type": "expire", "everySeconds": self.every_seconds}
+        if self.shard_group_duration_seconds is not None:
+            retval["shardGroupDurationSeconds"] = (
+                self.shard_group_duration_seconds
+            )
+        return retval
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "RetentionRule":
+        """Build a rule from an entry of ``retentionRules``.
+
+        Raises:
+            ValueError: when the dictionary is invalid.
+        """
+
+        try:
+            return cls(
+                data["everySeconds"], data.get("shardGroupDurationSeconds")
+            )
+        except (KeyError, TypeError) as err:
+            raise ValueError(
+                "%s.from_dict() Invalid dictionary, missing key [%s]"
+                % (cls.__name__, err)
+            ) from None
+
+
+def _rules(data: typing.Any) -> typing.List[RetentionRule]:
+    if not isinstance(data, list):
+        raise ValueError("retentionRules must be a list")
+    return [RetentionRule.from_dict(item) for item in data]
+
+
+class Bucket:  # pylint: disable=R0902,C0103
+    """Object describing an InfluxDB Bucket.
+
+    Like :class:`influxdb2.obj.org.Org` the object uses ``__slots__`` and
+    only parses timestamps and copies links the first time they are read.
+
+    Parameters:
+        name (str): *Optional* Name of the bucket.
+        org_id (str): *Optional* ID of the org owning the bucket.
+        description (str): *Optional* Long description for the bucket.
+        bucket_id (str): *Optional* The bucket ID.  This will be a 16 digit
+            hex string.
+        retention_rules: *Optional* List of :class:`RetentionRule`.  An
+            empty list keeps data forever.
+
+    """
+
+    __slots__ = (
+        "_name",
+        "_description",
+        "_bucket_id",
+        "_org_id",
+        "_type",
+        "_rp",
+        "_retention_rules",
+        "_created_at",
+        "_updated_at",
+        "_links",
+        "_links_raw",
+    )
+
+    def __init__(
+        self,
+        name: typing.Optional[str] = None,
+        org_id: typing.Optional[str] = None,
+        description: typing.Optional[str] = None,
+        bucket_id: typing.Optional[str] = None,
+        retention_rules: typing.Optional[typing.List[RetentionRule]] = None,
+    ):
+        self._name = name if name else INVALID
+        self._org_id = org_id if org_id else INVALID
+        # Subtle, but empty string "" becomes None
+        self._description = description if description else None
+        self._bucket_id = bucket_id if bucket_id else INVALID
+        self._type = "user"
+        self._rp = None
+        self._retention_rules = list(retention_rules or [])
+        self._created_at = 0
+        self._updated_at = 0
+        self._links = {}
+        self._links_raw = None
+
+    def __repr__(self):
+        return "%s(%r, %r)" % (__class__.__name__, self._name, self._bucket_id)
+
+    def __copy__(self):
+        retval = __class__.__new__(__class__)
+        for name in __class__.__slots__:
+            setattr(retval, name, getattr(self, name))
+        # Rules and the decoded links are the mutable members
+        retval._retention_rules = [
+            copy.copy(rule) for rule in self._retention_rules
+        ]
+        retval._links = dict(self._links)
+        return retval
+
+    @property
+    def name(self) -> str:
+        """Name of the bucket."""
+        if self._name == INVALID:
+            raise ValueError(
+                "%s.name referenced before being assigned a value."
+                % (__class__.__name__)
+            )
+        return self._name
+
+    @name.setter
+    def name(self, value: str):
+        if not isinstance(value, str):
+            raise ValueError(
+                "%s.name must be a string." % (__class__.__name__)
+            )
+        if value == INVALID:
+            raise ValueError(
+                "%s.name %s is a restricted value."
+                % (__class__.__name__, repr(INVALID))
+            )
+        if not value:
+            raise ValueError(
+                "%s.name must not be empty." % (__class__.__name__)
+            )
+        self._name = value
+
+    @property
+    def description(self) -> types.NullStr:
+        """Description of the bucket."""
+        return self._description
+
+    @description.setter
+    def description(self, value: types.NullStr):
+        if value is not None:
+            if not isinstance(value, str):
+                raise ValueError("Description must be a string or None.")
+        self._description = value
+
+    @property
+    def id(self) -> str:
+        """Bucket ID from InfluxDB."""
+        if self._bucket_id == INVALID:
+            raise ValueError(
+                "%s.id reference before being assigned a value."
+                % (__class__.__name__)
+            )
+        return self._bucket_id
+
+    @id.setter
+    def id(self, value: str):
+        types.ensure_id(__class__.__name__, "id", value)
+        self._bucket_id = value
+
+    @property
+    def org_id(self) -> str:
+        """ID of the org owning the bucket."""
+        if self._org_id == INVALID:
+            raise ValueError(
+                "%s.org_id reference before being assigned a value."
+                % (__class__.__name__)
+            )
+        return self._org_id
+
+    @org_id.setter
+    def org_id(self, value: str):
+        types.ensure_id(__class__.__name__, "org_id", value)
+        self._org_id = value
+
+    @property
+    def type(self) -> str:
+        """Bucket type, ``user`` or ``system``."""
+        return self._type
+
+    @property
+    def rp(self) -> types.NullStr:
+        """Name of the InfluxDB 1.x retention policy mapped to the bucket."""
+        return self._rp
+
+    @property
+    def retention_rules(self) -> typing.List[RetentionRule]:
+        """Retention rules of the bucket."""
+        return self._retention_rules
+
+    @retention_rules.setter
+    def retention_rules(self, value: typing.List[RetentionRule]):
+        if not isinstance(value, list) or not all(
+            isinstance(rule, RetentionRule) for rule in value
+        ):
+            raise ValueError(
+                "%s.retention_rules must be a list of RetentionRule."
+                % (__class__.__name__)
+            )
+        self._retention_rules = list(value)
+
+    @property
+    def retention(self) -> int:
+        """Seconds data is kept, 0 when it is kept forever."""
+        for rule in self._retention_rules:
+            if rule.every_seconds:
+                return rule.every_seconds
+        return 0
+
+    @property
+    def created(self) -> float:
+        """Timestamp of when the bucket was created.
+
+        The value is seconds since Jan 1, 1970 00:00:00 GMT.
+
+        Raises:
+            ValueError: when an invalid value is encountered.
+        """
+        self._created_at = common.timestamp(self._created_at)
+        return self._created_at
+
+    @property
+    def updated(self) -> float:
+        """Timestamp of when the bucket was last updated.
+
+        The value is seconds since Jan 1, 1970 00:00:00 GMT.
+
+        Raises:
+            ValueError: when an invalid value is encountered.
+        """
+        self._updated_at = common.timestamp(self._updated_at)
+        return self._updated_at
+
+    @property
+    def links(self) -> dict:
+        """Links associated with this bucket."""
+        if self._links_raw is not None:
+            # Duplicate the links to prevent odd corruption
+            self._links = {str(x): str(y) for x, y in self._links_raw.items()}
+            self._links_raw = None
+        return self._links
+
+    def from_dict(self, data: dict):
+        """Fill object from a dictionary object.
+
+        Parameters:
+            data: Dictionary containing a bucket response from InfluxDB.
+
+                See the :ref:`JSON Bucket Structure <json-bucket-structure>`
+                for details on what the dictionary should look like.
+        """
+
+        try:
+            self._fill(data, True)
+        except (KeyError, TypeError, ValueError) as err:
+            self.__init__()
+            raise ValueError(
+                "%s.from_dict() Invalid dictionary, missing key [%s]"
+                % (__class__.__name__, err)
+            ) from None
+
+    def _fill(self, data: dict, validate: bool):
+        if validate:
+            self.id = data["id"]
+            self.org_id = data["orgID"]
+            self.name = data["name"]
+            self.description = data.get("description")
+            links = data.get("links", {})
+            if not isinstance(links, dict):
+                raise ValueError("links must be a dictionary")
+            self._created_at = common.raw_timestamp(data["createdAt"])
+            self._updated_at = common.raw_timestamp(data["updatedAt"])
+        else:
+            self._bucket_id = data["id"]
+            self._org_id = data["orgID"]
+            self._name = data["name"]
+            self._description = data.get("description")
+            links = data.get("links", {})
+            self._created_at = data["createdAt"]
+            self._updated_at = data["updatedAt"]
+        self._type = data.get("type", "user")
+        self._rp = data.get("rp")
+        self._retention_rules = _rules(data.get("retentionRules", []))
+        self._links = {}
+        self._links_raw = links
+
+    @classmethod
+    def from_dicts(
+        cls, data: typing.List[dict], validate: bool = True
+    ) -> typing.List["Bucket"]:
+        """Build a list of buckets from a list of dictionaries.
+
+        This is the bulk form of :meth:`from_dict` used for list responses.
+
+        Parameters:
+            data: List of dictionaries, each containing a bucket response
+                from InfluxDB.
+            validate: Default True. Check the type and syntax of each value.
+                When false only missing keys are detected, which is meant for
+                responses from a trusted server.
+
+        Returns:
+            List of :class:`Bucket` objects in the same order as ``data``.
+
+        Raises:
+            ValueError: when any dictionary is invalid.
+        """
+
+        if not isinstance(data, list):
+            raise ValueError(
+                "%s.from_dicts() Must be a list not [%s]"
+                % (cls.__name__, type(data))
+            )
+
+        new = cls.__new__
+        retval = []
+        for idx, item in enumerate(data):
+            bucket = new(cls)
+            try:
+                bucket._fill(item, validate)
+            except (KeyError, TypeError, ValueError) as err:
+                raise ValueError(
+                    "%s.from_dicts() Invalid dictionary at index %d [%s]"
+                    % (cls.__name__, idx, err)
+                ) from None
+            retval.append(bucket)
+
+        return retval
+
+    def from_json(self, data: typing.Union[str, bytes]):
+        """Fill object from a json string.
+
+        Parameters:
+            data: JSON containing a bucket response from InfluxDB.
+
+                See the :ref:`JSON Bucket Structure <json-bucket-structure>`
+                for details on what the JSON should look like.
+        """
+
+        try:
+            dictdata = codec.loads(data)
+        except ValueError as err:
+            raise ValueError(
+                "%s.from_json() Invalid json data: %s"
+                % (__class__.__name__, err)
+            ) from None
+
+        try:
+            self.from_dict(dictdata)
+        except ValueError as err:
+            raise ValueError(
+                "%s.from_json() Invalid json data: %s"
+                % (__class__.__name__, err)
+            ) from None
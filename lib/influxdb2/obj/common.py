@@ -22,6 +22,38 @@ import typing
 # Local
 from .. import types
 
+TIMESTAMP_CHARS = frozenset("0123456789-+:. TtZz")
+"""Characters an RFC 3339 timestamp is made of."""
+
+
+def timestamp(value: typing.Union[str, float]) -> float:
+    """Parse a raw timestamp string, passing floats through."""
+    if isinstance(value, str):
+        # Imported here so loading objects does not pull in ciso8601
+        import ciso8601  # pylint: disable=C0415
+
+        return ciso8601.parse_datetime(value).timestamp()
+    return value
+
+
+def raw_timestamp(value: types.TimeVal) -> typing.Union[str, float]:
+    """Check a timestamp without parsing it.
+
+    Strings only get a cheap check: a dash after the year and nothing but
+    :data:`TIMESTAMP_CHARS`.  Other malformed values, such as month 13, are
+    rejected by :func:`timestamp` when first read.
+    """
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    if (
+        isinstance(value, str)
+        and value[4:5] == "-"
+        and TIMESTAMP_CHARS.issuperset(value)
+    ):
+        return value
+    raise ValueError("Invalid value for a timestamp: %r" % (value,))
+
+
 class Secret:
     """Object describing a secret key.
 
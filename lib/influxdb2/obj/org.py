@@ -46,15 +46,12 @@ JSON Response for an Organization.
     }
 """
 
-import json as jsonlib
-import re
 import typing
 
-# 3rd party
-import ciso8601
-
 # Local imports
+from .. import codec
 from .. import types
+from . import common
 
 INVALID = "-invalid-"
 
@@ -62,6 +59,11 @@ INVALID = "-invalid-"
 class Org:  # pylint: disable=R0902,C0103
     """Object describing an InfluxDB Organization.
 
+    The object uses ``__slots__`` to keep its footprint small.  Timestamps
+    are kept as the raw strings from InfluxDB and the ``links`` mapping is
+    kept as decoded; both are only parsed or copied the first time they are
+    read.
+
     Parameters:
         name (str): *Optional* Name of the Organization.
         description (str): *Optional* Long description for the Organization.
@@ -70,6 +72,17 @@ class Org:  # pylint: disable=R0902,C0103
 
     """
 
+    __slots__ = (
+        "_name",
+        "_description",
+        "_org_id",
+        "_active",
+        "_created_at",
+        "_updated_at",
+        "_links",
+        "_links_raw",
+    )
+
     def __init__(
         self,
         name: typing.Optional[str] = None,
@@ -85,6 +98,15 @@ class Org:  # pylint: disable=R0902,C0103
         self._created_at = 0
         self._updated_at = 0
         self._links = {}
+        self._links_raw = None
+
+    def __copy__(self):
+        retval = __class__.__new__(__class__)
+        for name in __class__.__slots__:
+            setattr(retval, name, getattr(self, name))
+        # The decoded links are the only mutable member
+        retval._links = dict(self._links)
+        return retval
 
     def _reset(self):
         self._name = INVALID
@@ -94,6 +116,7 @@ class Org:  # pylint: disable=R0902,C0103
         self._created_at = 0
         self._updated_at = 0
         self._links = {}
+        self._links_raw = None
 
     @property
     def name(self) -> str:
@@ -169,19 +192,12 @@ class Org:  # pylint: disable=R0902,C0103
         Raises:
             ValueError: when an invalid value is encountered.
         """
+        self._created_at = common.timestamp(self._created_at)
         return self._created_at
 
     @created.setter
     def created(self, value: types.TimeVal):
-        if isinstance(value, (int, float)):
-            self._created_at = float(value)
-        elif isinstance(value, str):
-            dt = ciso8601.parse_datetime(value)
-            self._created_at = dt.timestamp()
-        else:
-            raise ValueError(
-                "Invalid type for a timestamp: %s" % (type(value))
-            )
+        self._created_at = common.raw_timestamp(value)
 
     @property
     def updated(self) -> float:
@@ -192,19 +208,12 @@ class Org:  # pylint: disable=R0902,C0103
         Raises:
             ValueError: when an invalid value is encountered.
         """
+        self._updated_at = common.timestamp(self._updated_at)
         return self._updated_at
 
     @updated.setter
     def updated(self, value: types.TimeVal):
-        if isinstance(value, (int, float)):
-            self._updated_at = float(value)
-        elif isinstance(value, str):
-            dt = ciso8601.parse_datetime(value)
-            self._updated_at = dt.timestamp()
-        else:
-            raise ValueError(
-                "Invalid type for a timestamp: %s" % (type(value))
-            )
+        self._updated_at = common.raw_timestamp(value)
 
     @property
     def active(self) -> bool:
@@ -222,6 +231,10 @@ class Org:  # pylint: disable=R0902,C0103
     @property
     def links(self) -> dict:
         """Links associated with this org."""
+        if self._links_raw is not None:
+            # Duplicate the links to prevent odd corruption
+            self._links = {str(x): str(y) for x, y in self._links_raw.items()}
+            self._links_raw = None
         return self._links
 
     @links.setter
@@ -233,6 +246,7 @@ class Org:  # pylint: disable=R0902,C0103
             )
         # Duplicate the links to prevent odd corruption
         self._links = {str(x): str(value[x]) for x in value}
+        self._links_raw = None
 
     def from_dict(self, data: dict):
         """Fill object from a dictionary object.
@@ -247,19 +261,108 @@ class Org:  # pylint: disable=R0902,C0103
         try:
             self.id = data["id"]
             self.name = data["name"]
-            self.description = data["description"]
-            self.created = data["createdAt"]
-            self.updated = data["updatedAt"]
-            status = data.get("status", "active")
-            self.active = status == "active"
-            self.links = data["links"]
-        except ValueError as err:
+            self.description = data.get("description")
+            self._created_at = common.raw_timestamp(data["createdAt"])
+            self._updated_at = common.raw_timestamp(data["updatedAt"])
+            self._active = data.get("status", "active") == "active"
+            links = data["links"]
+            if not isinstance(links, dict):
+                raise ValueError(
+                    "%s.links Must be a dictionary not [%s]"
+                    % (__class__.__name__, type(links))
+                )
+            self._links_raw = links
+        except (KeyError, ValueError) as err:
             self._reset()
             raise ValueError(
                 "%s.from_dict() Invalid dictionary, missing key [%s]"
                 % (__class__.__name__, err)
             ) from None
 
+    @classmethod
+    def from_dicts(
+        cls, data: typing.List[dict], validate: bool = True
+    ) -> typing.List["Org"]:
+        """Build a list of orgs from a list of dictionaries.
+
+        This is the bulk form of :meth:`from_dict` used for list responses.
+        Objects are filled directly instead of through the property setters
+        while applying the same checks.
+
+        Parameters:
+            data: List of dictionaries, each containing an org response from
+                InfluxDB.
+
+                See the :ref:`JSON Org Structure <json-org-structure>` for
+                details on what the dictionaries should look like.
+            validate: Default True. Check the type and syntax of each value.
+                When false only missing keys are detected, which is meant for
+                responses from a trusted server.
+
+        Returns:
+            List of :class:`Org` objects in the same order as ``data``.
+
+        Raises:
+            ValueError: when any dictionary is invalid.
+        """
+
+        if not isinstance(data, list):
+            raise ValueError(
+                "%s.from_dicts() Must be a list not [%s]"
+                % (cls.__name__, type(data))
+            )
+
+        match = types.ID_REGEX.match
+        new = cls.__new__
+        retval = []
+        for idx, item in enumerate(data):
+            try:
+                org_id = item["id"]
+                name = item["name"]
+                description = item.get("description")
+                links = item["links"]
+                created = item["createdAt"]
+                updated = item["updatedAt"]
+                if validate:
+                    if not isinstance(org_id, str) or not match(org_id):
+                        raise ValueError(
+                            "id must be a 16 character hex string"
+                        )
+                    if (
+                        not isinstance(name, str)
+                        or not name
+                        or name == INVALID
+                    ):
+                        raise ValueError("name must be a non-empty string")
+                    if description is not None and not isinstance(
+                        description, str
+                    ):
+                        raise ValueError(
+                            "description must be a string or None"
+                        )
+                    if not isinstance(links, dict):
+                        raise ValueError("links must be a dictionary")
+                    created = common.raw_timestamp(created)
+                    updated = common.raw_timestamp(updated)
+
+                org = new(cls)
+                org._org_id = org_id
+                org._name = name
+                org._description = description
+                org._active = item.get("status", "active") == "active"
+                org._created_at = created
+                org._updated_at = updated
+                org._links = {}
+                org._links_raw = links
+            except (KeyError, TypeError, ValueError) as err:
+                raise ValueError(
+                    "%s.from_dicts() Invalid dictionary at index %d [%s]"
+                    % (cls.__name__, idx, err)
+                ) from None
+            retval.append(org)
+
+        return retval
+
     def from_json(self, data: typing.Union[str, bytes]):
         """Fill object from a json string.
 
@@ -271,8 +374,8 @@ class Org:  # pylint: disable=R0902,C0103
         """
 
         try:
-            dictdata = jsonlib.loads(data)
-        except jsonlib.JSONDecodeError as err:
+            dictdata = codec.loads(data)
+        except ValueError as err:
             raise ValueError(
                 "%s.from_json() Invalid json data: %s"
                 % (__class__.__name__, err)
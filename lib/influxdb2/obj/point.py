@@ -0,0 +1,230 @@
+# Copyright 2021 Hoplite Industries, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Point Object
+============
+
+A single point to write, encoded with :meth:`Point.to_line`.  Points can be
+handed to :meth:`influxdb2.write.Writer.points` and
+:meth:`influxdb2.write.WriteBatcher.add` like any other point form.
+
+The series key, the escaped measurement and sorted tags at the front of a
+line, is the same for every point of a series.  It is cached per point and
+in a process wide LRU cache keyed by measurement and tags, so emitting the
+same series over and over only escapes and sorts its tags once.
+
+.. code-block:: python
+
+    TAGS = {"host": "web-1", "dc": "east"}
+    batcher.add(Point("cpu", {"usage": 12.5}, TAGS, time.time()))
+"""
+
+import functools
+import typing
+
+# Local imports
+from .. import lineproto
+
+SERIES_CACHE_SIZE = 16384
+"""Number of series keys kept in the process wide cache."""
+
+
+@functools.lru_cache(maxsize=SERIES_CACHE_SIZE)
+def _series_key(measurement: str, tags: tuple) -> str:
+    parts = [lineproto.escape_measurement(measurement)]
+    for key, value in sorted(tags):
+        if value:
+            parts.append(
+                "%s=%s"
+                % (lineproto.escape_key(key), lineproto.escape_key(value))
+            )
+    return ",".join(parts)
+
+
+@functools.lru_cache(maxsize=SERIES_CACHE_SIZE)
+def _field_key(key: str) -> str:
+    return lineproto.escape_key(str(key)) + "="
+
+
+def series_key(
+    measurement: str, tags: typing.Optional[typing.Mapping[str, str]] = None
+) -> str:
+    """Escaped ``measurement,tag=value`` prefix of a line.
+
+    Tags are sorted by key and tags with an empty value are left out, the
+    same as :func:`influxdb2.lineproto.encode_point`.
+
+    Parameters:
+        measurement: Measurement name.
+        tags: *Optional* Tag names mapped to their values.
+
+    Returns:
+        The series key.  Results are cached by measurement and tags.
+
+    Raises:
+        ValueError: when the measurement is not a non-empty string.
+    """
+
+    if not isinstance(measurement, str) or not measurement:
+        raise ValueError("Measurement must be a non-empty string.")
+    # Cached by the formatted strings: True, 1 and 1.0 are equal as keys
+    # but not once formatted, and unhashable values still get cached
+    items = (
+        tuple(
+            (str(key), str(value))
+            for key, value in tags.items()
+            if value is not None
+        )
+        if tags
+        else ()
+    )
+    return _series_key(measurement, items)
+
+
+class Point:
+    """A point to write to InfluxDB.
+
+    The object uses ``__slots__`` to keep its footprint small.  Assigning
+    ``measurement`` or ``tags`` drops the cached series key; change tags by
+    assigning a new mapping rather than modifying the old one in place.
+
+    Parameters:
+        measurement (str): Measurement name.
+        fields (dict): Field names mapped to their values.  Fields with a
+            value of ``None`` are left out.
+        tags (dict): *Optional* Tag names mapped to their values.
+        time: *Optional* Timestamp, see
+            :func:`influxdb2.lineproto.format_time`.
+
+    """
+
+    __slots__ = ("_measurement", "_tags", "_fields", "_time", "_key")
+
+    def __init__(
+        self,
+        measurement: str,
+        fields: typing.Mapping[str, typing.Any],
+        tags: typing.Optional[typing.Mapping[str, str]] = None,
+        time: typing.Any = None,
+    ):
+        self._measurement = measurement
+        self._fields = fields
+        self._tags = tags
+        self._time = time
+        self._key = None
+
+    @property
+    def measurement(self) -> str:
+        """Measurement name."""
+        return self._measurement
+
+    @measurement.setter
+    def measurement(self, value: str):
+        self._measurement = value
+        self._key = None
+
+    @property
+    def tags(self) -> typing.Optional[typing.Mapping[str, str]]:
+        """Tag names mapped to their values."""
+        return self._tags
+
+    @tags.setter
+    def tags(self, value: typing.Optional[typing.Mapping[str, str]]):
+        self._tags = value
+        self._key = None
+
+    @property
+    def fields(self) -> typing.Mapping[str, typing.Any]:
+        """Field names mapped to their values."""
+        return self._fields
+
+    @fields.setter
+    def fields(self, value: typing.Mapping[str, typing.Any]):
+        self._fields = value
+
+    @property
+    def time(self) -> typing.Any:
+        """Timestamp of the point, ``None`` lets the server assign one."""
+        return self._time
+
+    @time.setter
+    def time(self, value: typing.Any):
+        self._time = value
+
+    @property
+    def key(self) -> str:
+        """Escaped series key, see :func:`series_key`."""
+        if self._key is None:
+            self._key = series_key(self._measurement, self._tags)
+        return self._key
+
+    def to_line(self, precision: str = "ns") -> bytes:
+        """Encode the point as line protocol.
+
+        Parameters:
+            precision: One of the keys in
+                :data:`influxdb2.lineproto.PRECISIONS`.
+
+        Returns:
+            UTF-8 encoded line without a trailing newline.
+
+        Raises:
+            ValueError: when the point can not be encoded.
+        """
+
+        key = self._key
+        if key is None:
+            key = self._key = series_key(self._measurement, self._tags)
+
+        field_set = ",".join(
+            [
+                _field_key(name) + lineproto.format_field(value)
+                for name, value in self._fields.items()
+                if value is not None
+            ]
+        )
+        if not field_set:
+            raise ValueError(
+                "Point for measurement %r has no fields." % self._measurement
+            )
+
+        if self._time is None:
+            line = "%s %s" % (key, field_set)
+        else:
+            line = "%s %s %s" % (
+                key,
+                field_set,
+                lineproto.format_time(self._time, precision),
+            )
+        return line.encode("utf-8")
+
+    def __eq__(self, other):
+        if not isinstance(other, Point):
+            return NotImplemented
+        return (
+            self._measurement == other._measurement
+            and (self._tags or {}) == (other._tags or {})
+            and self._fields == other._fields
+            and self._time == other._time
+        )
+
+    def __repr__(self):
+        return "%s(%r, %r, %r, %r)" % (
+            __class__.__name__,
+            self._measurement,
+            self._fields,
+            self._tags,
+            self._time,
+        )
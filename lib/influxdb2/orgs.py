@@ -17,18 +17,153 @@
 Query and manage the administrative organizations in InfluxDB.
 """
 
+import copy
 import typing
 
 # 3rd party
 
 # Local imports
+from . import bulk
+from . import cache
+from . import codec
+from . import exceptions
 from . import obj
+from . import pager
 from . import types
 
 
+def _list_params(
+    class_name: types.Source,
+    descending: bool,
+    limit: int,
+    offset: int,
+    org: typing.Optional[str],
+    org_id: typing.Optional[str],
+    user_id: typing.Optional[str],
+    check: bool = True,
+) -> dict:
+    if check:
+        types.ensure_type(class_name, "descending", descending, bool)
+        types.ensure_type(class_name, "limit", limit, int)
+        types.ensure_type(class_name, "offset", offset, int)
+        types.ensure_type(class_name, "org", org, (str, type(None)))
+        types.ensure_type(class_name, "org_id", org_id, (str, type(None)))
+        types.ensure_type(class_name, "user_id", user_id, (str, type(None)))
+
+        if limit < 1 or limit > 100:
+            raise ValueError(
+                "Limit must be within the bounds of 1 to 100 not %d" % limit
+            )
+
+    return {
+        "descending": descending,
+        "limit": limit,
+        "offset": offset,
+        "org": org,
+        "orgID": org_id,
+        "userID": user_id,
+    }
+
+
+def _create_payload(
+    class_name: types.Source,
+    name: str,
+    description: typing.Optional[str],
+    check: bool = True,
+) -> dict:
+    if check:
+        types.ensure_type(class_name, "name", name, str)
+        types.ensure_type(
+            class_name, "description", description, (str, type(None))
+        )
+
+    payload = {"name": name}
+    if description:
+        payload["description"] = description
+    return payload
+
+
+def _update_payload(
+    class_name: types.Source,
+    org_id: str,
+    name: str,
+    description: typing.Optional[str],
+    check: bool = True,
+) -> dict:
+    if check:
+        types.ensure_id(class_name, "org_id", org_id)
+        types.ensure_type(class_name, "name", name, str)
+        types.ensure_type(
+            class_name, "description", description, (str, type(None))
+        )
+
+    return {
+        "name": name,
+        "description": description,
+    }
+
+
+def _decode_org(data: dict, validate: bool = True) -> obj.org.Org:
+    if not validate:
+        return obj.org.Org.from_dicts([data], validate=False)[0]
+    org = obj.org.Org()
+    org.from_dict(data)
+    return org
+
+
+def _decode_orgs(
+    data: typing.Any, validate: bool = True
+) -> typing.List[obj.org.Org]:
+    # The API wraps the list as {"links": {...}, "orgs": [...]}
+    if isinstance(data, dict):
+        if "orgs" not in data:
+            raise exceptions.InfluxError("Invalid server response")
+        data = data["orgs"]
+    return obj.org.Org.from_dicts(data, validate)
+
+
+def _decode_secrets(data: dict) -> typing.List[obj.common.Secret]:
+    if "secrets" not in data:
+        raise exceptions.InfluxError("Invalid server response")
+    return [obj.common.Secret(secret) for secret in data["secrets"]]
+
+
+def _secrets_payload(
+    class_name: types.Source, secrets: typing.Mapping[str, str], check: bool
+) -> dict:
+    if check:
+        types.ensure_type(class_name, "secrets", secrets, dict)
+        for key, value in secrets.items():
+            types.ensure_type(class_name, "secrets key", key, str)
+            types.ensure_type(class_name, "secrets value", value, str)
+    return dict(secrets)
+
+
+def _secret_keys(
+    class_name: types.Source,
+    keys: typing.Iterable[typing.Union[str, obj.common.Secret]],
+    check: bool,
+) -> dict:
+    keys = [
+        str(key) if isinstance(key, obj.common.Secret) else key for key in keys
+    ]
+    if check:
+        for key in keys:
+            types.ensure_type(class_name, "keys", key, str)
+    return {"secrets": keys}
+
+
 class Organizations:
     """Interface to InfluxDB Organizations API.
 
+    When the connection was created with a ``cache_ttl`` the orgs returned by
+    the server are kept in an index by ID and by name, and :meth:`get` and
+    :meth:`list` filtered only by ``org`` are answered from it while the
+    entries are fresh.  Orgs created, updated or deleted through this object
+    update the index immediately.  The index keeps its own copy of each org,
+    so changing a returned :class:`influxdb2.obj.org.Org` never changes what
+    later calls return.
+
     Parameters:
         db (influxdb2.core.Influx): Base connection instance.
 
@@ -36,6 +171,80 @@ class Organizations:
 
     def __init__(self, db):
         self._db = db
+        self._check = db.validation.params
+        self._strict = db.validation.responses
+        self._by_id = None
+        self._by_name = None
+        if db._cache_ttl:
+            self._by_id = cache.TTLCache(db._cache_ttl, db._cache_size)
+            self._by_name = cache.TTLCache(db._cache_ttl, db._cache_size)
+
+    def _remember(self, orgs: typing.Iterable[obj.org.Org]):
+        if self._by_id is None:
+            return
+        for org in orgs:
+            old = self._by_id.get(org.id)
+            if old is not None and old.name != org.name:
+                self._by_name.pop(old.name)
+            self._by_id.set(org.id, copy.copy(org))
+            self._by_name.set(org.name, org.id)
+
+    def _forget(self, org_id: str):
+        if self._by_id is None:
+            return
+        old = self._by_id.pop(org_id)
+        if old is not None:
+            self._by_name.pop(old.name)
+
+    def _cached(
+        self, org_id: typing.Optional[str] = None, name: types.NullStr = None
+    ) -> typing.Optional[obj.org.Org]:
+        if self._by_id is None:
+            return None
+        if name is not None:
+            org_id = self._by_name.get(name)
+        org = self._by_id.get(org_id) if org_id is not None else None
+        if org is None or (name is not None and org.name != name):
+            # The two indexes expire apart, so a name may outlive a rename
+            return None
+        return copy.copy(org)
+
+    def clear_cache(self):
+        """Drop every cached org."""
+        if self._by_id is not None:
+            self._by_id.clear()
+            self._by_name.clear()
+
+    def resolve(self, name: str) -> str:
+        """Get the ID of an org from its name.
+
+        Answered from the cache when possible.
+
+        Parameters:
+            name: Name of the organization.
+
+        Returns:
+            Org ID from InfluxDB.
+
+        Raises:
+            ValueError when an incoming parameter is of the incorrect type.
+            :class:`exceptions.InfluxError` when the org does not exist.
+            :class:`exceptions.InfluxHTTPError` when a generic HTTP error
+                comes back.
+            :class:`exceptions.InfluxAPIError` when a known error payload
+                returns from the server.
+        """
+
+        class_name = (__name__, __class__.__name__, "resolve")
+        if self._check:
+            types.ensure_type(class_name, "name", name, str)
+
+        orgs = self._list(
+            _list_params(class_name, False, 1, 0, name, None, None, False)
+        )
+        if not orgs:
+            raise exceptions.InfluxError("Org %r not found" % name)
+        return orgs[0].id
 
     def iterate(
         self,
@@ -43,9 +252,13 @@ class Organizations:
         org: typing.Optional[str] = None,
         org_id: typing.Optional[str] = None,
         user_id: typing.Optional[str] = None,
+        prefetch: int = 2,
     ) -> typing.Iterable[obj.org.Org]:
         """Iterate over all orgs in the database.
 
+        Pages of 100 orgs are fetched ahead of the one being consumed, see
+        :class:`influxdb2.pager.Paginator`.
+
         Parameters:
             descending (bool): Default: False. If true sort results in
                 descending order by name.  Default is to do ascending.
@@ -55,23 +268,32 @@ class Organizations:
                 on id.
             user_id (str): Optional. Restrict output to only this orgs
                 visible by this user id.
+            prefetch (int): Default 2. Number of pages fetched ahead in
+                background threads.  0 fetches one page at a time.
 
         Returns:
             Iterable of :class:`influxdb2.obj.org.Org` objects.
         """
 
-        offset = 0
+        class_name = (__name__, __class__.__name__, "iterate")
+        _list_params(
+            class_name, descending, 100, 0, org, org_id, user_id, self._check
+        )
 
-        orgs = self.list(descending, 100, offset, org, org_id, user_id)
-        while True:
-            for org in orgs:
-                yield org
+        def fetch(offset: int, limit: int) -> typing.List[obj.org.Org]:
+            params = _list_params(
+                class_name,
+                descending,
+                limit,
+                offset,
+                org,
+                org_id,
+                user_id,
+                False,
+            )
+            return self._list(params)
 
-            if len(orgs) == 100:
-                offset += 100
-                orgs = self.list(descending, 100, offset, org, org_id, user_id)
-            else:
-                break
+        return iter(pager.Paginator(fetch, 100, prefetch))
 
     def list(
         self,
@@ -113,36 +335,36 @@ class Organizations:
                 returns from the server.
         """
 
-        class_name = "%s.%s.list" % (__name__, __class__.__name__)
-        types.ensure_type(class_name, "descending", descending, bool)
-        types.ensure_type(class_name, "limit", limit, int)
-        types.ensure_type(class_name, "offset", offset, int)
-        types.ensure_type(class_name, "org", org, (str, type(None)))
-        types.ensure_type(class_name, "org_id", org_id, (str, type(None)))
-        types.ensure_type(class_name, "user_id", user_id, (str, type(None)))
-
-        if limit < 1 or limit > 100:
-            raise ValueError(
-                "Limit must be within the bounds of 1 to 100 not %d" % limit
-            )
+        class_name = (__name__, __class__.__name__, "list")
+        params = _list_params(
+            class_name,
+            descending,
+            limit,
+            offset,
+            org,
+            org_id,
+            user_id,
+            self._check,
+        )
+        return self._list(params)
+
+    def _list(self, params: dict) -> typing.List[obj.org.Org]:
+        # Parameters were checked by the caller
+        org = params["org"]
+        if (
+            org is not None
+            and params["offset"] == 0
+            and not (params["orgID"] or params["userID"])
+        ):
+            cached = self._cached(name=org)
+            if cached is not None:
+                return [cached]
 
-        params = {
-            "descending": descending,
-            "limit": limit,
-            "offset": offset,
-            "org": org,
-            "orgID": org_id,
-            "userID": user_id,
-        }
         rsp = self._db.get("/api/v2/orgs", params=params)
-        retval = []
-        if rsp.status_code == 200:
-            for orgdict in rsp.json():
-                org = obj.org.Org()
-                org.from_dict(orgdict)
-                retval.append(org)
-        else:
-            self.api_error(rsp)
+        if rsp.status_code != 200:
+            self._db.api_error(rsp)
+        retval = _decode_orgs(codec.loads(rsp.content), self._strict)
+        self._remember(retval)
         return retval
 
     def create(
@@ -166,23 +388,14 @@ class Organizations:
             :class:`exceptions.InfluxAPIError` when a known error payload
                 returns from the server.
         """
-        class_name = "%s.%s.create" % (__name__, __class__.__name__)
-        types.ensure_type(class_name, "name", name, str)
-        types.ensure_type(
-            class_name, "description", description, (str, type(None))
-        )
+        class_name = (__name__, __class__.__name__, "create")
+        payload = _create_payload(class_name, name, description, self._check)
 
-        payload = {"name": name}
-        if description:
-            payload["description"] = description
         rsp = self._db.post("/api/v2/orgs", json=payload)
-
-        if rsp.status_code == 201:
-            org = obj.org.Org()
-            org.from_dict(rsp.json())
-        else:
-            self.api_error(rsp)
-
+        if rsp.status_code != 201:
+            self._db.api_error(rsp)
+        org = _decode_org(codec.loads(rsp.content), self._strict)
+        self._remember([org])
         return org
 
     def get(self, org_id: str) -> obj.org.Org:
@@ -202,17 +415,19 @@ class Organizations:
                 returns from the server.
 
         """
-        class_name = "%s.%s.get" % (__name__, __class__.__name__)
-        types.ensure_id(class_name, "org_id", org_id)
+        class_name = (__name__, __class__.__name__, "get")
+        if self._check:
+            types.ensure_id(class_name, "org_id", org_id)
 
-        rsp = self._db.get("/api/v2/orgs/%s" % org_id)
-
-        if rsp.status_code == 200:
-            org = obj.org.Org()
-            org.from_dict(rsp.json())
-        else:
-            self.api_error(rsp)
+        cached = self._cached(org_id)
+        if cached is not None:
+            return cached
 
+        rsp = self._db.get("/api/v2/orgs/%s" % org_id)
+        if rsp.status_code != 200:
+            self._db.api_error(rsp)
+        org = _decode_org(codec.loads(rsp.content), self._strict)
+        self._remember([org])
         return org
 
     def update(self, org_id: str, name: str, description: str) -> obj.org.Org:
@@ -235,29 +450,20 @@ class Organizations:
                 returns from the server.
 
         """
-        class_name = "%s.%s.get" % (__name__, __class__.__name__)
-        types.ensure_id(class_name, "org_id", org_id)
-        types.ensure_type(class_name, "name", name, str)
-        types.ensure_type(
-            class_name, "description", description, (str, type(None))
+        class_name = (__name__, __class__.__name__, "update")
+        payload = _update_payload(
+            class_name, org_id, name, description, self._check
         )
 
-        payload = {
-            "name": name,
-            "description": description,
-        }
-
+        self._forget(org_id)
         rsp = self._db.patch("/api/v2/orgs/%s" % org_id, json=payload)
-
-        if rsp.status_code == 200:
-            org = obj.org.Org()
-            org.from_dict(rsp.json())
-        else:
-            self.api_error(rsp)
-
+        if rsp.status_code != 200:
+            self._db.api_error(rsp)
+        org = _decode_org(codec.loads(rsp.content), self._strict)
+        self._remember([org])
         return org
 
-    def delete(self, org_id: str) -> obj.org.Org:
+    def delete(self, org_id: str) -> None:
         """Delete a specific org based on it's ID.
 
         Parameters:
@@ -271,15 +477,87 @@ class Organizations:
                 returns from the server.
 
         """
-        class_name = "%s.%s.get" % (__name__, __class__.__name__)
-        types.ensure_id(class_name, "org_id", org_id)
+        class_name = (__name__, __class__.__name__, "delete")
+        if self._check:
+            types.ensure_id(class_name, "org_id", org_id)
 
+        self._forget(org_id)
         rsp = self._db.delete("/api/v2/orgs/%s" % org_id)
+        if rsp.status_code != 204:
+            self._db.api_error(rsp)
+
+    def create_many(
+        self,
+        orgs: typing.Iterable[
+            typing.Union[str, typing.Tuple[str, typing.Optional[str]]]
+        ],
+        concurrency: int = bulk.DEFAULT_CONCURRENCY,
+    ) -> typing.List[bulk.Result]:
+        """Create many organizations concurrently.
 
-        if rsp.status_code == 204:
-            pass
-        else:
-            self.api_error(rsp)
+        See :mod:`influxdb2.bulk`.
+
+        Parameters:
+            orgs: Names, or ``(name, description)`` tuples, of the orgs to
+                create.
+            concurrency (int): Default 8. Maximum number of requests in
+                flight.
+
+        Returns:
+            List in the order of ``orgs`` holding the new
+            :class:`obj.org.Org` or the exception raised creating it.
+        """
+
+        items = [
+            tuple(org) if isinstance(org, (tuple, list)) else (org, None)
+            for org in orgs
+        ]
+        return bulk.run(self.create, items, concurrency)
+
+    def update_many(
+        self,
+        orgs: typing.Iterable[typing.Tuple[str, str, typing.Optional[str]]],
+        concurrency: int = bulk.DEFAULT_CONCURRENCY,
+    ) -> typing.List[bulk.Result]:
+        """Update many organizations concurrently.
+
+        See :mod:`influxdb2.bulk`.
+
+        Parameters:
+            orgs: ``(org_id, name, description)`` tuples as taken by
+                :meth:`update`.
+            concurrency (int): Default 8. Maximum number of requests in
+                flight.
+
+        Returns:
+            List in the order of ``orgs`` holding the updated
+            :class:`obj.org.Org` or the exception raised updating it.
+        """
+
+        return bulk.run(self.update, [tuple(org) for org in orgs], concurrency)
+
+    def delete_many(
+        self,
+        org_ids: typing.Iterable[str],
+        concurrency: int = bulk.DEFAULT_CONCURRENCY,
+    ) -> typing.List[bulk.Result]:
+        """Delete many organizations concurrently.
+
+        See :mod:`influxdb2.bulk`.
+
+        Parameters:
+            org_ids: IDs of the orgs to delete.
+            concurrency (int): Default 8. Maximum number of requests in
+                flight.
+
+        Returns:
+            List in the order of ``org_ids`` holding ``None`` for each
+            deleted org or the exception raised deleting it.
+        """
+
+        return bulk.run(
+            self.delete, [(org_id,) for org_id in org_ids], concurrency
+        )
 
     def secrets(self, org_id: str) -> typing.List[obj.common.Secret]:
         """Get a list of secrets for an Org base on it's ID.
@@ -298,20 +576,337 @@ class Organizations:
                 returns from the server.
 
         """
-        class_name = "%s.%s.get" % (__name__, __class__.__name__)
-        types.ensure_id(class_name, "org_id", org_id)
+        class_name = (__name__, __class__.__name__, "secrets")
+        if self._check:
+            types.ensure_id(class_name, "org_id", org_id)
 
         rsp = self._db.get("/api/v2/orgs/%s/secrets" % org_id)
+        if rsp.status_code != 200:
+            self._db.api_error(rsp)
+        return _decode_secrets(codec.loads(rsp.content))
 
-        retval = []
-        if rsp.status_code == 200:
-            json = rsp.json()
-            if "secrets" in json:
-                for secret in json["secrets"]:
-                    retval.append(obj.common.Secret(secret))
-            else:
-                raise exceptions.InfluxError("Invalid server response")
-        else:
-            self.api_error(rsp)
+    def set_secrets(self, org_id: str, secrets: typing.Mapping[str, str]):
+        """Add or update many secrets of an org in one request.
 
-        return retval
+        Parameters:
+            org_id: Org ID from InfluxDB
+            secrets: Mapping of secret keys to their values.  Secrets not in
+                the mapping are left alone.
+
+        Raises:
+            ValueError when an incoming parameter is of the incorrect type.
+            :class:`exceptions.InfluxHTTPError` when a generic HTTP error
+                comes back.
+            :class:`exceptions.InfluxAPIError` when a known error payload
+                returns from the server.
+
+        """
+        class_name = (__name__, __class__.__name__, "set_secrets")
+        if self._check:
+            types.ensure_id(class_name, "org_id", org_id)
+        payload = _secrets_payload(class_name, secrets, self._check)
+
+        rsp = self._db.patch("/api/v2/orgs/%s/secrets" % org_id, json=payload)
+        if rsp.status_code != 204:
+            self._db.api_error(rsp)
+
+    def delete_secrets(
+        self,
+        org_id: str,
+        keys: typing.Iterable[typing.Union[str, obj.common.Secret]],
+    ):
+        """Delete many secrets of an org in one request.
+
+        Parameters:
+            org_id: Org ID from InfluxDB
+            keys: Keys, or :class:`obj.common.Secret` objects, of the
+                secrets to delete.
+
+        Raises:
+            ValueError when an incoming parameter is of the incorrect type.
+            :class:`exceptions.InfluxHTTPError` when a generic HTTP error
+                comes back.
+            :class:`exceptions.InfluxAPIError` when a known error payload
+                returns from the server.
+
+        """
+        class_name = (__name__, __class__.__name__, "delete_secrets")
+        if self._check:
+            types.ensure_id(class_name, "org_id", org_id)
+        payload = _secret_keys(class_name, keys, self._check)
+
+        rsp = self._db.post(
+            "/api/v2/orgs/%s/secrets/delete" % org_id, json=payload
+        )
+        if rsp.status_code != 204:
+            self._db.api_error(rsp)
+
+    def set_secrets_many(
+        self,
+        org_ids: typing.Iterable[str],
+        secrets: typing.Mapping[str, str],
+        concurrency: int = bulk.DEFAULT_CONCURRENCY,
+    ) -> typing.List[bulk.Result]:
+        """Apply the same secrets to many orgs concurrently.
+
+        One :meth:`set_secrets` request is made per org, see
+        :mod:`influxdb2.bulk`.
+
+        Parameters:
+            org_ids: IDs of the orgs to update.
+            secrets: Mapping of secret keys to their values.
+            concurrency (int): Default 8. Maximum number of requests in
+                flight.
+
+        Returns:
+            List in the order of ``org_ids`` holding ``None`` for each
+            updated org or the exception raised updating it.
+        """
+
+        class_name = (__name__, __class__.__name__, "set_secrets_many")
+        secrets = _secrets_payload(class_name, secrets, self._check)
+        return bulk.run(
+            self.set_secrets,
+            [(org_id, secrets) for org_id in org_ids],
+            concurrency,
+        )
+
+    def delete_secrets_many(
+        self,
+        org_ids: typing.Iterable[str],
+        keys: typing.Iterable[typing.Union[str, obj.common.Secret]],
+        concurrency: int = bulk.DEFAULT_CONCURRENCY,
+    ) -> typing.List[bulk.Result]:
+        """Delete the same secrets from many orgs concurrently.
+
+        One :meth:`delete_secrets` request is made per org, see
+        :mod:`influxdb2.bulk`.
+
+        Parameters:
+            org_ids: IDs of the orgs to update.
+            keys: Keys of the secrets to delete.
+            concurrency (int): Default 8. Maximum number of requests in
+                flight.
+
+        Returns:
+            List in the order of ``org_ids`` holding ``None`` for each
+            updated org or the exception raised updating it.
+        """
+
+        class_name = (__name__, __class__.__name__, "delete_secrets_many")
+        keys = _secret_keys(class_name, keys, self._check)["secrets"]
+        return bulk.run(
+            self.delete_secrets,
+            [(org_id, keys) for org_id in org_ids],
+            concurrency,
+        )
+
+
+class AsyncOrganizations:
+    """Asyncio interface to InfluxDB Organizations API.
+
+    Every method mirrors the one of the same name on
+    :class:`Organizations` but must be awaited, and :meth:`iterate` is an
+    async generator.
+
+    Parameters:
+        db (influxdb2.aio.AsyncInflux): Base connection instance.
+
+    """
+
+    def __init__(self, db):
+        self._db = db
+        self._check = db.validation.params
+        self._strict = db.validation.responses
+
+    async def iterate(
+        self,
+        descending: bool = False,
+        org: typing.Optional[str] = None,
+        org_id: typing.Optional[str] = None,
+        user_id: typing.Optional[str] = None,
+    ) -> typing.AsyncIterator[obj.org.Org]:
+        """Iterate over all orgs in the database.
+
+        See :meth:`Organizations.iterate` for the parameters.
+
+        Returns:
+            Async iterable of :class:`influxdb2.obj.org.Org` objects.
+        """
+
+        offset = 0
+        while True:
+            orgs = await self.list(
+                descending, 100, offset, org, org_id, user_id
+            )
+            if not orgs:
+                break
+            for item in orgs:
+                yield item
+            offset += len(orgs)
+
+    async def list(
+        self,
+        descending: bool = False,
+        limit: int = 20,
+        offset: int = 0,
+        org: typing.Optional[str] = None,
+        org_id: typing.Optional[str] = None,
+        user_id: typing.Optional[str] = None,
+    ) -> typing.List[obj.org.Org]:
+        """List organizations.
+
+        See :meth:`Organizations.list` for the parameters and exceptions.
+
+        Returns:
+            list of :class:`influxdb2.obj.org.Org`
+        """
+
+        class_name = (__name__, __class__.__name__, "list")
+        params = _list_params(
+            class_name,
+            descending,
+            limit,
+            offset,
+            org,
+            org_id,
+            user_id,
+            self._check,
+        )
+
+        rsp = await self._db.get("/api/v2/orgs", params=params)
+        if rsp.status_code != 200:
+            self._db.api_error(rsp)
+        return _decode_orgs(codec.loads(rsp.content), self._strict)
+
+    async def create(
+        self, name: str, description: typing.Optional[str]
+    ) -> obj.org.Org:
+        """Create a new organization in InfluxDB.
+
+        See :meth:`Organizations.create` for the parameters and exceptions.
+
+        Returns:
+            :class:`obj.org.Org` object for the new org
+        """
+
+        class_name = (__name__, __class__.__name__, "create")
+        payload = _create_payload(class_name, name, description, self._check)
+
+        rsp = await self._db.post("/api/v2/orgs", json=payload)
+        if rsp.status_code != 201:
+            self._db.api_error(rsp)
+        return _decode_org(codec.loads(rsp.content), self._strict)
+
+    async def get(self, org_id: str) -> obj.org.Org:
+        """Get a specific org based on it's ID.
+
+        See :meth:`Organizations.get` for the parameters and exceptions.
+
+        Returns:
+            :class:`obj.org.Org` object for the desired org
+        """
+
+        class_name = (__name__, __class__.__name__, "get")
+        if self._check:
+            types.ensure_id(class_name, "org_id", org_id)
+
+        rsp = await self._db.get("/api/v2/orgs/%s" % org_id)
+        if rsp.status_code != 200:
+            self._db.api_error(rsp)
+        return _decode_org(codec.loads(rsp.content), self._strict)
+
+    async def update(
+        self, org_id: str, name: str, description: str
+    ) -> obj.org.Org:
+        """Update a specific org based on it's ID.
+
+        See :meth:`Organizations.update` for the parameters and exceptions.
+
+        Returns:
+            :class:`obj.org.Org` object for the updated org
+        """
+
+        class_name = (__name__, __class__.__name__, "update")
+        payload = _update_payload(
+            class_name, org_id, name, description, self._check
+        )
+
+        rsp = await self._db.patch("/api/v2/orgs/%s" % org_id, json=payload)
+        if rsp.status_code != 200:
+            self._db.api_error(rsp)
+        return _decode_org(codec.loads(rsp.content), self._strict)
+
+    async def delete(self, org_id: str) -> None:
+        """Delete a specific org based on it's ID.
+
+        See :meth:`Organizations.delete` for the parameters and exceptions.
+        """
+
+        class_name = (__name__, __class__.__name__, "delete")
+        if self._check:
+            types.ensure_id(class_name, "org_id", org_id)
+
+        rsp = await self._db.delete("/api/v2/orgs/%s" % org_id)
+        if rsp.status_code != 204:
+            self._db.api_error(rsp)
+
+    async def secrets(self, org_id: str) -> typing.List[obj.common.Secret]:
+        """Get a list of secrets for an Org base on it's ID.
+
+        See :meth:`Organizations.secrets` for the parameters and exceptions.
+
+        Returns:
+            List of :class:`obj.common.Secret` object(s) for the requested org
+        """
+
+        class_name = (__name__, __class__.__name__, "secrets")
+        if self._check:
+            types.ensure_id(class_name, "org_id", org_id)
+
+        rsp = await self._db.get("/api/v2/orgs/%s/secrets" % org_id)
+        if rsp.status_code != 200:
+            self._db.api_error(rsp)
+        return _decode_secrets(codec.loads(rsp.content))
+
+    async def set_secrets(
+        self, org_id: str, secrets: typing.Mapping[str, str]
+    ):
+        """Add or update many secrets of an org in one request.
+
+        See :meth:`Organizations.set_secrets` for the parameters and
+        exceptions.
+        """
+
+        class_name = (__name__, __class__.__name__, "set_secrets")
+        if self._check:
+            types.ensure_id(class_name, "org_id", org_id)
+        payload = _secrets_payload(class_name, secrets, self._check)
+
+        rsp = await self._db.patch(
+            "/api/v2/orgs/%s/secrets" % org_id, json=payload
+        )
+        if rsp.status_code != 204:
+            self._db.api_error(rsp)
+
+    async def delete_secrets(
+        self,
+        org_id: str,
+        keys: typing.Iterable[typing.Union[str, obj.common.Secret]],
+    ):
+        """Delete many secrets of an org in one request.
+
+        See :meth:`Organizations.delete_secrets` for the parameters and
+        exceptions.
+        """
+
+        class_name = (__name__, __class__.__name__, "delete_secrets")
+        if self._check:
+            types.ensure_id(class_name, "org_id", org_id)
+        payload = _secret_keys(class_name, keys, self._check)
+
+        rsp = await self._db.post(
+            "/api/v2/orgs/%s/secrets/delete" % org_id, json=payload
+        )
+        if rsp.status_code != 204:
+            self._db.api_error(rsp)
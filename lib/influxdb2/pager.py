@@ -0,0 +1,110 @@
+# Copyright 2021 Hoplite Industries, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Pagination over offset/limit list endpoints."""
+
+import collections
+import concurrent.futures
+import typing
+
+# Local imports
+from . import types
+
+
+class Paginator:
+    """Iterate over every item of an offset/limit list endpoint.
+
+    While one page is being consumed the following ``prefetch`` pages are
+    already being fetched in a thread pool, so walking a long listing costs
+    about one round trip instead of one per page.  Iteration stops at the
+    first empty page.  Each page starts where the items received so far
+    end, so servers capping pages below ``page_size`` lose no items.  When
+    a page comes back with a different number of items than expected the
+    pages fetched ahead are discarded and fetched again at the right
+    offsets.
+
+    Parameters:
+        fetch: Called as ``fetch(offset, limit)`` and returns the list of
+            items for that page.  It is called from worker threads.
+        page_size (int): Default 100. Number of items requested per page.
+        prefetch (int): Default 2. Number of pages fetched ahead of the page
+            being consumed.  0 fetches one page at a time in the calling
+            thread.
+
+    """
+
+    def __init__(
+        self,
+        fetch: typing.Callable[[int, int], typing.List[typing.Any]],
+        page_size: int = 100,
+        prefetch: int = 2,
+    ):
+        class_name = "%s.%s" % (__name__, __class__.__name__)
+        types.ensure_type(class_name, "page_size", page_size, int)
+        types.ensure_type(class_name, "prefetch", prefetch, int)
+        if page_size < 1 or prefetch < 0:
+            raise ValueError(
+                "%s 'page_size' must be positive and 'prefetch' must not be "
+                "negative" % class_name
+            )
+
+        self._fetch = fetch
+        self._page_size = page_size
+        self._prefetch = prefetch
+
+    def __iter__(self) -> typing.Iterator[typing.Any]:
+        if not self._prefetch:
+            return self._sequential()
+        return self._concurrent()
+
+    def _sequential(self) -> typing.Iterator[typing.Any]:
+        offset = 0
+        while True:
+            page = self._fetch(offset, self._page_size)
+            if not page:
+                break
+            yield from page
+            offset += len(page)
+
+    def _concurrent(self) -> typing.Iterator[typing.Any]:
+        pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self._prefetch + 1,
+            thread_name_prefix="influxdb2-pager",
+        )
+        pending = collections.deque()
+        step = self._page_size
+        offset = 0
+        try:
+            while True:
+                while len(pending) <= self._prefetch:
+                    pending.append(
+                        pool.submit(self._fetch, offset, self._page_size)
+                    )
+                    offset += step
+
+                page = pending.popleft().result()
+                if not page:
+                    break
+                if len(page) != step:
+                    # Pages ahead were asked for at the wrong offsets
+                    offset -= step * (len(pending) + 1) - len(page)
+                    step = len(page)
+                    for future in pending:
+                        future.cancel()
+                    pending.clear()
+                yield from page
+        finally:
+            for future in pending:
+                future.cancel()
+            pool.shutdown(wait=False)
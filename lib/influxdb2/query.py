@@ -0,0 +1,498 @@
+# Copyright 2021 Hoplite Industries, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Query API.
+
+Run Flux queries and parse the annotated CSV results as they stream in.
+
+Records are dictionaries mapping column names to values converted according
+to the ``#datatype`` annotation of their table:
+
+=====================  ====================================================
+Datatype               Python type
+=====================  ====================================================
+``string``             ``str``
+``long``               ``int``
+``unsignedLong``       ``int``
+``double``             ``float``
+``boolean``            ``bool``
+``dateTime:RFC3339``   ``float`` seconds since Jan 1, 1970 00:00:00 GMT
+``duration``           ``str``
+=====================  ====================================================
+
+Empty cells take the value from the ``#default`` annotation, or ``None``
+when there is no default.
+
+Columnar Results
+================
+
+With ``columnar=True`` each Flux table is returned as a :class:`Table` of
+NumPy arrays instead.  This requires the optional ``numpy`` package.
+
+=====================  ====================================================
+Datatype               Array dtype (value of an empty cell)
+=====================  ====================================================
+``long``               ``int64`` (0)
+``unsignedLong``       ``uint64`` (0)
+``double``             ``float64`` (NaN)
+``boolean``            ``bool`` (False)
+``dateTime:RFC3339``   ``datetime64[ns]`` (NaT)
+others                 ``object`` holding interned ``str`` values (None)
+=====================  ====================================================
+"""
+
+import csv
+import typing
+
+# 3rd party
+import ciso8601
+
+# Local imports
+from . import exceptions
+from . import types
+
+DIALECT = {
+    "annotations": ["datatype", "group", "default"],
+    "header": True,
+    "delimiter": ",",
+}
+"""CSV dialect requested from the server."""
+
+CHUNK_SIZE = 64 * 1024
+"""Number of bytes read from the response at a time."""
+
+INITIAL_CAPACITY = 1024
+"""Number of rows preallocated for each column of a columnar table."""
+
+DTYPES = {
+    "long": "int64",
+    "unsignedLong": "uint64",
+    "double": "float64",
+    "boolean": "bool",
+    "dateTime:RFC3339": "datetime64[ns]",
+    "dateTime:RFC3339Nano": "datetime64[ns]",
+}
+"""Annotated CSV datatypes mapped to NumPy dtypes for columnar results."""
+
+
+def _parse_time(value: str) -> float:
+    return ciso8601.parse_datetime(value).timestamp()
+
+
+def _parse_bool(value: str) -> bool:
+    return value == "true"
+
+
+CONVERTERS = {
+    "string": str,
+    "long": int,
+    "unsignedLong": int,
+    "double": float,
+    "boolean": _parse_bool,
+    "dateTime:RFC3339": _parse_time,
+    "dateTime:RFC3339Nano": _parse_time,
+    "duration": str,
+    "base64Binary": str,
+}
+"""Annotated CSV datatypes mapped to the function converting a cell."""
+
+
+class TableMeta:
+    """Column description for a block of annotated CSV.
+
+    Parameters:
+        names: Column names from the header row.
+        annotations: Annotation names mapped to their values, one per
+            column.
+
+    """
+
+    __slots__ = ("names", "datatypes", "defaults", "groups")
+
+    def __init__(
+        self,
+        names: typing.List[str],
+        annotations: typing.Dict[str, typing.List[str]],
+    ):
+        count = len(names)
+        self.names = names
+        self.datatypes = annotations.get("datatype", ["string"] * count)
+        self.defaults = annotations.get("default", [""] * count)
+        self.groups = [
+            x == "true" for x in annotations.get("group", [""] * count)
+        ]
+
+    @property
+    def is_error(self) -> bool:
+        """Whether this block reports a query error."""
+        return self.names[:2] == ["error", "reference"]
+
+
+def iter_lines(chunks: typing.Iterable[str]) -> typing.Iterator[str]:
+    """Split a stream of text chunks into lines.
+
+    Lines keep their line ending so that :mod:`csv` can handle quoted values
+    that span lines.
+
+    Parameters:
+        chunks: Iterable of text chunks of any size.
+
+    Returns:
+        Iterator of lines.
+    """
+
+    pending = ""
+    for chunk in chunks:
+        if not chunk:
+            continue
+        parts = (pending + chunk).split("\n")
+        pending = parts.pop()
+        for part in parts:
+            yield part + "\n"
+
+    if pending:
+        yield pending
+
+
+def iter_rows(
+    lines: typing.Iterable[str],
+) -> typing.Iterator[typing.Tuple[TableMeta, typing.List[str]]]:
+    """Parse annotated CSV into raw data rows.
+
+    Parameters:
+        lines: Iterable of lines of annotated CSV.
+
+    Returns:
+        Iterator of ``(TableMeta, cells)`` tuples where ``cells`` holds the
+        unconverted values of one data row.  The same :class:`TableMeta`
+        object is returned for every row of a block.
+
+    Raises:
+        :class:`exceptions.QueryError` when the stream reports an error.
+    """
+
+    annotations = {}
+    meta = None
+    for row in csv.reader(lines):
+        if not row or row == [""]:
+            # Blank line, a new block with its own annotations follows
+            annotations = {}
+            meta = None
+        elif row[0].startswith("#"):
+            annotations[row[0][1:]] = row[1:]
+            meta = None
+        elif meta is None:
+            meta = TableMeta(row[1:], annotations)
+        elif meta.is_error:
+            raise exceptions.QueryError(row[1], row[2] if len(row) > 2 else "")
+        else:
+            yield meta, row[1:]
+
+
+def iter_records(
+    lines: typing.Iterable[str],
+) -> typing.Iterator[typing.Dict[str, typing.Any]]:
+    """Parse annotated CSV into records.
+
+    Parameters:
+        lines: Iterable of lines of annotated CSV.
+
+    Returns:
+        Iterator of record dictionaries.
+
+    Raises:
+        :class:`exceptions.QueryError` when the stream reports an error.
+        ValueError when a cell does not match its datatype.
+    """
+
+    current = None
+    columns = []
+    for meta, cells in iter_rows(lines):
+        if meta is not current:
+            current = meta
+            columns = [
+                (
+                    name,
+                    CONVERTERS.get(datatype, str),
+                    default if default else None,
+                )
+                for name, datatype, default in zip(
+                    meta.names, meta.datatypes, meta.defaults
+                )
+            ]
+
+        record = {}
+        for (name, convert, default), cell in zip(columns, cells):
+            if cell:
+                record[name] = convert(cell)
+            elif default is not None:
+                record[name] = convert(default)
+            else:
+                record[name] = None
+        yield record
+
+
+def _numpy():
+    try:
+        import numpy  # pylint: disable=C0415
+    except ImportError:
+        raise ImportError(
+            "Columnar query results require the 'numpy' package"
+        ) from None
+    return numpy
+
+
+class _Column:
+    """Growable, preallocated buffer for one column of a table."""
+
+    __slots__ = ("numpy", "buffer", "default", "convert", "interned", "group")
+
+    def __init__(self, numpy, datatype: str, default: str, group: bool):
+        self.numpy = numpy
+        self.group = group
+        dtype = DTYPES.get(datatype, "object")
+        self.buffer = numpy.empty(INITIAL_CAPACITY, dtype=dtype)
+        self.interned = None
+        if dtype == "object":
+            self.interned = {}
+            self.convert = self._intern
+            missing = None
+        elif dtype == "datetime64[ns]":
+            # NumPy parses the string itself but warns about the "Z" suffix
+            self.convert = lambda cell: cell.rstrip("Z")
+            missing = "NaT"
+        elif dtype == "bool":
+            self.convert = _parse_bool
+            missing = False
+        elif dtype == "float64":
+            self.convert = float
+            missing = float("nan")
+        else:
+            self.convert = int
+            missing = 0
+        self.default = self.convert(default) if default else missing
+
+    def _intern(self, cell: str) -> str:
+        return self.interned.setdefault(cell, cell)
+
+    def grow(self):
+        """Double the capacity of the buffer."""
+        bigger = self.numpy.empty(
+            len(self.buffer) * 2, dtype=self.buffer.dtype
+        )
+        bigger[: len(self.buffer)] = self.buffer
+        self.buffer = bigger
+
+
+class Table:
+    """One Flux result table in columnar form.
+
+    Parameters:
+        result: Name of the result the table belongs to.
+        table: Table number within the result.
+        columns: Column names mapped to NumPy arrays of equal length.
+        groups: Names of the columns that are part of the group key.
+
+    """
+
+    __slots__ = ("result", "table", "columns", "groups")
+
+    def __init__(
+        self,
+        result: str,
+        table: int,
+        columns: typing.Dict[str, typing.Any],
+        groups: typing.List[str],
+    ):
+        self.result = result
+        self.table = table
+        self.columns = columns
+        self.groups = groups
+
+    def __len__(self):
+        for column in self.columns.values():
+            return len(column)
+        return 0
+
+    def __getitem__(self, name: str):
+        return self.columns[name]
+
+    def __repr__(self):
+        return "%s.%s(%r, %r, rows=%d, columns=%r)" % (
+            __name__,
+            __class__.__name__,
+            self.result,
+            self.table,
+            len(self),
+            list(self.columns),
+        )
+
+
+def iter_tables(lines: typing.Iterable[str]) -> typing.Iterator[Table]:
+    """Parse annotated CSV into columnar tables.
+
+    Cells are written straight into preallocated NumPy buffers as rows are
+    parsed, no intermediate list of rows is built.  A table is returned once
+    the first row of the next table, or the end of the stream, is seen.
+
+    Parameters:
+        lines: Iterable of lines of annotated CSV.
+
+    Returns:
+        Iterator of :class:`Table` objects.
+
+    Raises:
+        ImportError when ``numpy`` is not installed.
+        :class:`exceptions.QueryError` when the stream reports an error.
+        ValueError when a cell does not match its datatype.
+    """
+
+    numpy = _numpy()
+
+    current = None
+    key = None
+    names = []
+    columns = []
+    count = 0
+
+    def finish():
+        arrays = {}
+        groups = []
+        for name, column in zip(names, columns):
+            arrays[name] = column.buffer[:count]
+            if column.group:
+                groups.append(name)
+        return Table(key[0], key[1], arrays, groups)
+
+    for meta, cells in iter_rows(lines):
+        # The first two columns are always "result" and "table"
+        if meta is not current or cells[0:2] != key[2]:
+            if count:
+                yield finish()
+            current = meta
+            result = cells[0] or meta.defaults[0]
+            table = cells[1] or meta.defaults[1]
+            key = (result, int(table) if table else 0, cells[0:2])
+            names = meta.names[2:]
+            columns = [
+                _Column(numpy, datatype, default, group)
+                for datatype, default, group in zip(
+                    meta.datatypes[2:], meta.defaults[2:], meta.groups[2:]
+                )
+            ]
+            count = 0
+        elif columns and count == len(columns[0].buffer):
+            for column in columns:
+                column.grow()
+
+        for column, cell in zip(columns, cells[2:]):
+            column.buffer[count] = (
+                column.convert(cell) if cell else column.default
+            )
+        count += 1
+
+    if count:
+        yield finish()
+
+
+class Query:
+    """Interface to the InfluxDB query API.
+
+    Parameters:
+        db (influxdb2.core.Influx): Base connection instance.
+
+    """
+
+    def __init__(self, db):
+        self._db = db
+
+    def stream(
+        self,
+        flux: str,
+        org: typing.Optional[str] = None,
+        org_id: typing.Optional[str] = None,
+        columnar: bool = False,
+    ) -> typing.Iterator[typing.Union[typing.Dict[str, typing.Any], Table]]:
+        """Run a Flux query and yield records as they arrive.
+
+        The response is read in chunks of :data:`CHUNK_SIZE` bytes and never
+        held in memory as a whole.  The HTTP request is sent when iteration
+        starts and the connection is released once the iterator is exhausted
+        or closed.
+
+        Parameters:
+            flux: Flux query text.
+            org (str): Optional. Name of the org to run the query as.
+                Defaults to the org the connection was created with.
+            org_id (str): Optional. ID of the org to run the query as.
+                Takes precedence over ``org``.
+            columnar (bool): Default: False. If true yield one
+                :class:`Table` of NumPy arrays per Flux table instead of
+                one dictionary per row.
+
+        Returns:
+            Iterator of record dictionaries or :class:`Table` objects, see
+            the module documentation.
+
+        Raises:
+            ValueError when an incoming parameter is of the incorrect type.
+            ImportError when ``columnar`` is set and ``numpy`` is not
+                installed.
+            :class:`exceptions.QueryError` when the query fails part way.
+            :class:`exceptions.InfluxHTTPError` when a generic HTTP error
+                comes back.
+            :class:`exceptions.InfluxAPIError` when a known error payload
+                returns from the server.
+        """
+
+        class_name = (__name__, __class__.__name__, "stream")
+        if self._db.validation.params:
+            types.ensure_type(class_name, "flux", flux, str)
+            types.ensure_type(class_name, "org", org, (str, type(None)))
+            types.ensure_type(class_name, "org_id", org_id, (str, type(None)))
+            types.ensure_type(class_name, "columnar", columnar, bool)
+        if columnar:
+            _numpy()
+
+        params = {}
+        if org_id:
+            params["orgID"] = org_id
+        elif org or self._db._org:
+            params["org"] = org or self._db._org
+
+        payload = {"query": flux, "type": "flux", "dialect": DIALECT}
+        parser = iter_tables if columnar else iter_records
+        return self._stream(params, payload, parser)
+
+    def _stream(self, params: dict, payload: dict, parser: typing.Callable):
+        rsp = self._db.post(
+            "/api/v2/query",
+            params=params,
+            json=payload,
+            headers={"Accept": "application/csv"},
+            stream=True,
+            idempotent=True,
+            read=True,
+        )
+        try:
+            if rsp.status_code != 200:
+                self._db.api_error(rsp)
+
+            rsp.encoding = "utf-8"
+            lines = iter_lines(
+                rsp.iter_content(CHUNK_SIZE, decode_unicode=True)
+            )
+            yield from parser(lines)
+        finally:
+            rsp.close()
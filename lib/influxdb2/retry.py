@@ -0,0 +1,150 @@
+# Copyright 2021 Hoplite Industries, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Retry policy for HTTP requests.
+
+A :class:`RetryPolicy` handed to :class:`influxdb2.core.Influx` retries
+requests that failed with a retryable status code or a connection error.
+Retries wait with jittered exponential backoff, so clients that failed at
+the same moment do not all come back at the same moment, and honor the
+server's ``Retry-After`` header when one is sent.
+
+Only idempotent requests are retried.  ``GET``, ``HEAD``, ``OPTIONS``,
+``PUT`` and ``DELETE`` are idempotent by default and other requests opt in
+with ``idempotent=True``, which the write and query APIs do.  Writing the
+same line protocol twice leaves the same data behind, so write batches are
+safe to retry.
+"""
+
+import email.utils
+import random
+import time
+import typing
+
+# Local imports
+from . import types
+
+IDEMPOTENT_METHODS = frozenset(["get", "head", "options", "put", "delete"])
+"""HTTP methods that are retried without an explicit opt in."""
+
+RETRY_STATUSES = frozenset([429, 503])
+"""HTTP status codes that are retried by default."""
+
+
+def parse_retry_after(value: typing.Optional[str]) -> typing.Optional[float]:
+    """Parse a ``Retry-After`` header.
+
+    Parameters:
+        value: Header value, either a number of seconds or an HTTP date.
+
+    Returns:
+        Number of seconds to wait, or ``None`` if the value is missing or
+        can not be parsed.
+    """
+
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(when.timestamp() - time.time(), 0.0)
+
+
+class RetryPolicy:
+    """Describe how failed requests are retried.
+
+    Parameters:
+        retries (int): Default 3. Maximum number of retries for a single
+            request.
+        backoff (float): Default 0.5. Base delay in seconds.  The delay
+            before retry ``n`` is drawn uniformly from 0 to
+            ``backoff * 2 ** n``.
+        max_backoff (float): Default 30.0. Upper bound for a single delay
+            in seconds.  A ``Retry-After`` asking for longer stops retrying
+            rather than coming back early.
+        deadline (float): Optional. Seconds after which no further retry of
+            a request is started, counted from its first attempt.
+        statuses: Default :data:`RETRY_STATUSES`. HTTP status codes to retry.
+
+    """
+
+    def __init__(
+        self,
+        retries: int = 3,
+        backoff: float = 0.5,
+        max_backoff: float = 30.0,
+        deadline: typing.Optional[float] = None,
+        statuses: typing.Iterable[int] = RETRY_STATUSES,
+    ):
+        class_name = "%s.%s" % (__name__, __class__.__name__)
+        types.ensure_type(class_name, "retries", retries, int)
+        types.ensure_type(class_name, "backoff", backoff, (int, float))
+        types.ensure_type(class_name, "max_backoff", max_backoff, (int, float))
+        types.ensure_type(
+            class_name, "deadline", deadline, (int, float, type(None))
+        )
+        if retries < 0 or backoff < 0 or max_backoff < 0:
+            raise ValueError(
+                "%s 'retries', 'backoff' and 'max_backoff' must not be "
+                "negative" % class_name
+            )
+
+        self.retries = retries
+        self.backoff = float(backoff)
+        self.max_backoff = float(max_backoff)
+        self.deadline = deadline
+        self.statuses = frozenset(statuses)
+
+    def delay(
+        self, attempt: int, retry_after: typing.Optional[float] = None
+    ) -> float:
+        """Seconds to wait before a retry.
+
+        Parameters:
+            attempt: Number of the retry about to be made, starting at 0.
+            retry_after: Optional. Delay asked for by the server.
+
+        Returns:
+            Number of seconds to sleep.
+        """
+
+        ceiling = min(self.max_backoff, self.backoff * (2**attempt))
+        jitter = random.uniform(0, ceiling)
+        if retry_after is not None:
+            # Spread clients told the same Retry-After over one backoff step
+            return retry_after + jitter / 2
+        return jitter
+
+    def allows(self, attempt: int, started: float, delay: float) -> bool:
+        """Whether another retry may be made.
+
+        Parameters:
+            attempt: Number of the retry about to be made, starting at 0.
+            started: ``time.monotonic()`` of the first attempt.
+            delay: Seconds that would be slept before the retry.
+
+        Returns:
+            ``True`` if the retry budget and deadline allow it.
+        """
+
+        if attempt >= self.retries or delay > self.max_backoff:
+            return False
+        if self.deadline is None:
+            return True
+        return time.monotonic() - started + delay < self.deadline
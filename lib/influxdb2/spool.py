@@ -0,0 +1,449 @@
+# Copyright 2021 Hoplite Industries, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Durable on-disk spool for write batches.
+
+When a connection is created with a :class:`Spool`, write batches that fail
+because the server can not be reached or answers with a 5xx status are
+appended to segment files in the spool directory instead of being lost.
+While anything is spooled new batches are appended behind it, so points
+reach the server in the order they were written.
+
+A :class:`Replayer` thread started by the connection polls ``/health``
+every ``retry_interval`` seconds while the spool holds data, and once the
+server passes sends the spooled batches oldest first.  Segments are read
+through ``mmap`` and deleted once every batch in them was sent.  A crash
+during replay sends the current segment again from its start, which is
+harmless since writing the same line protocol twice stores the same data.
+
+.. code-block:: python
+
+    db = influxdb2.connect(
+        "https://localhost:8086",
+        token,
+        org="example",
+        spool=influxdb2.spool.Spool("/var/spool/myagent", max_bytes=2**30),
+    )
+
+Each record in a segment is a 12 byte header of the CRC32 of the payload,
+the length of the query parameters and the length of the body, followed by
+the URL encoded ``/api/v2/write`` query parameters and the line protocol.
+"""
+
+import logging
+import mmap
+import os
+import re
+import struct
+import threading
+import typing
+import urllib.parse
+import zlib
+
+# Local imports
+from . import exceptions
+from . import types
+
+logging.getLogger(__name__).addHandler(logging.NullHandler())
+
+HEADER = struct.Struct("!III")
+"""Record header: CRC32 of the payload, parameter bytes and body bytes."""
+
+SEGMENT_REGEX = re.compile(r"^(\d{16})\.seg$")
+"""Matches segment file names in a spool directory."""
+
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024
+"""Default maximum size of a spool on disk."""
+
+DEFAULT_SEGMENT_BYTES = 16 * 1024 * 1024
+"""Default size at which a new segment file is started."""
+
+
+def spoolable(err: exceptions.InfluxError) -> bool:
+    """Tell if a failed write should be spooled and retried later.
+
+    Parameters:
+        err: Exception raised while sending a batch.
+
+    Returns:
+        ``True`` for network errors and 5xx responses.
+    """
+
+    if isinstance(err, exceptions.NetworkError):
+        return True
+    if isinstance(
+        err, (exceptions.InfluxHTTPError, exceptions.InfluxAPIError)
+    ):
+        return err.status >= 500
+    return False
+
+
+class Spool:  # pylint: disable=R0902
+    """Append only segment files holding write batches.
+
+    Parameters:
+        directory (str): Directory the segment files are kept in.  It is
+            created if missing, and segments left by an earlier process are
+            picked up for replay.
+        max_bytes (int): Default 1GiB. Maximum size of all segments.
+        segment_bytes (int): Default 16MiB. Size at which the current
+            segment is closed and a new one started.
+        drop_oldest (bool): Default True. When a batch does not fit under
+            ``max_bytes`` discard the oldest segments to make room.  If
+            false :class:`exceptions.QueueFull` is raised instead.
+        retry_interval (float): Default 5.0. Seconds between health checks
+            while the spool holds data.
+        fsync (bool): Default False. Call ``fsync`` after every batch so
+            spooled batches survive a power loss, not just a crash.
+
+    """
+
+    def __init__(  # pylint: disable=R0913
+        self,
+        directory: str,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        segment_bytes: int = DEFAULT_SEGMENT_BYTES,
+        drop_oldest: bool = True,
+        retry_interval: float = 5.0,
+        fsync: bool = False,
+    ):
+        class_name = (__name__, __class__.__name__)
+        types.ensure_type(class_name, "directory", directory, str)
+        types.ensure_type(class_name, "max_bytes", max_bytes, int)
+        types.ensure_type(class_name, "segment_bytes", segment_bytes, int)
+        types.ensure_type(
+            class_name, "retry_interval", retry_interval, (int, float)
+        )
+        if max_bytes < 1 or segment_bytes < 1 or retry_interval <= 0:
+            raise ValueError(
+                "%s 'max_bytes', 'segment_bytes' and 'retry_interval' must "
+                "be positive" % types.source_name(class_name)
+            )
+
+        self._dir = directory
+        self._max_bytes = max_bytes
+        self._segment_bytes = segment_bytes
+        self._drop_oldest = drop_oldest
+        self._fsync = fsync
+        self.retry_interval = float(retry_interval)
+
+        self._cond = threading.Condition()
+        self._active = None
+        self._interrupted = False
+        self._dropped = 0
+
+        os.makedirs(directory, exist_ok=True)
+        # Segment path to size in bytes, oldest first
+        self._segments = {}
+        self._next = 0
+        for name in sorted(os.listdir(directory)):
+            match = SEGMENT_REGEX.match(name)
+            if match:
+                path = os.path.join(directory, name)
+                self._segments[path] = os.path.getsize(path)
+                self._next = int(match.group(1)) + 1
+        self._size = sum(self._segments.values())
+
+    @property
+    def directory(self) -> str:
+        """Directory holding the segment files."""
+        return self._dir
+
+    @property
+    def pending(self) -> int:
+        """Number of bytes spooled and not yet replayed."""
+        return self._size
+
+    @property
+    def dropped(self) -> int:
+        """Number of spooled bytes discarded to stay under ``max_bytes``."""
+        return self._dropped
+
+    def append(self, params: dict, body: bytes):
+        """Spool one batch.
+
+        Parameters:
+            params: Query string parameters for ``/api/v2/write``.
+            body: Newline separated line protocol.
+
+        Raises:
+            :class:`exceptions.QueueFull` when the batch does not fit.
+        """
+
+        query = urllib.parse.urlencode(sorted(params.items())).encode("ascii")
+        payload = query + body
+        record = HEADER.pack(zlib.crc32(payload), len(query), len(body))
+        length = len(record) + len(payload)
+
+        with self._cond:
+            if length > self._max_bytes:
+                raise exceptions.QueueFull(
+                    "Batch of %d bytes is larger than the spool" % length
+                )
+            while self._size + length > self._max_bytes:
+                if not self._drop_oldest:
+                    raise exceptions.QueueFull(
+                        "Spool is full (%d bytes)" % self._max_bytes
+                    )
+                self._drop()
+
+            if self._active is None or (
+                self._segments[self._active.name] >= self._segment_bytes
+            ):
+                self._roll()
+            self._active.write(record)
+            self._active.write(payload)
+            self._active.flush()
+            if self._fsync:
+                os.fsync(self._active.fileno())
+            self._segments[self._active.name] += length
+            self._size += length
+            self._cond.notify_all()
+
+    def _roll(self):
+        # Called with the lock held
+        self._seal()
+        path = os.path.join(self._dir, "%016d.seg" % self._next)
+        self._next += 1
+        self._active = open(path, "ab")  # pylint: disable=R1732
+        self._segments[path] = 0
+
+    def _seal(self):
+        # Called with the lock held
+        if self._active is not None:
+            self._active.close()
+            self._active = None
+
+    def _drop(self):
+        # Called with the lock held
+        log = logging.getLogger("%s.%s._drop" % (__name__, __class__.__name__))
+        path = next(iter(self._segments))
+        if self._active is not None and self._active.name == path:
+            self._seal()
+        size = self._segments.pop(path)
+        self._size -= size
+        self._dropped += size
+        log.warning("Spool full, dropping %d bytes in %s", size, path)
+        try:
+            os.unlink(path)
+        except OSError as err:
+            log.error("Unable to remove segment %s: %s", path, err)
+
+    def segments(self) -> typing.List[str]:
+        """Close the current segment and list every segment.
+
+        Batches spooled after this call go to a new segment, so the listed
+        segments can be read without racing writers.
+
+        Returns:
+            Paths of the segment files, oldest first.
+        """
+
+        with self._cond:
+            self._seal()
+            return list(self._segments)
+
+    def read(
+        self, path: str, offset: int = 0
+    ) -> typing.Iterator[typing.Tuple[int, dict, bytes]]:
+        """Read the batches in a closed segment.
+
+        The segment is memory mapped and read front to back, so the kernel
+        can read ahead in large sequential chunks.  Reading stops at a
+        truncated or corrupt record, such as one left by a crash.
+
+        Parameters:
+            path: Segment file from :meth:`segments`.
+            offset (int): Default 0. Byte offset of the first record.
+
+        Returns:
+            Iterator of ``(end offset, params, body)`` tuples.
+        """
+
+        log = logging.getLogger("%s.%s.read" % (__name__, __class__.__name__))
+        try:
+            handle = open(path, "rb")  # pylint: disable=R1732
+        except FileNotFoundError:
+            return
+        with handle:
+            size = os.fstat(handle.fileno()).st_size
+            if size <= offset:
+                return
+            with mmap.mmap(
+                handle.fileno(), 0, access=mmap.ACCESS_READ
+            ) as mapped:
+                if hasattr(mmap, "MADV_SEQUENTIAL"):
+                    mapped.madvise(mmap.MADV_SEQUENTIAL)
+                while offset + HEADER.size <= size:
+                    crc, query_len, body_len = HEADER.unpack_from(
+                        mapped, offset
+                    )
+                    start = offset + HEADER.size
+                    end = start + query_len + body_len
+                    if end > size:
+                        log.warning("Truncated record in %s", path)
+                        return
+                    payload = mapped[start:end]
+                    if zlib.crc32(payload) != crc:
+                        log.warning("Corrupt record in %s", path)
+                        return
+                    params = dict(
+                        urllib.parse.parse_qsl(
+                            payload[:query_len].decode("ascii")
+                        )
+                    )
+                    yield end, params, payload[query_len:]
+                    offset = end
+            if offset < size:
+                log.warning(
+                    "Skipping %d unreadable bytes in %s", size - offset, path
+                )
+
+    def remove(self, path: str):
+        """Delete a segment whose batches were all sent.
+
+        Parameters:
+            path: Segment file from :meth:`segments`.
+        """
+
+        log = logging.getLogger(
+            "%s.%s.remove" % (__name__, __class__.__name__)
+        )
+        with self._cond:
+            size = self._segments.pop(path, None)
+            if size is None:
+                # Already dropped to make room
+                return
+            self._size -= size
+            try:
+                os.unlink(path)
+            except OSError as err:
+                log.error("Unable to remove segment %s: %s", path, err)
+            self._cond.notify_all()
+
+    def wait(self, timeout: typing.Optional[float] = None) -> bool:
+        """Wait for the spool to hold data.
+
+        Parameters:
+            timeout (float): Optional. Maximum number of seconds to wait.
+
+        Returns:
+            ``True`` if anything is spooled.
+        """
+
+        with self._cond:
+            self._cond.wait_for(
+                lambda: self._size or self._interrupted, timeout
+            )
+            self._interrupted = False
+            return bool(self._size)
+
+    def interrupt(self):
+        """Wake threads blocked in :meth:`wait`."""
+        with self._cond:
+            self._interrupted = True
+            self._cond.notify_all()
+
+    def close(self):
+        """Close the current segment.  Spooled data stays on disk."""
+        with self._cond:
+            self._seal()
+
+
+class Replayer:
+    """Background thread sending spooled batches once the server is back.
+
+    Normally created by :class:`influxdb2.core.Influx` when given a spool.
+
+    Parameters:
+        db (influxdb2.core.Influx): Base connection instance.
+        spool (Spool): Spool to drain.
+
+    """
+
+    def __init__(self, db, spool: Spool):
+        self._db = db
+        self._spool = spool
+        self._stopped = threading.Event()
+        # Segment and offset reached before the last failed replay
+        self._position = (None, 0)
+        self._thread = threading.Thread(
+            target=self._run, name="influxdb2-spool-replayer", daemon=True
+        )
+
+    def start(self) -> "Replayer":
+        """Start the background thread."""
+        self._thread.start()
+        return self
+
+    def stop(self, timeout: typing.Optional[float] = None):
+        """Stop the background thread.
+
+        Parameters:
+            timeout (float): Optional. Maximum number of seconds to wait for
+                a replay in progress to finish its current batch.
+        """
+
+        self._stopped.set()
+        self._spool.interrupt()
+        if self._thread.is_alive():
+            self._thread.join(timeout)
+
+    def replay(self) -> bool:
+        """Send spooled batches, oldest first.
+
+        Batches rejected with a status below 500, such as malformed line
+        protocol, are logged and discarded since sending them again can not
+        succeed.
+
+        Returns:
+            ``True`` when the spool was emptied, ``False`` when the server
+            failed again or the replayer was stopped.
+        """
+
+        log = logging.getLogger(
+            "%s.%s.replay" % (__name__, __class__.__name__)
+        )
+
+        while not self._stopped.is_set():
+            segments = self._spool.segments()
+            if not segments:
+                return True
+            for path in segments:
+                offset = self._position[1] if self._position[0] == path else 0
+                for end, params, body in self._spool.read(path, offset):
+                    if self._stopped.is_set():
+                        self._position = (path, offset)
+                        return False
+                    try:
+                        self._db.write.send(params, body, spool=False)
+                    except exceptions.InfluxError as err:
+                        if spoolable(err):
+                            self._position = (path, offset)
+                            log.info("Replay paused: %s", err)
+                            return False
+                        log.error("Dropping spooled batch: %s", err)
+                    offset = end
+                self._spool.remove(path)
+                self._position = (None, 0)
+        return False
+
+    def _run(self):
+        interval = self._spool.retry_interval
+        while not self._stopped.is_set():
+            if not self._spool.wait(interval):
+                continue
+            if self._db.health() and self.replay():
+                continue
+            self._stopped.wait(interval)
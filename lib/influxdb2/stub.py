@@ -0,0 +1,443 @@
+# Copyright 2021 Hoplite Industries, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""In-process stand in for an InfluxDB server.
+
+:class:`StubServer` answers the ``/api/v2/orgs`` family of endpoints and
+``/health`` from memory, on a local port, in background threads.  Latency,
+failed requests and the largest page the server returns can be set, so the
+pooling, pagination and retry behavior of the client can be exercised
+without a real server.  See :mod:`influxdb2.loadtest` for a load generator
+built on it.
+
+.. code-block:: python
+
+    with influxdb2.stub.StubServer(orgs=250, latency=0.002) as server:
+        db = influxdb2.connect(server.url, server.token)
+        print(len(list(db.orgs.iterate())))
+"""
+
+import argparse
+import datetime
+import http.server
+import json
+import random
+import re
+import sys
+import threading
+import time
+import typing
+import urllib.parse
+
+ORG_PATH = re.compile("^/api/v2/orgs/([a-f0-9]{16})(/secrets(/delete)?)?$")
+
+
+def _now() -> str:
+    return datetime.datetime.now(datetime.timezone.utc).strftime(
+        "%Y-%m-%dT%H:%M:%S.%fZ"
+    )
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "influxdb2-stub"
+    # Headers and body are written separately, Nagle would hold the body
+    disable_nagle_algorithm = True
+
+    def log_message(self, *args):  # pylint: disable=W0221
+        pass
+
+    def _reply(self, status: int, body: typing.Any = None, headers=None):
+        data = b"" if body is None else json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        if data:
+            self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _error(self, status: int, code: str, message: str):
+        self._reply(status, {"code": code, "message": message})
+
+    def _body(self) -> typing.Any:
+        length = int(self.headers.get("Content-Length") or 0)
+        data = self.rfile.read(length) if length else b""
+        return json.loads(data) if data else None
+
+    def _handle(self, method: str):
+        stub = self.server.stub
+        url = urllib.parse.urlsplit(self.path)
+        query = dict(urllib.parse.parse_qsl(url.query))
+        # Read the body first so keep-alive connections stay in sync
+        try:
+            body = self._body()
+        except ValueError:
+            self._error(400, "invalid", "invalid json")
+            return
+
+        stub.count()
+        if stub.latency:
+            time.sleep(stub.latency + random.uniform(0, stub.jitter))
+        failure = stub.failure()
+        if failure is not None:
+            status, retry_after = failure
+            headers = {}
+            if retry_after is not None:
+                headers["Retry-After"] = str(retry_after)
+            self._reply(
+                status,
+                {"code": "unavailable", "message": "injected failure"},
+                headers,
+            )
+            return
+
+        if url.path == "/health":
+            self._reply(200, {"name": "influxdb", "status": "pass"})
+            return
+        if stub.token and self.headers.get("Authorization") != (
+            "Token %s" % stub.token
+        ):
+            self._error(401, "unauthorized", "unauthorized access")
+            return
+
+        if url.path == "/api/v2/orgs":
+            if method == "GET":
+                self._reply(200, stub.list_orgs(query))
+                return
+            if method == "POST":
+                self._reply(*stub.create_org(body))
+                return
+
+        match = ORG_PATH.match(url.path)
+        if match:
+            org_id, secrets, delete = match.groups()
+            if delete and method == "POST":
+                self._reply(*stub.delete_secrets(org_id, body))
+                return
+            if secrets and not delete:
+                if method == "GET":
+                    self._reply(*stub.get_secrets(org_id))
+                    return
+                if method == "PATCH":
+                    self._reply(*stub.patch_secrets(org_id, body))
+                    return
+            if not secrets:
+                if method == "GET":
+                    self._reply(*stub.get_org(org_id))
+                    return
+                if method == "PATCH":
+                    self._reply(*stub.update_org(org_id, body))
+                    return
+                if method == "DELETE":
+                    self._reply(*stub.delete_org(org_id))
+                    return
+
+        self._error(404, "not found", "path not found")
+
+    def do_GET(self):  # pylint: disable=C0103
+        self._handle("GET")
+
+    def do_POST(self):  # pylint: disable=C0103
+        self._handle("POST")
+
+    def do_PATCH(self):  # pylint: disable=C0103
+        self._handle("PATCH")
+
+    def do_DELETE(self):  # pylint: disable=C0103
+        self._handle("DELETE")
+
+
+class StubServer:  # pylint: disable=R0902
+    """Fake InfluxDB server for the orgs API.
+
+    Parameters:
+        orgs (int): Default 0. Number of orgs created at start, named
+            ``org-0`` and up.
+        latency (float): Default 0. Seconds every request is delayed.
+        jitter (float): Default 0. Up to this many more seconds are added
+            to ``latency`` at random.
+        error_rate (float): Default 0. Fraction of requests, 0 to 1, that
+            fail with ``error_status``.
+        error_status (int): Default 503. Status code of injected failures.
+        retry_after (int): *Optional* ``Retry-After`` seconds sent with
+            injected failures.
+        max_page_size (int): *Optional* Largest number of orgs returned by
+            one list request, whatever ``limit`` asks for.
+        token (str): Default ``"stub-token"``. Token clients must send.
+            ``None`` accepts any client.
+        host (str): Default ``"127.0.0.1"``. Address to listen on.
+        port (int): Default 0. Port to listen on, 0 picks a free one.
+        seed (int): *Optional* Seed for the error injection.
+
+    """
+
+    def __init__(  # pylint: disable=R0913
+        self,
+        orgs: int = 0,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        retry_after: typing.Optional[int] = None,
+        max_page_size: typing.Optional[int] = None,
+        token: typing.Optional[str] = "stub-token",
+        host: str = "127.0.0.1",
+        port: int = 0,
+        seed: typing.Optional[int] = None,
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.retry_after = retry_after
+        self.max_page_size = max_page_size
+        self.token = token
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._orgs = {}
+        self._secrets = {}
+        self._next_id = 1
+        self._fail_next = []
+        self._requests = 0
+
+        for idx in range(orgs):
+            self.create_org({"name": "org-%d" % idx})
+
+        self._httpd = http.server.ThreadingHTTPServer((host, port), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.stub = self
+        self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+    @property
+    def url(self) -> str:
+        """Base URL of the server."""
+        host, port = self._httpd.server_address[:2]
+        return "http://%s:%d" % (host, port)
+
+    @property
+    def requests(self) -> int:
+        """Number of requests received."""
+        return self._requests
+
+    def start(self) -> "StubServer":
+        """Start serving in a background thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._httpd.serve_forever,
+                name="influxdb2-stub",
+                daemon=True,
+            )
+            self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving and close the listening socket."""
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def fail_next(
+        self,
+        count: int = 1,
+        status: int = 503,
+        retry_after: typing.Optional[int] = None,
+    ):
+        """Fail the next ``count`` requests, whatever ``error_rate`` is."""
+        with self._lock:
+            self._fail_next.extend([(status, retry_after)] * count)
+
+    def count(self):
+        """Count a received request."""
+        with self._lock:
+            self._requests += 1
+
+    def failure(self) -> typing.Optional[typing.Tuple[int, typing.Any]]:
+        """Status and ``Retry-After`` of an injected failure, if any."""
+        with self._lock:
+            if self._fail_next:
+                return self._fail_next.pop(0)
+            if self.error_rate and self._random.random() < self.error_rate:
+                return self.error_status, self.retry_after
+        return None
+
+    def _org_payload(self, org: dict) -> dict:
+        org_id = org["id"]
+        return dict(
+            org,
+            links={
+                "self": "/api/v2/orgs/%s" % org_id,
+                "secrets": "/api/v2/orgs/%s/secrets" % org_id,
+                "buckets": "/api/v2/buckets?org=%s" % org["name"],
+            },
+        )
+
+    def list_orgs(self, query: dict) -> dict:
+        """Body of a ``GET /api/v2/orgs``."""
+        offset = int(query.get("offset", 0))
+        limit = int(query.get("limit", 20))
+        if self.max_page_size:
+            limit = min(limit, self.max_page_size)
+        with self._lock:
+            orgs = sorted(self._orgs.values(), key=lambda org: org["name"])
+        if query.get("descending") in ("true", "True"):
+            orgs.reverse()
+        if "org" in query:
+            orgs = [org for org in orgs if org["name"] == query["org"]]
+        if "orgID" in query:
+            orgs = [org for org in orgs if org["id"] == query["orgID"]]
+        page = orgs[offset : offset + limit]
+        return {
+            "links": {"self": "/api/v2/orgs"},
+            "orgs": [self._org_payload(org) for org in page],
+        }
+
+    def create_org(self, body: typing.Any) -> typing.Tuple[int, dict]:
+        """Status and body of a ``POST /api/v2/orgs``."""
+        if not isinstance(body, dict) or not body.get("name"):
+            return 400, {"code": "invalid", "message": "name is required"}
+        with self._lock:
+            if any(org["name"] == body["name"] for org in self._orgs.values()):
+                return 422, {
+                    "code": "conflict",
+                    "message": "organization with name %s already exists"
+                    % body["name"],
+                }
+            org_id = "%016x" % self._next_id
+            self._next_id += 1
+            now = _now()
+            org = {
+                "id": org_id,
+                "name": body["name"],
+                "description": body.get("description") or "",
+                "createdAt": now,
+                "updatedAt": now,
+                "status": "active",
+            }
+            self._orgs[org_id] = org
+            self._secrets[org_id] = {}
+        return 201, self._org_payload(org)
+
+    def get_org(self, org_id: str) -> typing.Tuple[int, dict]:
+        """Status and body of a ``GET /api/v2/orgs/{id}``."""
+        with self._lock:
+            org = self._orgs.get(org_id)
+        if org is None:
+            return 404, {"code": "not found", "message": "org not found"}
+        return 200, self._org_payload(org)
+
+    def update_org(
+        self, org_id: str, body: typing.Any
+    ) -> typing.Tuple[int, dict]:
+        """Status and body of a ``PATCH /api/v2/orgs/{id}``."""
+        with self._lock:
+            org = self._orgs.get(org_id)
+            if org is None:
+                return 404, {"code": "not found", "message": "org not found"}
+            for key in ("name", "description"):
+                if isinstance(body, dict) and body.get(key) is not None:
+                    org[key] = body[key]
+            org["updatedAt"] = _now()
+        return 200, self._org_payload(org)
+
+    def delete_org(self, org_id: str) -> typing.Tuple[int, typing.Any]:
+        """Status and body of a ``DELETE /api/v2/orgs/{id}``."""
+        with self._lock:
+            if self._orgs.pop(org_id, None) is None:
+                return 404, {"code": "not found", "message": "org not found"}
+            self._secrets.pop(org_id, None)
+        return 204, None
+
+    def get_secrets(self, org_id: str) -> typing.Tuple[int, dict]:
+        """Status and body of a ``GET /api/v2/orgs/{id}/secrets``."""
+        with self._lock:
+            secrets = self._secrets.get(org_id)
+            if secrets is None:
+                return 404, {"code": "not found", "message": "org not found"}
+            return 200, {"secrets": sorted(secrets)}
+
+    def patch_secrets(
+        self, org_id: str, body: typing.Any
+    ) -> typing.Tuple[int, typing.Any]:
+        """Status and body of a ``PATCH /api/v2/orgs/{id}/secrets``."""
+        with self._lock:
+            secrets = self._secrets.get(org_id)
+            if secrets is None:
+                return 404, {"code": "not found", "message": "org not found"}
+            secrets.update(body or {})
+        return 204, None
+
+    def delete_secrets(
+        self, org_id: str, body: typing.Any
+    ) -> typing.Tuple[int, typing.Any]:
+        """Status and body of a ``POST /api/v2/orgs/{id}/secrets/delete``."""
+        with self._lock:
+            secrets = self._secrets.get(org_id)
+            if secrets is None:
+                return 404, {"code": "not found", "message": "org not found"}
+            for key in (body or {}).get("secrets", []):
+                secrets.pop(key, None)
+        return 204, None
+
+
+def main(argv: typing.Optional[typing.List[str]] = None) -> int:
+    """Command line entry point serving a stub until interrupted."""
+
+    parser = argparse.ArgumentParser(description="Fake InfluxDB orgs API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8086)
+    parser.add_argument("--token", default="stub-token")
+    parser.add_argument("--orgs", type=int, default=250)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--retry-after", type=int)
+    parser.add_argument("--max-page-size", type=int)
+    args = parser.parse_args(argv)
+
+    server = StubServer(
+        orgs=args.orgs,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        retry_after=args.retry_after,
+        max_page_size=args.max_page_size,
+        token=args.token,
+        host=args.host,
+        port=args.port,
+    )
+    print("Serving on %s" % server.url)
+    try:
+        server._httpd.serve_forever()  # pylint: disable=W0212
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -30,9 +30,50 @@ TimeVal = typing.TypeVar("TimeVal", str, int, float)
 ID_REGEX = re.compile("^[a-f0-9]{16}$")
 """Regex to validate a string is a syntactically valid ID in InfluxDB."""
 
+Source = typing.Union[str, typing.Tuple[str, ...]]
+"""Name of the function doing a check.
+
+A tuple of name parts is only joined with ``.`` when a check fails, which
+saves formatting the name on every call.
+"""
+
+
+class Validation(enum.Enum):
+    """How much checking the API modules do.
+
+    The level is chosen per connection with the ``validation`` argument of
+    :class:`influxdb2.core.Influx`.
+    """
+
+    STRICT = "strict"
+    """Check parameters passed to public methods and every object decoded
+    from the server."""
+
+    PUBLIC_ONLY = "public-only"
+    """Check parameters passed to public methods.  Server responses and
+    parameters the library builds itself are trusted."""
+
+    OFF = "off"
+    """Skip the checks.  Malformed input surfaces as server errors."""
+
+    @property
+    def params(self) -> bool:
+        """Whether parameters of public methods are checked."""
+        return self is not Validation.OFF
+
+    @property
+    def responses(self) -> bool:
+        """Whether objects decoded from the server are checked."""
+        return self is Validation.STRICT
+
+
+def source_name(src: Source) -> str:
+    """Format a :data:`Source` for an error message."""
+    return src if isinstance(src, str) else ".".join(src)
+
 
 def ensure_type(
-    src: str,
+    src: Source,
     name: str,
     value: typing.Any,
     obj_type: typing.Type[typing.Union[typing.Any, typing.Tuple[type, type]]],
@@ -40,7 +81,7 @@ def ensure_type(
     """Ensure the type cast of an object.
 
     Parameters:
-        src: Source function name.
+        src: Source function name, see :data:`Source`.
         name: Variable name for the object in ``value``.
         value: Object to ensure the type of.
         obj_type: Type of object that value must be.  This may be a tuple of
@@ -53,19 +94,19 @@ def ensure_type(
     if not isinstance(value, obj_type):
         raise ValueError(
             "%s '%s' must be of type(s) %s not: '%s'"
-            % (src, name, repr(obj_type), type(value))
+            % (source_name(src), name, repr(obj_type), type(value))
         )
 
 
 def ensure_id(
-    src: str,
+    src: Source,
     name: str,
     value: str,
 ):
     """Ensure a variable is a syntactically valid id within InfluxDB
 
     Parameters:
-        src: Source function name.
+        src: Source function name, see :data:`Source`.
         name: Variable name for the id in ``value``.
         value: Object to validate that it's of the correct ID syntax.
 
@@ -76,9 +117,10 @@ def ensure_id(
     if not isinstance(value, str):
         raise ValueError(
             "%s '%s' must be of type 'str' not: '%s'"
-            % (src, name, type(value))
+            % (source_name(src), name, type(value))
         )
     if not ID_REGEX.match(value):
         raise ValueError(
-            "%s '%s' does not match ID syntax (16 digit hex)" % (src, name)
+            "%s '%s' does not match ID syntax (16 digit hex)"
+            % (source_name(src), name)
         )
@@ -0,0 +1,613 @@
+# Copyright 2021 Hoplite Industries, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Write API.
+
+Encode points to line protocol and send them to InfluxDB in batches.
+"""
+
+import atexit
+import collections
+import logging
+import threading
+import time
+import typing
+import weakref
+
+# 3rd party
+
+# Local imports
+from . import exceptions
+from . import lineproto
+from . import spool as spoollib
+from . import types
+
+logging.getLogger(__name__).addHandler(logging.NullHandler())
+
+DEFAULT_BATCH_SIZE = 5000
+"""Default maximum number of points sent in a single request."""
+
+DEFAULT_BATCH_BYTES = 4 * 1024 * 1024
+"""Default maximum number of bytes of line protocol in a single request."""
+
+OVERFLOW_BLOCK = "block"
+"""Queue overflow policy: wait for room in the queue."""
+
+OVERFLOW_DROP_OLDEST = "drop-oldest"
+"""Queue overflow policy: discard the oldest queued point."""
+
+OVERFLOW_RAISE = "raise"
+"""Queue overflow policy: raise :class:`exceptions.QueueFull`."""
+
+OVERFLOW_POLICIES = (OVERFLOW_BLOCK, OVERFLOW_DROP_OLDEST, OVERFLOW_RAISE)
+
+# Batchers still open, closed at interpreter exit.  Held weakly so a
+# closed batcher is not kept alive until exit.
+_OPEN_BATCHERS = weakref.WeakSet()
+
+
+@atexit.register
+def _close_batchers():
+    for batcher in list(_OPEN_BATCHERS):
+        batcher.close()
+
+
+def batches(
+    lines: typing.Iterable[bytes],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    batch_bytes: int = DEFAULT_BATCH_BYTES,
+) -> typing.Iterator[typing.Tuple[int, bytes]]:
+    """Group encoded lines into request bodies.
+
+    A batch is closed once it holds ``batch_size`` lines or adding the next
+    line would take it over ``batch_bytes``.  A single line larger than
+    ``batch_bytes`` is sent on its own.
+
+    Parameters:
+        lines: Iterable of encoded lines without trailing newlines.
+        batch_size: Maximum number of lines in a batch.
+        batch_bytes: Maximum size of a batch body in bytes.
+
+    Returns:
+        Iterator of ``(line count, body)`` tuples.
+    """
+
+    batch = []
+    size = 0
+    for line in lines:
+        length = len(line) + 1
+        if batch and (len(batch) >= batch_size or size + length > batch_bytes):
+            yield len(batch), b"\n".join(batch)
+            batch = []
+            size = 0
+        batch.append(line)
+        size += length
+
+    if batch:
+        yield len(batch), b"\n".join(batch)
+
+
+class Writer:
+    """Interface to the InfluxDB write API.
+
+    Parameters:
+        db (influxdb2.core.Influx): Base connection instance.
+
+    """
+
+    def __init__(self, db):
+        self._db = db
+
+    def _params(
+        self,
+        bucket: str,
+        org: typing.Optional[str],
+        org_id: typing.Optional[str],
+        precision: str,
+    ) -> dict:
+        class_name = (__name__, __class__.__name__, "points")
+        if self._db.validation.params:
+            types.ensure_type(class_name, "bucket", bucket, str)
+            types.ensure_type(class_name, "org", org, (str, type(None)))
+            types.ensure_type(class_name, "org_id", org_id, (str, type(None)))
+        if precision not in lineproto.PRECISIONS:
+            raise ValueError(
+                "%s 'precision' must be one of %s not: %r"
+                % (
+                    types.source_name(class_name),
+                    sorted(lineproto.PRECISIONS),
+                    precision,
+                )
+            )
+
+        params = {"bucket": bucket, "precision": precision}
+        if org_id:
+            params["orgID"] = org_id
+        elif org or self._db._org:
+            params["org"] = org or self._db._org
+        else:
+            raise ValueError(
+                "%s either 'org' or 'org_id' must be given"
+                % types.source_name(class_name)
+            )
+        return params
+
+    def send(self, params: dict, body: bytes, spool: bool = True):
+        """Send one already encoded batch to the server.
+
+        When the connection has a :class:`influxdb2.spool.Spool`, batches
+        failing with a network error or 5xx status are spooled instead of
+        raising, and while anything is spooled new batches are spooled
+        behind it.
+
+        Parameters:
+            params: Query string parameters for ``/api/v2/write``.
+            body: Newline separated line protocol.
+            spool (bool): Default True. Use the connection's spool, if any.
+                The spool replayer sends with this false.
+
+        Raises:
+            :class:`exceptions.InfluxHTTPError` when a generic HTTP error
+                comes back.
+            :class:`exceptions.InfluxAPIError` when a known error payload
+                returns from the server.
+            :class:`exceptions.QueueFull` when the spool is full.
+        """
+
+        target = self._db._spool if spool else None
+        if target is not None and target.pending:
+            # Keep batches in order behind the ones waiting for replay
+            target.append(params, body)
+            return
+
+        try:
+            rsp = self._db.post(
+                "/api/v2/write",
+                params=params,
+                data=body,
+                headers={"Content-Type": "text/plain; charset=utf-8"},
+                idempotent=True,
+            )
+            if rsp.status_code != 204:
+                self._db.api_error(rsp)
+        except exceptions.InfluxError as err:
+            if target is None or not spoollib.spoolable(err):
+                raise
+            logging.getLogger(
+                "%s.%s.send" % (__name__, __class__.__name__)
+            ).warning("Spooling %d byte batch: %s", len(body), err)
+            target.append(params, body)
+
+    def points(
+        self,
+        bucket: str,
+        points: typing.Iterable[typing.Any],
+        org: typing.Optional[str] = None,
+        org_id: typing.Optional[str] = None,
+        precision: str = "ns",
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        batch_bytes: int = DEFAULT_BATCH_BYTES,
+    ) -> int:
+        """Write points to a bucket.
+
+        Points are encoded as they are consumed from ``points`` and sent as
+        soon as a batch fills, so a generator of points is never held in
+        memory all at once.
+
+        Parameters:
+            bucket: Name of the bucket to write to.
+            points: Iterable of points.  See :mod:`influxdb2.lineproto` for
+                the accepted forms.
+            org (str): Optional. Name of the org owning the bucket.  Defaults
+                to the org the connection was created with.
+            org_id (str): Optional. ID of the org owning the bucket.  Takes
+                precedence over ``org``.
+            precision (str): Default "ns". Precision of integer timestamps,
+                one of "s", "ms", "us" or "ns".
+            batch_size (int): Default 5000. Maximum number of points per
+                request.
+            batch_bytes (int): Default 4MiB. Maximum size of a request body
+                in bytes.
+
+        Returns:
+            Number of points written.
+
+        Raises:
+            ValueError when an incoming parameter is of the incorrect type
+                or a point can not be encoded.
+            :class:`exceptions.InfluxHTTPError` when a generic HTTP error
+                comes back.
+            :class:`exceptions.InfluxAPIError` when a known error payload
+                returns from the server.
+        """
+
+        params = self._params(bucket, org, org_id, precision)
+        class_name = (__name__, __class__.__name__, "points")
+        if self._db.validation.params:
+            types.ensure_type(class_name, "batch_size", batch_size, int)
+            types.ensure_type(class_name, "batch_bytes", batch_bytes, int)
+        if batch_size < 1 or batch_bytes < 1:
+            raise ValueError(
+                "%s 'batch_size' and 'batch_bytes' must be positive"
+                % types.source_name(class_name)
+            )
+
+        lines = (lineproto.encode(point, precision) for point in points)
+        written = 0
+        for count, body in batches(lines, batch_size, batch_bytes):
+            self.send(params, body)
+            written += count
+
+        return written
+
+    def frame(  # pylint: disable=R0913
+        self,
+        bucket: str,
+        measurement: str,
+        fields: typing.Mapping[str, typing.Any],
+        tags: typing.Optional[typing.Mapping[str, typing.Any]] = None,
+        time: typing.Any = None,
+        org: typing.Optional[str] = None,
+        org_id: typing.Optional[str] = None,
+        precision: str = "ns",
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        batch_bytes: int = DEFAULT_BATCH_BYTES,
+    ) -> int:
+        """Write columns of points to a bucket.
+
+        The columns are encoded with :func:`influxdb2.lineproto.encode_frame`
+        ``batch_size`` rows at a time, so only one batch worth of line
+        protocol is held in memory however long the columns are.  Requires
+        the optional ``numpy`` package.
+
+        Parameters:
+            bucket: Name of the bucket to write to.
+            measurement: Measurement name shared by every row.
+            fields: Field names mapped to columns.
+            tags (dict): Optional. Tag names mapped to columns.
+            time: Optional. ``int64`` nanosecond or ``datetime64`` column.
+            org (str): Optional. Name of the org owning the bucket.
+            org_id (str): Optional. ID of the org owning the bucket.
+            precision (str): Default "ns". Precision the timestamps are
+                written with.
+            batch_size (int): Default 5000. Maximum number of rows per
+                request.
+            batch_bytes (int): Default 4MiB. Maximum size of a request body
+                in bytes.
+
+        Returns:
+            Number of points written.
+
+        Raises:
+            ValueError when an incoming parameter is of the incorrect type
+                or a column can not be encoded.
+            :class:`exceptions.InfluxHTTPError` when a generic HTTP error
+                comes back.
+            :class:`exceptions.InfluxAPIError` when a known error payload
+                returns from the server.
+        """
+
+        params = self._params(bucket, org, org_id, precision)
+        class_name = (__name__, __class__.__name__, "frame")
+        if self._db.validation.params:
+            types.ensure_type(class_name, "measurement", measurement, str)
+            types.ensure_type(class_name, "batch_size", batch_size, int)
+            types.ensure_type(class_name, "batch_bytes", batch_bytes, int)
+        if batch_size < 1 or batch_bytes < 1:
+            raise ValueError(
+                "%s 'batch_size' and 'batch_bytes' must be positive"
+                % types.source_name(class_name)
+            )
+
+        tags = tags or {}
+        # Checked once here, every batch below is a slice of the same shape
+        rows = lineproto.frame_rows(measurement, fields, tags, time)
+
+        written = 0
+        for start in range(0, rows, batch_size):
+            chunk = slice(start, start + batch_size)
+            lines = lineproto.encode_frame(
+                measurement,
+                {key: col[chunk] for key, col in fields.items()},
+                {key: col[chunk] for key, col in tags.items()},
+                None if time is None else time[chunk],
+                precision,
+            )
+            for count, body in batches(lines, batch_size, batch_bytes):
+                self.send(params, body)
+                written += count
+
+        return written
+
+
+class WriteBatcher:  # pylint: disable=R0902
+    """Queue points from any thread and write them in the background.
+
+    Points handed to :meth:`add` are placed on a bounded queue and a
+    background thread encodes and sends them once ``batch_size`` points are
+    waiting or the oldest queued point is ``flush_interval`` seconds old.
+    Anything still queued is sent when the batcher is closed, which also
+    happens automatically at interpreter exit.
+
+    Normally created with :meth:`influxdb2.core.Influx.batcher`.
+
+    Parameters:
+        db (influxdb2.core.Influx): Base connection instance.
+        bucket (str): Name of the bucket to write to.
+        org (str): Optional. Name of the org owning the bucket.
+        org_id (str): Optional. ID of the org owning the bucket.
+        precision (str): Default "ns". Precision of integer timestamps.
+        batch_size (int): Default 5000. Maximum number of points per
+            request and the queue length that triggers a flush.
+        batch_bytes (int): Default 4MiB. Maximum size of a request body.
+        flush_interval (float): Default 1.0. Maximum number of seconds a
+            point waits in the queue before being sent.
+        max_queue (int): Default 100000. Maximum number of queued points.
+        overflow (str): Default "block". What :meth:`add` does when the
+            queue is full, one of "block", "drop-oldest" or "raise".
+        on_error (callable): Optional. Called from the background thread
+            as ``on_error(body, exception)`` when a batch fails to send.
+            Failures are logged when not given.
+    """
+
+    def __init__(  # pylint: disable=R0913
+        self,
+        db,
+        bucket: str,
+        org: typing.Optional[str] = None,
+        org_id: typing.Optional[str] = None,
+        precision: str = "ns",
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        batch_bytes: int = DEFAULT_BATCH_BYTES,
+        flush_interval: float = 1.0,
+        max_queue: int = 100000,
+        overflow: str = OVERFLOW_BLOCK,
+        on_error: typing.Optional[
+            typing.Callable[[bytes, Exception], None]
+        ] = None,
+    ):
+        class_name = "%s.%s" % (__name__, __class__.__name__)
+        types.ensure_type(class_name, "batch_size", batch_size, int)
+        types.ensure_type(class_name, "batch_bytes", batch_bytes, int)
+        types.ensure_type(
+            class_name, "flush_interval", flush_interval, (int, float)
+        )
+        types.ensure_type(class_name, "max_queue", max_queue, int)
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(
+                "%s 'overflow' must be one of %s not: %r"
+                % (class_name, OVERFLOW_POLICIES, overflow)
+            )
+        if batch_size < 1 or batch_bytes < 1 or max_queue < 1:
+            raise ValueError(
+                "%s 'batch_size', 'batch_bytes' and 'max_queue' must be "
+                "positive" % class_name
+            )
+
+        self._db = db
+        self._params = db.write._params(bucket, org, org_id, precision)
+        self._precision = precision
+        self._batch_size = batch_size
+        self._batch_bytes = batch_bytes
+        self._flush_interval = float(flush_interval)
+        self._max_queue = max_queue
+        self._overflow = overflow
+        self._on_error = on_error
+
+        self._queue = collections.deque()
+        self._cond = threading.Condition()
+        self._flushing = 0
+        self._closed = False
+        # Counters used to tell when a flush() has been honored
+        self._queued = 0
+        self._handled = 0
+        self._dropped = 0
+        self._failed = 0
+
+        self._thread = threading.Thread(
+            target=self._run, name="influxdb2-write-batcher", daemon=True
+        )
+        self._thread.start()
+        _OPEN_BATCHERS.add(self)
+
+    @property
+    def dropped(self) -> int:
+        """Number of points discarded by the "drop-oldest" policy."""
+        return self._dropped
+
+    @property
+    def failed(self) -> int:
+        """Number of points in batches that could not be sent."""
+        return self._failed
+
+    @property
+    def pending(self) -> int:
+        """Number of points waiting in the queue."""
+        return len(self._queue)
+
+    def add(self, point: typing.Any, timeout: typing.Optional[float] = None):
+        """Queue a point for writing.
+
+        Parameters:
+            point: Point in any form accepted by :mod:`influxdb2.lineproto`.
+            timeout (float): Optional. With the "block" policy, the maximum
+                number of seconds to wait for room in the queue.
+
+        Raises:
+            :class:`exceptions.QueueFull` when the queue is full and the
+                policy is "raise", or a blocking wait timed out.
+            :class:`exceptions.InfluxError` when the batcher is closed.
+        """
+
+        with self._cond:
+            if self._closed:
+                raise exceptions.InfluxError("WriteBatcher is closed")
+
+            if len(self._queue) >= self._max_queue:
+                if self._overflow == OVERFLOW_RAISE:
+                    raise exceptions.QueueFull(
+                        "Write queue is full (%d points)" % self._max_queue
+                    )
+                if self._overflow == OVERFLOW_DROP_OLDEST:
+                    self._queue.popleft()
+                    self._dropped += 1
+                    self._handled += 1
+                elif not self._cond.wait_for(
+                    lambda: len(self._queue) < self._max_queue
+                    or self._closed
+                    or not self._thread.is_alive(),
+                    timeout,
+                ):
+                    raise exceptions.QueueFull(
+                        "Timed out waiting for room in the write queue"
+                    )
+                elif self._closed:
+                    raise exceptions.InfluxError("WriteBatcher is closed")
+                elif not self._thread.is_alive():
+                    raise exceptions.InfluxError(
+                        "WriteBatcher background thread has stopped"
+                    )
+
+            if not self._queue:
+                # Start the flush timer in the background thread
+                self._cond.notify_all()
+            # Points are queued with the time they were added, so the
+            # flush timer follows the oldest point still waiting
+            self._queue.append((time.monotonic(), point))
+            self._queued += 1
+            if len(self._queue) >= min(self._batch_size, self._max_queue):
+                self._cond.notify_all()
+
+    def extend(self, points: typing.Iterable[typing.Any]):
+        """Queue several points for writing.
+
+        Parameters:
+            points: Iterable of points, see :meth:`add`.
+        """
+
+        for point in points:
+            self.add(point)
+
+    def flush(self, timeout: typing.Optional[float] = None) -> bool:
+        """Send everything queued so far and wait for it to be handled.
+
+        Parameters:
+            timeout (float): Optional. Maximum number of seconds to wait.
+
+        Returns:
+            ``True`` if every point queued before the call was handled.
+        """
+
+        with self._cond:
+            target = self._queued
+            self._flushing += 1
+            self._cond.notify_all()
+            try:
+                return (
+                    self._cond.wait_for(
+                        lambda: self._handled >= target
+                        or not self._thread.is_alive(),
+                        timeout,
+                    )
+                    and self._handled >= target
+                )
+            finally:
+                self._flushing -= 1
+
+    def close(self, timeout: typing.Optional[float] = None):
+        """Flush remaining points and stop the background thread.
+
+        Parameters:
+            timeout (float): Optional. Maximum number of seconds to wait for
+                the background thread to finish.
+        """
+
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+
+        _OPEN_BATCHERS.discard(self)
+        if self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _ready(self) -> bool:
+        if self._closed or self._flushing:
+            return True
+        if len(self._queue) >= min(self._batch_size, self._max_queue):
+            return True
+        return time.monotonic() - self._queue[0][0] >= self._flush_interval
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._queue or not self._ready():
+                    if self._closed and not self._queue:
+                        return
+                    if self._queue:
+                        remaining = self._flush_interval - (
+                            time.monotonic() - self._queue[0][0]
+                        )
+                        self._cond.wait(max(remaining, 0.0))
+                    else:
+                        self._cond.wait()
+
+                count = min(len(self._queue), self._batch_size)
+                points = [self._queue.popleft()[1] for _ in range(count)]
+                # Wake producers blocked on a full queue
+                self._cond.notify_all()
+
+            try:
+                self._send(points)
+            except Exception:  # pylint: disable=W0703
+                # Keep the thread alive, producers block on it
+                logging.getLogger(
+                    "%s.%s._run" % (__name__, __class__.__name__)
+                ).exception("Failed to send %d points", count)
+                self._failed += count
+
+            with self._cond:
+                self._handled += count
+                self._cond.notify_all()
+
+    def _send(self, points: typing.List[typing.Any]):
+        log = logging.getLogger("%s.%s._send" % (__name__, __class__.__name__))
+
+        lines = []
+        for point in points:
+            try:
+                lines.append(lineproto.encode(point, self._precision))
+            except ValueError as err:
+                log.error("Dropping point that can not be encoded: %s", err)
+                self._failed += 1
+
+        for count, body in batches(lines, self._batch_size, self._batch_bytes):
+            try:
+                self._db.write.send(self._params, body)
+            except Exception as err:  # pylint: disable=W0703
+                self._failed += count
+                if not self._on_error:
+                    log.error("Failed to write %d points: %s", count, err)
+                    continue
+                try:
+                    self._on_error(body, err)
+                except Exception:  # pylint: disable=W0703
+                    log.exception("on_error callback failed")
@@ -0,0 +1,87 @@
+#!/usr/local/hoplite/bin/python3
+import asyncio
+import unittest
+import os
+import sys
+
+sys.path.insert(0, os.path.realpath(os.path.join("..", "lib")))
+import influxdb2
+import influxdb2.stub
+
+
+class TestAsyncInflux(unittest.TestCase):
+    def setUp(self):
+        try:
+            import influxdb2.aio
+        except ImportError:
+            self.skipTest("aiohttp is not installed")
+        self.aio = influxdb2.aio
+
+    def run_with(self, server, coro, token=None):
+        async def main():
+            async with self.aio.connect(
+                server.url, token or server.token
+            ) as db:
+                return await coro(db)
+
+        return asyncio.run(main())
+
+    def test_query_params(self):
+        assert self.aio._query_params(
+            {"a": None, "b": True, "c": False, "d": 1}
+        ) == {"b": "true", "c": "false", "d": 1}
+        assert self.aio._query_params([("a", "b")]) == [("a", "b")]
+
+    def test_orgs(self):
+        async def scenario(db):
+            names = [org.name async for org in db.orgs.iterate()]
+            assert len(names) == 120
+            assert len(await db.orgs.list(descending=True, limit=5)) == 5
+
+            org = await db.orgs.create("new", "New org")
+            assert (await db.orgs.get(org.id)).description == "New org"
+            await db.orgs.set_secrets(org.id, {"a": "1", "b": "2"})
+            await db.orgs.delete_secrets(org.id, ["a"])
+            assert [str(key) for key in await db.orgs.secrets(org.id)] == ["b"]
+            await db.orgs.delete(org.id)
+            with self.assertRaises(influxdb2.exceptions.InfluxAPIError):
+                await db.orgs.get(org.id)
+            with self.assertRaises(ValueError):
+                await db.orgs.get("xyz")
+
+        with influxdb2.stub.StubServer(orgs=120) as server:
+            self.run_with(server, scenario)
+
+    def test_errors(self):
+        async def listing(db):
+            return await db.orgs.list()
+
+        with influxdb2.stub.StubServer(orgs=1) as server:
+            with self.assertRaises(influxdb2.exceptions.AuthenticationDenied):
+                self.run_with(server, listing, "wrong")
+
+        with influxdb2.stub.StubServer(orgs=1, error_rate=1.0) as server:
+            with self.assertRaises(influxdb2.exceptions.InfluxAPIError) as ctx:
+                self.run_with(server, listing)
+            assert ctx.exception.status == 503
+
+        server = influxdb2.stub.StubServer()
+        with server:
+            url = server.url
+        with self.assertRaises(influxdb2.exceptions.NetworkError):
+            asyncio.run(self._list_closed(url))
+
+    async def _list_closed(self, url):
+        async with self.aio.connect(url, "token") as db:
+            await db.orgs.list()
+
+    def test_api_error(self):
+        rsp = self.aio.Response(500, {}, b"not json")
+        with self.assertRaises(influxdb2.exceptions.InfluxHTTPError) as ctx:
+            self.aio.AsyncInflux("http://localhost", "t").api_error(rsp)
+        assert ctx.exception.status == 500
+        assert ctx.exception.data == "not json"
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,260 @@
+#!/usr/local/hoplite/bin/python3
+"""Offline micro-benchmarks for the decode and validation hot paths.
+
+No server is needed: API calls are answered with canned responses.  Each
+benchmark reports calls per second and the peak memory allocated by a
+single call as traced by ``tracemalloc``.
+
+Speed is compared as a ratio to the ``reference`` benchmark, plain Python
+work that does not touch the package, measured in the same process right
+before each benchmark.  The ratio carries over between machines far better
+than absolute calls per second, so the saved baseline holds ratios only.
+
+Run from the ``tests`` directory::
+
+    python benchmark.py                 # compare with the saved baseline
+    python benchmark.py --save          # record a new baseline
+    python benchmark.py -k org_from     # only matching benchmarks
+
+The exit status is 1 when a benchmark is slower relative to the reference,
+or allocates more, than the baseline by more than ``--tolerance``.
+"""
+
+import argparse
+import json
+import os
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.realpath(os.path.join("..", "lib")))
+import influxdb2
+
+BASELINE = os.path.join(os.path.dirname(__file__), "benchmark_baseline.json")
+
+ORG = {
+    "links": {
+        "self": "/api/v2/orgs/1",
+        "members": "/api/v2/orgs/1/members",
+        "owners": "/api/v2/orgs/1/owners",
+        "labels": "/api/v2/orgs/1/labels",
+        "secrets": "/api/v2/orgs/1/secrets",
+        "buckets": "/api/v2/buckets?org=myorg",
+        "tasks": "/api/v2/tasks?org=myorg",
+        "dashboards": "/api/v2/dashboards?org=myorg",
+    },
+    "id": "abcdef0123456789",
+    "name": "example.com",
+    "description": "Example Company",
+    "createdAt": "2019-08-24T14:15:22Z",
+    "updatedAt": "2019-08-24T14:15:22.4485Z",
+    "status": "active",
+}
+ORG_JSON = json.dumps(ORG)
+ORG_PAGE = json.dumps(
+    {
+        "links": {"self": "/api/v2/orgs?limit=100"},
+        "orgs": [
+            dict(ORG, id="%016x" % idx, name="org-%d" % idx)
+            for idx in range(100)
+        ],
+    }
+).encode("utf-8")
+
+
+class Canned:
+    """Stand in for ``requests.Response``."""
+
+    def __init__(self, status_code: int, content: bytes):
+        self.status_code = status_code
+        self.content = content
+        self.text = content.decode("utf-8")
+
+    def json(self):
+        return influxdb2.codec.loads(self.content)
+
+
+def connection(validation: str = "strict") -> influxdb2.core.Influx:
+    db = influxdb2.connect(
+        "http://localhost:8086", "token", validation=validation
+    )
+    page = Canned(200, ORG_PAGE)
+    db.get = lambda path, params=None, **kwargs: page
+    return db
+
+
+def bench_reference():
+    # Decoding and copying similar to the package, without the package
+    def run():
+        data = json.loads(ORG_JSON)
+        return {str(key): str(value) for key, value in data["links"].items()}
+
+    return run
+
+
+def bench_org_from_dict():
+    def run():
+        influxdb2.obj.org.Org().from_dict(ORG)
+
+    return run
+
+
+def bench_org_from_json():
+    def run():
+        influxdb2.obj.org.Org().from_json(ORG_JSON)
+
+    return run
+
+
+def bench_orgs_list():
+    orgs = connection().orgs
+    return lambda: orgs.list(limit=100)
+
+
+def bench_orgs_list_public_only():
+    orgs = connection("public-only").orgs
+    return lambda: orgs.list(limit=100)
+
+
+def bench_ensure_type():
+    source = ("influxdb2.orgs", "Organizations", "list")
+    ensure_type = influxdb2.types.ensure_type
+    return lambda: ensure_type(source, "org", "name", (str, type(None)))
+
+
+def bench_ensure_id():
+    source = ("influxdb2.orgs", "Organizations", "get")
+    ensure_id = influxdb2.types.ensure_id
+    return lambda: ensure_id(source, "org_id", "abcdef0123456789")
+
+
+def bench_api_error():
+    db = connection()
+    rsp = Canned(404, b'{"code": "not found", "message": "org not found"}')
+
+    def run():
+        try:
+            db.api_error(rsp)
+        except influxdb2.exceptions.InfluxAPIError:
+            pass
+
+    return run
+
+
+TAGS = {"host": "web-1", "dc": "east", "service": "api"}
+FIELDS = {"usage": 12.5, "count": 7}
+
+
+def bench_encode_dict():
+    point = {"measurement": "cpu", "tags": TAGS, "fields": FIELDS, "time": 1}
+    return lambda: influxdb2.lineproto.encode(point)
+
+
+def bench_encode_point():
+    Point = influxdb2.obj.point.Point
+    return lambda: influxdb2.lineproto.encode(Point("cpu", FIELDS, TAGS, 1))
+
+
+REFERENCE = "reference"
+
+BENCHMARKS = {
+    name[len("bench_") :]: func
+    for name, func in sorted(globals().items())
+    if name.startswith("bench_")
+}
+
+
+def measure(func, repeat: int) -> dict:
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat, number)) / number
+
+    func()  # Warm caches before tracing
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {"ops_per_sec": round(1.0 / best), "alloc_bytes": peak}
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        if result["relative"] < base["relative"] * (1 - tolerance):
+            regressions.append(
+                "%s: %.3fx reference speed, baseline %.3fx"
+                % (name, result["relative"], base["relative"])
+            )
+        if result["alloc_bytes"] > base["alloc_bytes"] * (1 + tolerance):
+            regressions.append(
+                "%s: %d bytes allocated, baseline %d"
+                % (name, result["alloc_bytes"], base["alloc_bytes"])
+            )
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--baseline", default=BASELINE)
+    parser.add_argument(
+        "--save", action="store_true", help="Write results as the baseline"
+    )
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("-k", dest="match", default="")
+    args = parser.parse_args(argv)
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as handle:
+            baseline = json.load(handle)
+
+    results = {}
+    for name, factory in BENCHMARKS.items():
+        if name == REFERENCE or args.match not in name:
+            continue
+        # Measured next to each benchmark so both see the same machine load
+        reference = measure(BENCHMARKS[REFERENCE](), args.repeat)
+        result = measure(factory(), args.repeat)
+        results[name] = {
+            "relative": round(
+                result["ops_per_sec"] / reference["ops_per_sec"], 4
+            ),
+            "alloc_bytes": result["alloc_bytes"],
+        }
+        base = baseline.get(name)
+        change = ""
+        if base:
+            change = "%+.1f%%" % (
+                (results[name]["relative"] / base["relative"] - 1) * 100
+            )
+        print(
+            "%-28s %12.0f ops/sec %8.3fx %9d bytes/call %8s"
+            % (
+                name,
+                result["ops_per_sec"],
+                results[name]["relative"],
+                result["alloc_bytes"],
+                change,
+            )
+        )
+
+    if args.save:
+        baseline.update(results)
+        with open(args.baseline, "w") as handle:
+            json.dump(baseline, handle, indent=4, sort_keys=True)
+            handle.write("\n")
+        return 0
+
+    regressions = compare(results, baseline, args.tolerance)
+    for line in regressions:
+        print("REGRESSION %s" % line)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+#!/usr/local/hoplite/bin/python3
+import json
+import unittest
+import unittest.mock
+import os
+import sys
+
+sys.path.insert(0, os.path.realpath(os.path.join("..", "lib")))
+import influxdb2
+
+BUCKET = {
+    "links": {"self": "/api/v2/buckets/1"},
+    "id": "0123456789abcdef",
+    "type": "user",
+    "name": "metrics",
+    "orgID": "abcdef0123456789",
+    "createdAt": "2019-08-24T14:15:22Z",
+    "updatedAt": "2019-08-24T14:15:22Z",
+    "retentionRules": [
+        {
+            "type": "expire",
+            "everySeconds": 86400,
+            "shardGroupDurationSeconds": 3600,
+        }
+    ],
+}
+
+
+def response(status, body):
+    rsp = unittest.mock.Mock()
+    rsp.status_code = status
+    rsp.content = json.dumps(body).encode("utf-8")
+    return rsp
+
+
+class TestBucket(unittest.TestCase):
+    def test_from_dict(self):
+        bucket = influxdb2.obj.bucket.Bucket()
+        bucket.from_dict(BUCKET)
+        assert bucket.id == "0123456789abcdef"
+        assert bucket.org_id == "abcdef0123456789"
+        assert bucket.retention == 86400
+        assert bucket.retention_rules == [
+            influxdb2.obj.bucket.RetentionRule(86400, 3600)
+        ]
+        assert bucket.created == 1566656122.0
+
+        with self.assertRaises(ValueError):
+            bucket.from_dict(dict(BUCKET, id="xyz"))
+        with self.assertRaises(ValueError):
+            bucket.name
+
+    def test_resolve_cached(self):
+        db = influxdb2.connect("http://localhost:8086", "token", org="myorg")
+        with unittest.mock.patch.object(
+            db, "get", return_value=response(200, {"buckets": [BUCKET]})
+        ) as get:
+            assert db.buckets.resolve("metrics") == "0123456789abcdef"
+            assert db.buckets.resolve("metrics") == "0123456789abcdef"
+            assert get.call_count == 1
+            assert get.call_args[1]["params"] == {
+                "org": "myorg",
+                "name": "metrics",
+                "limit": 1,
+            }
+
+            # Listing fills the cache keyed by org ID
+            assert (
+                db.buckets.resolve("metrics", org_id="abcdef0123456789")
+                == "0123456789abcdef"
+            )
+            assert get.call_count == 1
+
+        with unittest.mock.patch.object(
+            db, "get", return_value=response(200, {"buckets": []})
+        ):
+            with self.assertRaises(influxdb2.exceptions.InfluxError):
+                db.buckets.resolve("missing")
+
+    def test_delete_forgets_bucket(self):
+        db = influxdb2.connect("http://localhost:8086", "token", org="myorg")
+        other = dict(BUCKET, id="1123456789abcdef", name="other")
+        with unittest.mock.patch.object(
+            db, "get", return_value=response(200, {"buckets": [BUCKET, other]})
+        ) as get:
+            db.buckets.list()
+            with unittest.mock.patch.object(
+                db, "delete", return_value=response(204, None)
+            ):
+                db.buckets.delete("0123456789abcdef")
+
+            # Only the names pointing at the deleted bucket are dropped
+            assert (
+                db.buckets.resolve("other", org_id="abcdef0123456789")
+                == "1123456789abcdef"
+            )
+            assert get.call_count == 1
+            db.buckets.resolve("metrics", org_id="abcdef0123456789")
+            assert get.call_count == 2
+
+    def test_cached_copies(self):
+        db = influxdb2.connect("http://localhost:8086", "token", cache_ttl=60)
+        with unittest.mock.patch.object(
+            db, "get", return_value=response(200, BUCKET)
+        ) as get:
+            first = db.buckets.get("0123456789abcdef")
+            first.name = "changed"
+            first.retention_rules[0].every_seconds = 60
+            first.links["extra"] = "x"
+
+            again = db.buckets.get("0123456789abcdef")
+            assert get.call_count == 1
+            assert again is not first
+            assert again.name == "metrics"
+            assert again.retention_rules[0].every_seconds == 86400
+            assert "extra" not in again.links
+
+
+if __name__ == "__main__":
+    unittest.main()
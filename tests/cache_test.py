@@ -0,0 +1,71 @@
+#!/usr/local/hoplite/bin/python3
+import unittest
+import unittest.mock
+import os
+import sys
+
+sys.path.insert(0, os.path.realpath(os.path.join("..", "lib")))
+import influxdb2
+
+
+class TestTTLCache(unittest.TestCase):
+    def setUp(self):
+        self.now = 1000.0
+        patcher = unittest.mock.patch(
+            "influxdb2.cache.time.monotonic", lambda: self.now
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_expiry(self):
+        cache = influxdb2.cache.TTLCache(10)
+        cache.set("a", 1)
+        self.now += 9.9
+        assert cache.get("a") == 1
+        self.now += 0.1
+        assert cache.get("a") is None
+        assert cache.get("a", "missing") == "missing"
+        assert len(cache) == 0
+
+        # Storing again restarts the clock
+        cache.set("a", 1)
+        self.now += 5
+        cache.set("a", 2)
+        self.now += 9
+        assert cache.get("a") == 2
+        self.now += 1
+        assert cache.pop("a") is None
+
+    def test_lru_eviction(self):
+        cache = influxdb2.cache.TTLCache(10, maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        # Reading "a" makes "b" the least recently used
+        assert cache.get("a") == 1
+        cache.set("c", 3)
+        assert len(cache) == 2
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_remove(self):
+        cache = influxdb2.cache.TTLCache(10)
+        for key, value in (("a", 1), ("b", 2), ("c", 1)):
+            cache.set(key, value)
+        assert cache.pop("b") == 2
+        assert cache.pop("b", "missing") == "missing"
+        assert cache.discard_value(1) == 2
+        assert len(cache) == 0
+
+        cache.set("a", 1)
+        cache.clear()
+        assert cache.get("a") is None
+
+        with self.assertRaises(ValueError):
+            influxdb2.cache.TTLCache(0)
+        with self.assertRaises(ValueError):
+            influxdb2.cache.TTLCache(10, maxsize=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,154 @@
+#!/usr/local/hoplite/bin/python3
+import gzip
+import http.server
+import socket
+import threading
+import unittest
+import unittest.mock
+import os
+import sys
+
+sys.path.insert(0, os.path.realpath(os.path.join("..", "lib")))
+import influxdb2
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def _read_body(self):
+        if self.headers.get("Transfer-Encoding") == "chunked":
+            body = b""
+            while True:
+                size = int(self.rfile.readline().strip(), 16)
+                chunk = self.rfile.read(size + 2)[:size]
+                if not size:
+                    return body
+                body += chunk
+        return self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+    def do_POST(self):
+        self.server.received.append((dict(self.headers), self._read_body()))
+        self.server.peers.add(self.client_address)
+        self.send_response(204)
+        self.send_header("Content-Length", "0")
+        if self.headers.get("Connection") == "close":
+            # Tell the client, as InfluxDB does, so it does not reuse it
+            self.send_header("Connection", "close")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+class ServerTest(unittest.TestCase):
+    def setUp(self):
+        self.server = http.server.ThreadingHTTPServer(
+            ("127.0.0.1", 0), Handler
+        )
+        self.server.received = []
+        self.server.peers = set()
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = "http://127.0.0.1:%d" % self.server.server_port
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class TestGzip(ServerTest):
+    def test_gzip_stream(self):
+        body = os.urandom(influxdb2.core.GZIP_CHUNK_SIZE * 2 + 10)
+        chunks = list(influxdb2.core.gzip_stream(body))
+        assert len(chunks) > 1
+        assert gzip.decompress(b"".join(chunks)) == body
+
+    def test_round_trip(self):
+        db = influxdb2.connect(self.url, "token", gzip_threshold=100)
+        small = b"m v=1i"
+        large = b"\n".join([b"m v=%di" % idx for idx in range(100)])
+        db.post("/api/v2/write", data=small)
+        db.post("/api/v2/write", data=large)
+        db.post("/api/v2/orgs", json={"name": "x" * 200})
+
+        (headers, body), (zheaders, zbody), (jheaders, jbody) = (
+            self.server.received
+        )
+        assert "Content-Encoding" not in headers
+        assert body == small
+
+        # Compressed up front so the length is known
+        assert zheaders["Content-Encoding"] == "gzip"
+        assert int(zheaders["Content-Length"]) == len(zbody)
+        assert gzip.decompress(zbody) == large
+
+        assert jheaders["Content-Type"] == "application/json"
+        assert gzip.decompress(jbody) == b'{"name": "%s"}' % (b"x" * 200)
+        db.close()
+
+    def test_stream_large(self):
+        db = influxdb2.connect(self.url, "token", gzip_threshold=100)
+        body = b"m v=1i\n" * 1000
+        with unittest.mock.patch.object(
+            influxdb2.core, "GZIP_STREAM_SIZE", 1000
+        ):
+            db.post("/api/v2/write", data=body)
+        headers, received = self.server.received[0]
+        assert headers["Transfer-Encoding"] == "chunked"
+        assert "Content-Length" not in headers
+        assert gzip.decompress(received) == body
+        db.close()
+
+
+class TestAdapter(ServerTest):
+    def test_keepalive_options(self):
+        options = influxdb2.core.keepalive_options(30)
+        assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in options
+        if hasattr(socket, "TCP_KEEPIDLE"):
+            assert (socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 30) in options
+
+    def test_pool(self):
+        db = influxdb2.connect(
+            self.url,
+            "token",
+            pool_maxsize=3,
+            pool_block=True,
+            tcp_keepalive=30,
+            metrics=True,
+        )
+        adapter = db._http.get_adapter(self.url)
+        assert isinstance(adapter, influxdb2.core.HTTPAdapter)
+        options = adapter.poolmanager.connection_pool_kw["socket_options"]
+        assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in options
+        # urllib3's defaults are kept
+        assert (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1) in options
+
+        pool = adapter.poolmanager.connection_from_url(self.url)
+        assert isinstance(pool, influxdb2.core.TimedHTTPConnectionPool)
+        assert pool.pool.maxsize == 3
+        assert pool.block
+        db.close()
+
+        # Pool wait time is only measured with metrics on
+        db = influxdb2.connect(self.url, "token")
+        adapter = db._http.get_adapter(self.url)
+        pool = adapter.poolmanager.connection_from_url(self.url)
+        assert not isinstance(pool, influxdb2.core.TimedHTTPConnectionPool)
+        db.close()
+
+    def test_keepalive(self):
+        db = influxdb2.connect(self.url, "token")
+        for _ in range(3):
+            db.post("/api/v2/write", data=b"m v=1i")
+        assert len(self.server.peers) == 1
+        db.close()
+
+        db = influxdb2.connect(self.url, "token", keepalive=False)
+        for _ in range(3):
+            db.post("/api/v2/write", data=b"m v=1i")
+        assert len(self.server.peers) == 4
+        assert self.server.received[-1][0]["Connection"] == "close"
+        db.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
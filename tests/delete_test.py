@@ -0,0 +1,86 @@
+#!/usr/local/hoplite/bin/python3
+import datetime
+import threading
+import unittest
+import unittest.mock
+import os
+import sys
+
+sys.path.insert(0, os.path.realpath(os.path.join("..", "lib")))
+import influxdb2
+
+
+class TestDelete(unittest.TestCase):
+    def test_windows(self):
+        spans = list(influxdb2.delete.windows(0, 25, 10))
+        assert spans == [(0, 10), (10, 20), (20, 25)]
+        assert list(influxdb2.delete.windows(0, 25, None)) == [(0, 25)]
+        assert (
+            influxdb2.delete.format_rfc3339(1566656122000000001)
+            == "2019-08-24T14:15:22.000000001Z"
+        )
+
+    def test_failed_windows(self):
+        db = influxdb2.connect("http://localhost:8086", "token", org="myorg")
+        sent = []
+        lock = threading.Lock()
+
+        def post(path, params=None, json=None, idempotent=None):
+            with lock:
+                sent.append(json)
+            rsp = unittest.mock.Mock()
+            rsp.status_code = 204
+            if json["start"].startswith("2021-01-02"):
+                rsp.status_code = 500
+                rsp.content = b"{}"
+                rsp.text = "boom"
+            return rsp
+
+        progress = []
+        with unittest.mock.patch.object(db, "post", side_effect=post):
+            result = db.delete_data(
+                "2021-01-01T00:00:00Z",
+                datetime.datetime(2021, 1, 4),
+                '_measurement="cpu"',
+                bucket="metrics",
+                window=datetime.timedelta(days=1),
+                concurrency=2,
+                progress=lambda done, total: progress.append((done, total)),
+            )
+
+        assert result.windows == 3
+        assert len(sent) == 3
+        assert sent[0]["predicate"] == '_measurement="cpu"'
+        assert progress[-1] == (3, 3)
+        assert not result.ok
+        assert [window.start for window in result.failed] == [
+            "2021-01-02T00:00:00.000000000Z"
+        ]
+        assert isinstance(
+            result.failed[0].error, influxdb2.exceptions.InfluxError
+        )
+
+        # Errors outside the client still only fail their window
+        def broken(path, params=None, json=None, idempotent=None):
+            if json["start"].startswith("2021-01-01"):
+                raise KeyError("bug")
+            return post(path, params, json, idempotent)
+
+        with unittest.mock.patch.object(db, "post", side_effect=broken):
+            result = db.delete_data(
+                "2021-01-01T00:00:00Z",
+                "2021-01-04T00:00:00Z",
+                window=86400,
+                bucket="metrics",
+            )
+        assert [type(window.error) for window in result.failed] == [
+            KeyError,
+            influxdb2.exceptions.InfluxHTTPError,
+        ]
+
+        with self.assertRaises(ValueError):
+            db.delete_data(0, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+#!/usr/local/hoplite/bin/python3
+import time
+import unittest
+import os
+import sys
+
+sys.path.insert(0, os.path.realpath(os.path.join("..", "lib")))
+import influxdb2
+import influxdb2.stub
+
+
+class TestEndpointSet(unittest.TestCase):
+    def test_balance(self):
+        servers = influxdb2.endpoints.EndpointSet(
+            ["http://a/", "http://b"], lambda url: True
+        )
+        picked = []
+        for _ in range(4):
+            server = servers.acquire(True)
+            servers.release(server, True)
+            picked.append(server.url)
+        assert sorted(picked) == [
+            "http://a",
+            "http://a",
+            "http://b",
+            "http://b",
+        ]
+
+        # Writes stick to the first server
+        server = servers.acquire(False)
+        servers.release(server, True)
+        assert server.url == "http://a"
+
+        least = influxdb2.endpoints.EndpointSet(
+            ["http://a", "http://b"], lambda url: True, "least-outstanding"
+        )
+        busy = least.acquire(True)
+        assert least.acquire(True) is not busy
+
+        with self.assertRaises(ValueError):
+            influxdb2.endpoints.EndpointSet(["http://a"], None, "random")
+
+    def test_down_and_probe(self):
+        healthy = {"http://a": False}
+        servers = influxdb2.endpoints.EndpointSet(
+            ["http://a", "http://b"],
+            lambda url: healthy.get(url, True),
+            max_failures=2,
+            probe_interval=0.01,
+        )
+        first = servers.endpoints[0]
+        for _ in range(2):
+            servers.release(servers.acquire(False), False)
+        assert first.down
+        assert [ep.url for ep in servers.healthy] == ["http://b"]
+        assert servers.acquire(False).url == "http://b"
+
+        healthy["http://a"] = True
+        deadline = time.monotonic() + 5
+        while first.down and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert not first.down
+        servers.close()
+
+
+class TestMultipleURLs(unittest.TestCase):
+    def test_reads_spread_and_fail_over(self):
+        with influxdb2.stub.StubServer(orgs=5) as one:
+            with influxdb2.stub.StubServer(orgs=5) as two:
+                db = influxdb2.connect(
+                    [one.url, two.url],
+                    one.token,
+                    retry=influxdb2.retry.RetryPolicy(3, backoff=0.001),
+                    max_failures=1,
+                    probe_interval=60,
+                )
+                for _ in range(4):
+                    assert len(db.orgs.list()) == 5
+                assert (one.requests, two.requests) == (2, 2)
+
+                # Retries go to the other server and the failed one is
+                # taken out of rotation
+                one.fail_next(1)
+                assert len(db.orgs.list()) == 5
+                assert len(db.orgs.list()) == 5
+                assert [ep.url for ep in db._endpoints.healthy] == [two.url]
+                before = one.requests
+                assert len(db.orgs.list()) == 5
+                assert one.requests == before
+                db.close()
+
+    def test_outstanding(self):
+        with influxdb2.stub.StubServer(orgs=5) as server:
+            db = influxdb2.connect(server.url, server.token)
+            endpoint = db._endpoints.endpoints[0]
+
+            # A streamed response is in flight until it is closed
+            rsp = db.get("/api/v2/orgs", stream=True)
+            assert endpoint.outstanding == 1
+            rsp.close()
+            rsp.close()
+            assert endpoint.outstanding == 0
+            with db.get("/api/v2/orgs", stream=True) as rsp:
+                assert endpoint.outstanding == 1
+            assert endpoint.outstanding == 0
+            db.get("/api/v2/orgs")
+            assert endpoint.outstanding == 0
+
+            # Errors raised on this side are not held against the server
+            endpoint.failures = 1
+            with self.assertRaises(TypeError):
+                db.get("/api/v2/orgs", unknown=True)
+            assert endpoint.outstanding == 0
+            assert endpoint.failures == 1
+            db.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+#!/usr/local/hoplite/bin/python3
+import unittest
+import os
+import subprocess
+import sys
+
+LIB = os.path.realpath(os.path.join("..", "lib"))
+sys.path.insert(0, LIB)
+import influxdb2
+
+HEAVY = ("requests", "urllib3", "ciso8601", "influxdb2.core", "influxdb2.obj")
+
+
+def loaded(code: str) -> list:
+    """Heavy modules loaded after running code in a fresh interpreter."""
+    script = (
+        "import sys\nsys.path.insert(0, %r)\n%s\n"
+        "print(' '.join(n for n in %r if n in sys.modules))"
+        % (LIB, code, HEAVY)
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", script],
+        stdout=subprocess.PIPE,
+        check=True,
+        universal_newlines=True,
+    ).stdout
+    return out.splitlines()[-1].split()
+
+
+class TestImport(unittest.TestCase):
+    def test_import_is_lazy(self):
+        assert loaded("import influxdb2") == []
+
+    def test_submodule_on_access(self):
+        assert loaded("import influxdb2\ninfluxdb2.types") == []
+        assert "ciso8601" not in loaded("import influxdb2\ninfluxdb2.obj.org")
+        assert "ciso8601" in loaded(
+            "import influxdb2\n"
+            "influxdb2.obj.common.timestamp('2021-01-01T00:00:00Z')"
+        )
+        assert "requests" in loaded(
+            "import influxdb2\ninfluxdb2.connect('http://localhost', 't')"
+        )
+
+    def test_attributes(self):
+        assert influxdb2.core.Influx is not None
+        assert "orgs" in dir(influxdb2)
+        with self.assertRaises(AttributeError):
+            influxdb2.missing
+
+
+if __name__ == "__main__":
+    unittest.main()
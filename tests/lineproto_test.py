@@ -0,0 +1,143 @@
+#!/usr/local/hoplite/bin/python3
+import unittest
+import os
+import sys
+
+sys.path.insert(0, os.path.realpath(os.path.join("..", "lib")))
+import influxdb2
+
+
+class TestLineProtocol(unittest.TestCase):
+    def test_escaping(self):
+        line = influxdb2.lineproto.encode_point(
+            "my measurement,x",
+            {"field key": 'say "hi"'},
+            {"tag=key": "a b,c", "empty": ""},
+        )
+        assert line == (
+            'my\\ measurement\\,x,tag\\=key=a\\ b\\,c field\\ key="say \\"hi\\""'
+        )
+
+    def test_field_types(self):
+        line = influxdb2.lineproto.encode_point(
+            "m",
+            {"b": True, "i": 3, "f": 1.5, "s": "x", "n": None},
+            time=1,
+        )
+        assert line == 'm b=true,i=3i,f=1.5,s="x" 1'
+
+        with self.assertRaises(ValueError):
+            influxdb2.lineproto.encode_point("m", {"f": float("nan")})
+        with self.assertRaises(ValueError):
+            influxdb2.lineproto.encode_point("m", {"n": None})
+
+    def test_tags_sorted(self):
+        line = influxdb2.lineproto.encode_point(
+            "m", {"v": 1}, {"b": "2", "a": "1"}
+        )
+        assert line == "m,a=1,b=2 v=1i"
+
+    def test_time(self):
+        fmt = influxdb2.lineproto.format_time
+        assert fmt(None) == ""
+        assert fmt(1566656122.5, "ms") == "1566656122500"
+        assert fmt("2019-08-24T14:15:22Z", "s") == "1566656122"
+        assert fmt("2019-08-24T14:15:22.4485Z") == "1566656122448500000"
+
+    def test_encode(self):
+        encode = influxdb2.lineproto.encode
+        assert encode("m v=1i\n") == b"m v=1i"
+        assert encode(b"m v=1i") == b"m v=1i"
+        assert encode(
+            {"measurement": "m", "fields": {"v": 1}, "time": 5}
+        ) == b"m v=1i 5"
+        with self.assertRaises(ValueError):
+            encode({"measurement": "m"})
+
+
+class TestFrame(unittest.TestCase):
+    def setUp(self):
+        try:
+            import numpy
+        except ImportError:
+            self.skipTest("numpy is not installed")
+        self.numpy = numpy
+
+    def test_matches_encode_point(self):
+        numpy = self.numpy
+        tags = {"host": ["a b", "a b", "c,d"], "dc": ["x", "", None]}
+        fields = {
+            "f": numpy.array([1.5, 0.1, 1e20]),
+            "i": numpy.array([1, -2, 3], dtype="int64"),
+            "b": numpy.array([True, False, True]),
+            "s": ['say "hi"', "back\\slash", ""],
+            "o": [None, 2, "x"],
+        }
+        stamps = numpy.array([1, 2, 3000000000], dtype="int64")
+        lines = influxdb2.lineproto.encode_frame(
+            "my m", fields, tags, stamps, "ns"
+        )
+        expected = [
+            influxdb2.lineproto.encode_point(
+                "my m",
+                {
+                    key: numpy.asarray(col).tolist()[idx]
+                    for key, col in fields.items()
+                },
+                {key: col[idx] for key, col in tags.items()},
+                int(stamps[idx]),
+            ).encode("utf-8")
+            for idx in range(3)
+        ]
+        assert lines == expected
+
+    def test_time(self):
+        numpy = self.numpy
+        times = numpy.array(["2019-08-24T14:15:22"], dtype="datetime64[s]")
+        assert influxdb2.lineproto.encode_frame(
+            "m", {"v": [1]}, time=times, precision="s"
+        ) == [b"m v=1i 1566656122"]
+        assert influxdb2.lineproto.encode_frame("m", {"v": []}) == []
+
+    def test_errors(self):
+        encode_frame = influxdb2.lineproto.encode_frame
+        with self.assertRaises(ValueError):
+            encode_frame("m", {"v": [1.0, float("nan")]})
+        with self.assertRaises(ValueError):
+            encode_frame("m", {"v": [1, 2]}, {"t": ["a"]})
+        with self.assertRaises(ValueError):
+            encode_frame("m", {"v": [None, 1]})
+
+    def test_write(self):
+        sent = []
+        db = influxdb2.connect("http://localhost:8086", "token", org="o")
+        db.write.send = lambda params, body: sent.append(body)
+        count = db.write.frame(
+            "b", "m", {"v": self.numpy.arange(5)}, batch_size=2
+        )
+        assert count == 5
+        assert sent == [b"m v=0i\nm v=1i", b"m v=2i\nm v=3i", b"m v=4i"]
+
+        # Shape errors are raised before anything is sent
+        with self.assertRaises(ValueError):
+            db.write.frame("b", "m", {"v": [1, 2, 3]}, {"t": ["a", "b"]})
+        with self.assertRaises(ValueError):
+            db.write.frame("b", "m", {})
+        assert len(sent) == 3
+
+
+class TestBatches(unittest.TestCase):
+    def test_batch_size(self):
+        lines = [b"m v=%di" % x for x in range(5)]
+        batches = list(influxdb2.write.batches(lines, batch_size=2))
+        assert [x[0] for x in batches] == [2, 2, 1]
+        assert batches[0][1] == b"m v=0i\nm v=1i"
+
+    def test_batch_bytes(self):
+        lines = [b"x" * 10, b"y" * 10, b"z" * 30]
+        batches = list(influxdb2.write.batches(lines, batch_bytes=22))
+        assert [x[0] for x in batches] == [2, 1]
+
+
+if __name__ == "__main__":
+    unittest.main()
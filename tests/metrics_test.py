@@ -0,0 +1,69 @@
+#!/usr/local/hoplite/bin/python3
+import http.server
+import threading
+import unittest
+import os
+import sys
+
+sys.path.insert(0, os.path.realpath(os.path.join("..", "lib")))
+import influxdb2
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = b'{"code": "not found", "message": "missing"}'
+        status = 404 if self.path.endswith("missing") else 200
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestMetrics(unittest.TestCase):
+    def setUp(self):
+        self.server = http.server.ThreadingHTTPServer(
+            ("127.0.0.1", 0), Handler
+        )
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = "http://127.0.0.1:%d" % self.server.server_port
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_stats(self):
+        db = influxdb2.connect(self.url, "token", metrics=True)
+        db.get("/api/v2/orgs/0123456789abcdef")
+        db.get("/api/v2/orgs/abcdef0123456789")
+        db.get("/api/v2/missing")
+
+        stats = db.stats()
+        orgs = stats["GET /api/v2/orgs/{id}"]
+        assert orgs["requests"] == 2
+        assert orgs["statuses"] == {200: 2}
+        assert orgs["bytes_received"] == 86
+        assert orgs["latency"]["sum"] > 0
+        assert stats["GET /api/v2/missing"]["statuses"] == {404: 1}
+
+        text = influxdb2.metrics.to_prometheus(stats)
+        assert (
+            'influxdb2_client_request_duration_seconds_bucket{method="GET",'
+            'endpoint="/api/v2/orgs/{id}",le="+Inf"} 2\n'
+        ) in text
+        assert (
+            'influxdb2_client_responses_total{method="GET",'
+            'endpoint="/api/v2/missing",status="404"} 1\n'
+        ) in text
+
+        # Off by default
+        db = influxdb2.connect(self.url, "token")
+        db.get("/api/v2/orgs/0123456789abcdef")
+        assert db.stats() == {}
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -103,6 +103,84 @@ class TestOrgs(unittest.TestCase):
         assert org.active == True
         assert len(org.links) == 0
 
+    def test_lazy_fields(self):
+        org = influxdb2.obj.org.Org()
+        data = {
+            "links": {"self": "/api/v2/orgs/1"},
+            "id": "abcdef0123456789",
+            "name": "example.com",
+            "createdAt": "2019-13-24T14:15:22Z",
+            "updatedAt": "2019-08-24T14:15:22Z",
+        }
+        org.from_dict(data)
+
+        assert org.description is None
+        assert org.updated == 1566656122.0
+        # Well formed but out of range values fail when first read
+        with self.assertRaises(ValueError):
+            org.created
+
+        links = org.links
+        data["links"]["self"] = "changed"
+        assert links["self"] == "/api/v2/orgs/1"
+        assert not hasattr(org, "__dict__")
+
+        # Malformed values are rejected up front
+        for bad in ("not a timestamp", "", "2019-08-24T14:15:22Zjunk"):
+            with self.assertRaises(ValueError):
+                org.from_dict(dict(data, createdAt=bad))
+            with self.assertRaises(ValueError):
+                influxdb2.obj.org.Org.from_dicts([dict(data, createdAt=bad)])
+        with self.assertRaises(ValueError):
+            org.created = "yesterday"
+        org.created = "2019-08-24 14:15:22.5+00:00"
+        assert org.created == 1566656122.5
+
+    def test_from_dicts(self):
+        import json
+
+        data = json.loads(VALID_JSON)
+        orgs = influxdb2.obj.org.Org.from_dicts([data, dict(data, name="x")])
+        assert [org.name for org in orgs] == ["example.com", "x"]
+        assert orgs[0].id == "abcdef0123456789"
+        assert orgs[0].updated == 1566656122.4485
+        assert orgs[1].links["self"] == "/api/v2/orgs/1"
+
+        with self.assertRaises(ValueError):
+            influxdb2.obj.org.Org.from_dicts([data, dict(data, id="xyz")])
+        with self.assertRaises(ValueError):
+            influxdb2.obj.org.Org.from_dicts([dict(data, updatedAt="")])
+        with self.assertRaises(ValueError):
+            influxdb2.obj.org.Org.from_dicts(data)
+
+    def test_from_dicts_unvalidated(self):
+        import json
+
+        data = json.loads(VALID_JSON)
+        orgs = influxdb2.obj.org.Org.from_dicts(
+            [dict(data, id="xyz")], validate=False
+        )
+        assert orgs[0].id == "xyz"
+
+        with self.assertRaises(ValueError):
+            del data["name"]
+            influxdb2.obj.org.Org.from_dicts([data], validate=False)
+
+    def test_validation_level(self):
+        db = influxdb2.connect("http://localhost:8086", "token")
+        assert db.validation is influxdb2.types.Validation.STRICT
+        with self.assertRaises(ValueError):
+            db.orgs.get("xyz")
+
+        db = influxdb2.connect(
+            "http://localhost:8086", "token", validation="public-only"
+        )
+        with self.assertRaises(ValueError):
+            db.orgs.get("xyz")
+
+        with self.assertRaises(ValueError):
+            influxdb2.connect("http://localhost:8086", "token", validation="x")
+
 
 if __name__ == "__main__":
     unittest.main()
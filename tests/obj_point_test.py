@@ -0,0 +1,57 @@
+#!/usr/local/hoplite/bin/python3
+import unittest
+import os
+import sys
+
+sys.path.insert(0, os.path.realpath(os.path.join("..", "lib")))
+import influxdb2
+from influxdb2.obj.point import Point
+
+
+class TestPoint(unittest.TestCase):
+    def test_matches_encode_point(self):
+        tags = {"tag=key": "a b,c", "empty": "", "a": "1"}
+        fields = {"field key": 'say "hi"', "i": 3, "f": 1.5, "n": None}
+        point = Point("my measurement,x", fields, tags, 1)
+        assert point.to_line() == influxdb2.lineproto.encode_point(
+            "my measurement,x", fields, tags, 1
+        ).encode("utf-8")
+        assert point.key == "my\\ measurement\\,x,a=1,tag\\=key=a\\ b\\,c"
+        assert influxdb2.lineproto.encode(point, "s") == point.to_line("s")
+
+    def test_series_key_cache(self):
+        tags = {"host": "web-1", "dc": "east"}
+        first = Point("cpu", {"v": 1}, tags)
+        second = Point("cpu", {"v": 2}, dict(tags))
+        assert first.key is second.key
+        assert second.to_line() == b"cpu,dc=east,host=web-1 v=2i"
+
+        second.tags = {"host": "web-2"}
+        assert second.to_line() == b"cpu,host=web-2 v=2i"
+        second.measurement = "mem"
+        assert second.to_line() == b"mem,host=web-2 v=2i"
+
+        # Unhashable tag values are formatted first
+        assert influxdb2.obj.point.series_key("m", {"t": ["x"]}) == (
+            "m,t=['x']"
+        )
+
+        # Equal values of different types do not share a cached key
+        for value, text in ((1, "1"), (True, "True"), (1.0, "1.0")):
+            assert influxdb2.obj.point.series_key("m", {"x": value}) == (
+                "m,x=" + text
+            )
+        assert influxdb2.obj.point.series_key("m", {1: "v"}) == "m,1=v"
+        assert influxdb2.obj.point.series_key("m", {True: "v"}) == "m,True=v"
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            Point("", {"v": 1}).to_line()
+        with self.assertRaises(ValueError):
+            Point("m", {"v": None}).to_line()
+        with self.assertRaises(AttributeError):
+            Point("m", {"v": 1}).extra = 1
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,148 @@
+#!/usr/local/hoplite/bin/python3
+import json
+import unittest
+import unittest.mock
+import os
+import sys
+
+sys.path.insert(0, os.path.realpath(os.path.join("..", "lib")))
+import influxdb2
+
+
+def org_dict(name, org_id):
+    return {
+        "links": {"self": "/api/v2/orgs/%s" % org_id},
+        "id": org_id,
+        "name": name,
+        "createdAt": "2019-08-24T14:15:22Z",
+        "updatedAt": "2019-08-24T14:15:22Z",
+    }
+
+
+def response(status, body):
+    rsp = unittest.mock.Mock()
+    rsp.status_code = status
+    rsp.content = json.dumps(body).encode("utf-8")
+    rsp.text = rsp.content.decode("utf-8")
+    return rsp
+
+
+class TestBulk(unittest.TestCase):
+    def test_create_many(self):
+        db = influxdb2.connect("http://localhost:8086", "token")
+
+        def post(path, json=None):
+            if json["name"] == "bad":
+                return response(
+                    422, {"code": "conflict", "message": "exists"}
+                )
+            return response(201, org_dict(json["name"], "%016x" % len(path)))
+
+        with unittest.mock.patch.object(db, "post", side_effect=post):
+            results = db.orgs.create_many(
+                ["a", ("b", "second"), "bad", 7], concurrency=2
+            )
+
+        assert [org.name for org in results[:2]] == ["a", "b"]
+        assert isinstance(results[2], influxdb2.exceptions.InfluxError)
+        assert isinstance(results[3], ValueError)
+
+    def test_update_many(self):
+        db = influxdb2.connect("http://localhost:8086", "token")
+
+        def patch(path, json=None):
+            return response(200, org_dict(json["name"], path[-16:]))
+
+        with unittest.mock.patch.object(db, "patch", side_effect=patch):
+            results = db.orgs.update_many(
+                [
+                    ("0123456789abcdef", "a", "d"),
+                    ("abcdef0123456789", "b", "d", "extra"),
+                ]
+            )
+
+        # A failure outside the client does not lose the other results
+        assert results[0].name == "a"
+        assert isinstance(results[1], TypeError)
+
+    def test_delete_many(self):
+        db = influxdb2.connect("http://localhost:8086", "token")
+        with unittest.mock.patch.object(
+            db, "delete", return_value=response(204, {})
+        ) as delete:
+            results = db.orgs.delete_many(
+                ["0123456789abcdef", "xyz", "abcdef0123456789"]
+            )
+
+        assert results[0] is None and results[2] is None
+        assert isinstance(results[1], ValueError)
+        assert delete.call_count == 2
+        assert db.orgs.delete_many([]) == []
+
+    def test_secrets(self):
+        db = influxdb2.connect("http://localhost:8086", "token")
+        ok = response(204, {})
+        with unittest.mock.patch.object(db, "patch", return_value=ok) as patch:
+            results = db.orgs.set_secrets_many(
+                ["0123456789abcdef", "abcdef0123456789", "xyz"],
+                {"a": "1", "b": "2"},
+            )
+            assert patch.call_count == 2
+            assert patch.call_args[0][0].endswith("/secrets")
+            assert patch.call_args[1]["json"] == {"a": "1", "b": "2"}
+        assert results[:2] == [None, None]
+        assert isinstance(results[2], ValueError)
+
+        with unittest.mock.patch.object(db, "post", return_value=ok) as post:
+            db.orgs.delete_secrets(
+                "0123456789abcdef", ["a", influxdb2.obj.common.Secret("b")]
+            )
+            assert post.call_args[0][0] == (
+                "/api/v2/orgs/0123456789abcdef/secrets/delete"
+            )
+            assert post.call_args[1]["json"] == {"secrets": ["a", "b"]}
+
+        with self.assertRaises(ValueError):
+            db.orgs.set_secrets("0123456789abcdef", {"a": 1})
+
+
+class TestCache(unittest.TestCase):
+    def test_cached_copies(self):
+        db = influxdb2.connect("http://localhost:8086", "token", cache_ttl=60)
+        body = org_dict("a", "0123456789abcdef")
+        with unittest.mock.patch.object(
+            db, "get", return_value=response(200, body)
+        ) as get:
+            first = db.orgs.get("0123456789abcdef")
+            first.name = "changed"
+            first.links["extra"] = "x"
+
+            again = db.orgs.get("0123456789abcdef")
+            assert get.call_count == 1
+            assert again is not first
+            assert again.name == "a"
+            assert "extra" not in again.links
+            assert db.orgs.list(org="a")[0].id == "0123456789abcdef"
+            assert db.orgs.resolve("a") == "0123456789abcdef"
+            assert get.call_count == 1
+
+        # The ID entry expires first, then the org comes back renamed
+        db.orgs._by_id.pop("0123456789abcdef")
+        renamed = org_dict("b", "0123456789abcdef")
+        with unittest.mock.patch.object(
+            db, "get", return_value=response(200, renamed)
+        ) as get:
+            assert db.orgs.get("0123456789abcdef").name == "b"
+            assert db.orgs.list(org="b")[0].name == "b"
+            assert get.call_count == 1
+
+        # The stale name entry is not trusted
+        with unittest.mock.patch.object(
+            db, "get", return_value=response(200, {"orgs": []})
+        ) as get:
+            assert db.orgs.list(org="a") == []
+            assert get.call_count == 1
+
+
+if __name__ == "__main__":
+    unittest.main()
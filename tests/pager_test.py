@@ -0,0 +1,82 @@
+#!/usr/local/hoplite/bin/python3
+import threading
+import unittest
+import os
+import sys
+
+sys.path.insert(0, os.path.realpath(os.path.join("..", "lib")))
+import influxdb2
+
+
+class Listing:
+    """Fake list endpoint over ``total`` numbered items."""
+
+    def __init__(self, total):
+        self.total = total
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def __call__(self, offset, limit):
+        with self.lock:
+            self.calls.append(offset)
+        return list(range(self.total))[offset : offset + limit]
+
+
+class TestPaginator(unittest.TestCase):
+    def test_all_items(self):
+        for prefetch in (0, 1, 3):
+            for total in (0, 5, 10, 25):
+                fetch = Listing(total)
+                pages = influxdb2.pager.Paginator(fetch, 10, prefetch)
+                assert list(pages) == list(range(total)), (prefetch, total)
+
+    def test_empty_page_stops(self):
+        fetch = Listing(25)
+        assert len(list(influxdb2.pager.Paginator(fetch, 10, 0))) == 25
+        assert fetch.calls == [0, 10, 20, 25]
+
+        fetch = Listing(25)
+        assert len(list(influxdb2.pager.Paginator(fetch, 10, 2))) == 25
+        assert sorted(fetch.calls)[:3] == [0, 10, 20]
+        assert 25 in fetch.calls
+
+    def test_capped_pages(self):
+        class Capped(Listing):
+            def __call__(self, offset, limit):
+                return super().__call__(offset, min(limit, 7))
+
+        for prefetch in (0, 1, 3):
+            fetch = Capped(50)
+            pages = influxdb2.pager.Paginator(fetch, 10, prefetch)
+            assert list(pages) == list(range(50)), prefetch
+
+    def test_close_early(self):
+        fetch = Listing(1000)
+        pages = iter(influxdb2.pager.Paginator(fetch, 10, 2))
+        assert [next(pages) for _ in range(15)] == list(range(15))
+        pages.close()
+        # Only the pages consumed plus the prefetch window were requested
+        assert len(fetch.calls) <= 2 + 3
+        with self.assertRaises(StopIteration):
+            next(pages)
+
+    def test_errors(self):
+        def fail(offset, limit):
+            if offset:
+                raise influxdb2.exceptions.NetworkError("down")
+            return list(range(limit))
+
+        for prefetch in (0, 2):
+            pages = iter(influxdb2.pager.Paginator(fail, 10, prefetch))
+            assert [next(pages) for _ in range(10)] == list(range(10))
+            with self.assertRaises(influxdb2.exceptions.NetworkError):
+                next(pages)
+
+        with self.assertRaises(ValueError):
+            influxdb2.pager.Paginator(fail, 0)
+        with self.assertRaises(ValueError):
+            influxdb2.pager.Paginator(fail, 10, -1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+#!/usr/local/hoplite/bin/python3
+import unittest
+import os
+import sys
+
+sys.path.insert(0, os.path.realpath(os.path.join("..", "lib")))
+import influxdb2
+
+RESULT_CSV = (
+    "#datatype,string,long,dateTime:RFC3339,double,string,string\r\n"
+    "#group,false,false,false,false,true,true\r\n"
+    "#default,_result,,,,,\r\n"
+    ",result,table,_time,_value,_field,host\r\n"
+    ",,0,2019-08-24T14:15:22Z,1.5,usage,\"a,b\"\r\n"
+    ",,0,2019-08-24T14:15:23Z,,usage,\"a,b\"\r\n"
+    "\r\n"
+    "#datatype,string,long,dateTime:RFC3339,long,string\r\n"
+    "#group,false,false,false,false,true\r\n"
+    "#default,_result,,,,\r\n"
+    ",result,table,_time,_value,_field\r\n"
+    ",,1,2019-08-24T14:15:22.5Z,7,count\r\n"
+    "\r\n"
+)
+
+ERROR_CSV = (
+    "#datatype,string,string\r\n"
+    "#group,true,true\r\n"
+    "#default,,\r\n"
+    ",error,reference\r\n"
+    ",failed to execute query,897\r\n"
+)
+
+
+def chunked(text, size):
+    return [text[x : x + size] for x in range(0, len(text), size)]
+
+
+class TestAnnotatedCSV(unittest.TestCase):
+    def test_records(self):
+        records = list(
+            influxdb2.query.iter_records(
+                influxdb2.query.iter_lines(chunked(RESULT_CSV, 7))
+            )
+        )
+
+        assert len(records) == 3
+        assert records[0] == {
+            "result": "_result",
+            "table": 0,
+            "_time": 1566656122.0,
+            "_value": 1.5,
+            "_field": "usage",
+            "host": "a,b",
+        }
+        assert records[1]["_value"] is None
+        assert records[2]["table"] == 1
+        assert records[2]["_value"] == 7
+        assert records[2]["_time"] == 1566656122.5
+
+    def test_chunk_boundaries(self):
+        expected = list(
+            influxdb2.query.iter_records(
+                influxdb2.query.iter_lines([RESULT_CSV])
+            )
+        )
+        for size in (1, 2, 3, 64):
+            lines = influxdb2.query.iter_lines(chunked(RESULT_CSV, size))
+            assert list(influxdb2.query.iter_records(lines)) == expected
+
+    def test_error(self):
+        with self.assertRaises(influxdb2.exceptions.QueryError) as ctx:
+            list(
+                influxdb2.query.iter_records(
+                    influxdb2.query.iter_lines([ERROR_CSV])
+                )
+            )
+        assert ctx.exception.message == "failed to execute query"
+        assert ctx.exception.reference == "897"
+
+    def test_tables(self):
+        try:
+            import numpy
+        except ImportError:
+            self.skipTest("numpy is not installed")
+
+        old = influxdb2.query.INITIAL_CAPACITY
+        influxdb2.query.INITIAL_CAPACITY = 1
+        try:
+            tables = list(
+                influxdb2.query.iter_tables(
+                    influxdb2.query.iter_lines(chunked(RESULT_CSV, 5))
+                )
+            )
+        finally:
+            influxdb2.query.INITIAL_CAPACITY = old
+
+        assert len(tables) == 2
+        first, second = tables
+        assert (first.result, first.table, len(first)) == ("_result", 0, 2)
+        assert first.groups == ["_field", "host"]
+        assert first["_time"].dtype == numpy.dtype("datetime64[ns]")
+        assert first["_time"][0] == numpy.datetime64("2019-08-24T14:15:22")
+        assert first["_value"][0] == 1.5
+        assert numpy.isnan(first["_value"][1])
+        assert first["host"][0] is first["host"][1]
+        assert second["_value"].dtype == numpy.dtype("int64")
+        assert list(second["_value"]) == [7]
+
+
+if __name__ == "__main__":
+    unittest.main()
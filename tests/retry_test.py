@@ -0,0 +1,136 @@
+#!/usr/local/hoplite/bin/python3
+import email.utils
+import time
+import unittest
+import unittest.mock
+import os
+import sys
+
+import requests
+
+sys.path.insert(0, os.path.realpath(os.path.join("..", "lib")))
+import influxdb2
+
+
+def response(status, headers=None):
+    rsp = requests.Response()
+    rsp.status_code = status
+    rsp.headers.update(headers or {})
+    rsp._content = b""
+    rsp._content_consumed = True
+    rsp.request = requests.Request("GET", "http://localhost").prepare()
+    return rsp
+
+
+class TestRetryPolicy(unittest.TestCase):
+    def test_delay_bounds(self):
+        policy = influxdb2.retry.RetryPolicy(backoff=0.5, max_backoff=3.0)
+        for attempt, ceiling in ((0, 0.5), (1, 1.0), (2, 2.0), (5, 3.0)):
+            delays = [policy.delay(attempt) for _ in range(200)]
+            assert min(delays) >= 0
+            assert max(delays) <= ceiling
+
+        # Retry-After is honored and spread over half a backoff step
+        delays = [policy.delay(1, 10.0) for _ in range(200)]
+        assert min(delays) >= 10.0
+        assert max(delays) <= 10.5
+
+    def test_parse_retry_after(self):
+        parse = influxdb2.retry.parse_retry_after
+        assert parse(None) is None
+        assert parse("") is None
+        assert parse("garbage") is None
+        assert parse("7") == 7.0
+        assert parse("-3") == 0.0
+
+        later = email.utils.formatdate(time.time() + 30, usegmt=True)
+        assert 25 <= parse(later) <= 30
+        earlier = email.utils.formatdate(time.time() - 30, usegmt=True)
+        assert parse(earlier) == 0.0
+
+    def test_allows(self):
+        policy = influxdb2.retry.RetryPolicy(
+            retries=2, max_backoff=5.0, deadline=10.0
+        )
+        now = time.monotonic()
+        assert policy.allows(0, now, 1.0)
+        assert policy.allows(1, now, 1.0)
+        assert not policy.allows(2, now, 1.0)
+        # A Retry-After over max_backoff stops retrying
+        assert not policy.allows(0, now, 6.0)
+        # No retry is started past the deadline
+        assert policy.allows(0, now - 8.0, 1.0)
+        assert not policy.allows(0, now - 9.5, 1.0)
+
+        with self.assertRaises(ValueError):
+            influxdb2.retry.RetryPolicy(retries=-1)
+
+
+class TestRetryRequests(unittest.TestCase):
+    def setUp(self):
+        self.db = influxdb2.connect(
+            "http://localhost:8086",
+            "token",
+            retry=influxdb2.retry.RetryPolicy(3, backoff=0.001),
+        )
+
+    def tearDown(self):
+        self.db.close()
+
+    def replies(self, *replies):
+        return unittest.mock.patch.object(
+            self.db._http, "request", side_effect=list(replies)
+        )
+
+    def test_retry_status(self):
+        with self.replies(
+            response(503), response(429, {"Retry-After": "0"}), response(200)
+        ) as request:
+            assert self.db.get("/api/v2/orgs").status_code == 200
+            assert request.call_count == 3
+
+        with self.replies(*[response(503)] * 4) as request:
+            assert self.db.get("/api/v2/orgs").status_code == 503
+            assert request.call_count == 4
+
+    def test_retry_network_error(self):
+        with self.replies(
+            requests.ConnectionError("refused"), response(200)
+        ) as request:
+            assert self.db.get("/api/v2/orgs").status_code == 200
+            assert request.call_count == 2
+
+    def test_deadline(self):
+        self.db._retry = influxdb2.retry.RetryPolicy(
+            10, backoff=0.001, deadline=0.0
+        )
+        with self.replies(response(503), response(200)) as request:
+            assert self.db.get("/api/v2/orgs").status_code == 503
+            assert request.call_count == 1
+
+    def test_post_not_retried(self):
+        with self.replies(response(503), response(204)) as request:
+            assert self.db.post("/api/v2/orgs", json={}).status_code == 503
+            assert request.call_count == 1
+
+        # Unless the caller marks it idempotent
+        with self.replies(response(503), response(204)) as request:
+            assert (
+                self.db.post(
+                    "/api/v2/write", data=b"m v=1i", idempotent=True
+                ).status_code
+                == 204
+            )
+            assert request.call_count == 2
+
+        # Streamed bodies can not be replayed
+        with self.replies(response(503), response(204)) as request:
+            rsp = self.db.post(
+                "/api/v2/write", data=iter([b"m v=1i"]), idempotent=True
+            )
+            assert rsp.status_code == 503
+            assert request.call_count == 1
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,140 @@
+#!/usr/local/hoplite/bin/python3
+import http.server
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+
+sys.path.insert(0, os.path.realpath(os.path.join("..", "lib")))
+import influxdb2
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    def _reply(self, status, body=b""):
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.server.down:
+            self._reply(503)
+        else:
+            self._reply(200, b'{"name": "influxdb", "status": "pass"}')
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        if self.server.down:
+            self._reply(503)
+        else:
+            self.server.written.append(body)
+            self._reply(204)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestSpool(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.server = http.server.ThreadingHTTPServer(
+            ("127.0.0.1", 0), Handler
+        )
+        self.server.down = False
+        self.server.written = []
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = "http://127.0.0.1:%d" % self.server.server_port
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.tmp.cleanup()
+
+    def test_segments(self):
+        spool = influxdb2.spool.Spool(self.tmp.name, segment_bytes=64)
+        params = {"bucket": "b", "org": "o", "precision": "ns"}
+        for idx in range(5):
+            spool.append(params, b"cpu value=%d" % idx)
+        segments = spool.segments()
+        assert len(segments) == 3
+        assert spool.pending == sum(map(os.path.getsize, segments))
+
+        # A torn write at the end of a segment is skipped
+        with open(segments[-1], "ab") as handle:
+            handle.write(b"\x00\x00")
+        records = [
+            (params, body)
+            for path in segments
+            for _, params, body in spool.read(path)
+        ]
+        assert [body for _, body in records] == [
+            b"cpu value=%d" % idx for idx in range(5)
+        ]
+        assert records[0][0] == params
+
+        # Segments left behind are picked up again
+        spool.close()
+        again = influxdb2.spool.Spool(self.tmp.name)
+        assert again.segments() == segments
+        for path in segments:
+            again.remove(path)
+        assert again.pending == 0
+        assert os.listdir(self.tmp.name) == []
+
+    def test_max_bytes(self):
+        spool = influxdb2.spool.Spool(
+            self.tmp.name, max_bytes=100, segment_bytes=40
+        )
+        for idx in range(10):
+            spool.append({"bucket": "b"}, b"cpu value=%d" % idx)
+        assert spool.pending <= 100
+        assert spool.dropped > 0
+        bodies = [
+            body
+            for path in spool.segments()
+            for _, _, body in spool.read(path)
+        ]
+        assert bodies[-1] == b"cpu value=9"
+
+        strict = influxdb2.spool.Spool(
+            os.path.join(self.tmp.name, "strict"),
+            max_bytes=60,
+            drop_oldest=False,
+        )
+        strict.append({"bucket": "b"}, b"cpu value=1")
+        with self.assertRaises(influxdb2.exceptions.QueueFull):
+            strict.append({"bucket": "b"}, b"cpu value=2")
+
+    def test_replay(self):
+        spool = influxdb2.spool.Spool(self.tmp.name, retry_interval=0.05)
+        db = influxdb2.connect(self.url, "token", org="o", spool=spool)
+        self.server.down = True
+        assert not db.health()
+
+        db.write.points("b", ["cpu value=1", "cpu value=2"], batch_size=1)
+        assert spool.pending > 0
+        # Later batches queue up behind the spooled ones
+        db.write.points("b", ["cpu value=3"])
+        assert self.server.written == []
+        self.server.down = False
+
+        deadline = time.monotonic() + 5
+        while spool.pending and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert self.server.written == [
+            b"cpu value=1",
+            b"cpu value=2",
+            b"cpu value=3",
+        ]
+        assert os.listdir(self.tmp.name) == []
+
+        # With the spool drained writes go straight to the server
+        db.write.points("b", ["cpu value=4"])
+        assert self.server.written[-1] == b"cpu value=4"
+        db.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+#!/usr/local/hoplite/bin/python3
+import unittest
+import unittest.mock
+import os
+import sys
+
+sys.path.insert(0, os.path.realpath(os.path.join("..", "lib")))
+import influxdb2
+import influxdb2.loadtest
+import influxdb2.stub
+
+
+class TestStub(unittest.TestCase):
+    def test_orgs(self):
+        with influxdb2.stub.StubServer(orgs=150, max_page_size=50) as server:
+            db = influxdb2.connect(server.url, server.token)
+            # Pages capped by the server do not end the iteration
+            assert len(list(db.orgs.iterate())) == 150
+            assert len(list(db.orgs.iterate(prefetch=0))) == 150
+            assert len(db.orgs.list(limit=100, offset=120)) == 30
+
+            org = db.orgs.create("new", "New org")
+            assert db.orgs.get(org.id).description == "New org"
+            assert db.orgs.resolve("new") == org.id
+
+            db.orgs.set_secrets(org.id, {"a": "1", "b": "2"})
+            db.orgs.delete_secrets(org.id, ["a"])
+            assert [str(key) for key in db.orgs.secrets(org.id)] == ["b"]
+
+            db.orgs.delete(org.id)
+            with self.assertRaises(influxdb2.exceptions.InfluxAPIError):
+                db.orgs.get(org.id)
+
+            with self.assertRaises(influxdb2.exceptions.AuthenticationDenied):
+                influxdb2.connect(server.url, "wrong").orgs.list()
+
+    def test_retry_and_load(self):
+        with influxdb2.stub.StubServer(orgs=10) as server:
+            db = influxdb2.connect(
+                server.url,
+                server.token,
+                retry=influxdb2.retry.RetryPolicy(backoff=0.001),
+                metrics=True,
+            )
+            server.fail_next(2)
+            assert len(db.orgs.list()) == 10
+            assert db.stats()["GET /api/v2/orgs"]["retries"] == 2
+
+            report = influxdb2.loadtest.run(
+                db, "get", workers=4, operations=40
+            )
+            assert report.operations == 40
+            assert report.errors == 0
+            assert 0 < report.p50 <= report.p99
+            assert server.requests == 3 + 1 + 40
+
+            # Failures outside the client are counted too
+            def broken():
+                raise KeyError("bug")
+
+            with unittest.mock.patch.object(
+                influxdb2.loadtest, "_operation", return_value=broken
+            ):
+                report = influxdb2.loadtest.run(db, workers=2, operations=4)
+            assert report.operations == 0
+            assert report.errors == 4
+
+
+if __name__ == "__main__":
+    unittest.main()
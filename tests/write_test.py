@@ -0,0 +1,109 @@
+#!/usr/local/hoplite/bin/python3
+import threading
+import unittest
+import os
+import sys
+
+sys.path.insert(0, os.path.realpath(os.path.join("..", "lib")))
+import influxdb2
+
+
+class TestWriteBatcher(unittest.TestCase):
+    def setUp(self):
+        self.db = influxdb2.connect("http://localhost:8086", "token", org="o")
+        self.sent = []
+        self.sending = threading.Event()
+        self.gate = threading.Event()
+        self.gate.set()
+
+        def send(params, body):
+            self.sending.set()
+            self.gate.wait(5)
+            self.sent.append(body)
+
+        self.db.write.send = send
+
+    def tearDown(self):
+        self.gate.set()
+        self.db.close()
+
+    def blocked(self, **kwargs):
+        """Batcher whose thread is stuck sending the first point."""
+        self.gate.clear()
+        batcher = self.db.batcher(
+            "b", batch_size=1, flush_interval=0, **kwargs
+        )
+        batcher.add("m v=0i")
+        assert self.sending.wait(5)
+        return batcher
+
+    def test_flush(self):
+        batcher = self.db.batcher("b", flush_interval=60)
+        batcher.extend(["m v=1i", "m v=2i"])
+        assert batcher.flush(5)
+        assert self.sent == [b"m v=1i\nm v=2i"]
+        assert batcher.pending == 0
+
+    def test_close_drains(self):
+        batcher = self.db.batcher("b", flush_interval=60)
+        batcher.add("m v=1i")
+        self.db.close()
+        assert self.sent == [b"m v=1i"]
+        with self.assertRaises(influxdb2.exceptions.InfluxError):
+            batcher.add("m v=2i")
+
+    def test_overflow_raise(self):
+        batcher = self.blocked(max_queue=1, overflow="raise")
+        batcher.add("m v=1i")
+        with self.assertRaises(influxdb2.exceptions.QueueFull):
+            batcher.add("m v=2i")
+        self.gate.set()
+        assert batcher.flush(5)
+        assert self.sent == [b"m v=0i", b"m v=1i"]
+
+    def test_overflow_drop_oldest(self):
+        batcher = self.blocked(max_queue=1, overflow="drop-oldest")
+        batcher.add("m v=1i")
+        batcher.add("m v=2i")
+        assert batcher.dropped == 1
+        self.gate.set()
+        assert batcher.flush(5)
+        assert self.sent == [b"m v=0i", b"m v=2i"]
+
+    def test_overflow_block(self):
+        batcher = self.blocked(max_queue=1)
+        batcher.add("m v=1i")
+        with self.assertRaises(influxdb2.exceptions.QueueFull):
+            batcher.add("m v=2i", timeout=0.05)
+        self.gate.set()
+        batcher.add("m v=2i", timeout=5)
+        assert batcher.flush(5)
+        assert self.sent == [b"m v=0i", b"m v=1i", b"m v=2i"]
+
+    def test_errors(self):
+        def fail(params, body):
+            if body == b"m v=1i":
+                raise influxdb2.exceptions.NetworkError("down")
+            self.sent.append(body)
+
+        def on_error(body, err):
+            raise RuntimeError("callback bug")
+
+        self.db.write.send = fail
+        batcher = self.db.batcher(
+            "b", batch_size=1, flush_interval=0, on_error=on_error
+        )
+        # Points that can not be encoded are dropped and counted
+        batcher.extend([{"measurement": "m"}, "m v=1i", "m v=2i"])
+        assert batcher.flush(5)
+        assert batcher.failed == 2
+        assert self.sent == [b"m v=2i"]
+
+        # The background thread survives the failing callback
+        batcher.add("m v=3i")
+        assert batcher.flush(5)
+        assert self.sent[-1] == b"m v=3i"
+
+
+if __name__ == "__main__":
+    unittest.main()